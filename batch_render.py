@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Headless batch renderer: render Excel project workbooks to SVG (and PNG) without the GUI.
+
+    python batch_render.py projects/ --output-dir charts --png --jobs 8 --report report.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from services.batch_renderer import find_workbooks, render_batch
+
+
+def _print_result(result: dict):
+    status = "OK  " if result["ok"] else "FAIL"
+    timings = (f"load {result['load_seconds']:.2f}s  render {result['render_seconds']:.2f}s  "
+               f"png {result['png_seconds']:.2f}s  total {result['total_seconds']:.2f}s")
+    detail = result["svg"] if result["ok"] else result["error"]
+    print(f"{status} {result['workbook']}  {timings}  {detail}", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render Compact Gantt Excel workbooks to SVG/PNG without the GUI.")
+    parser.add_argument("paths", nargs="+", help="Workbooks (.xlsx) or directories containing them")
+    parser.add_argument("-o", "--output-dir", default="svg", help="Folder for the rendered files (default: svg)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Also search subdirectories")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: number of CPUs; 1 renders in this process)")
+    parser.add_argument("--png", action="store_true", help="Also write a PNG next to each SVG")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="PNG pixels per chart pixel, e.g. 4 for print (default: 1)")
+    parser.add_argument("--opaque", action="store_true", help="Keep the white background in PNGs")
+    parser.add_argument("--qt-metrics", action="store_true",
+                        help="Measure text with Qt in every worker instead of the saved font metrics table")
+    parser.add_argument("--report", help="Write per-file results and timings to this JSON file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log progress from the renderer")
+    args = parser.parse_args(argv)
+    if args.scale <= 0:
+        parser.error("--scale must be positive")
+
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    try:
+        workbooks = find_workbooks(args.paths, recursive=args.recursive)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not workbooks:
+        print("No .xlsx workbooks found", file=sys.stderr)
+        return 2
+
+    results = render_batch(workbooks, args.output_dir, jobs=args.jobs, png=args.png,
+                           transparent=not args.opaque, log_level=log_level, on_result=_print_result,
+                           qt_metrics=args.qt_metrics, png_scale=args.scale)
+
+    failed = [result for result in results if not result["ok"]]
+    total = sum(result["total_seconds"] for result in results)
+    print(f"\nRendered {len(results) - len(failed)} of {len(results)} workbooks "
+          f"({total:.2f}s of render time)")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
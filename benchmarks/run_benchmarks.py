@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for chart rendering, project serialization, Excel I/O and link validation.
+
+Runs each benchmark on synthetic projects of several sizes and writes the timings as JSON.
+Runs on identical generated data, so results from two commits can be compared directly:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --output after.json --baseline before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path (go up one level from benchmarks folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Text measurement needs a Qt application, but no window is ever shown
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QGuiApplication
+
+from benchmarks.synthetic_project import generate_project
+from config.app_config import AppConfig
+from models.project import ProjectData
+from repositories.excel_repository import ExcelRepository
+from services.gantt_chart_service import GanttChartService
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+BENCHMARKS = ["generate_svg", "to_json", "from_json", "excel_save", "excel_load", "update_links"]
+
+
+def _time_runs(fn, repeat: int, max_seconds: float) -> list:
+    """Call fn up to repeat times and return the wall times; stop early once max_seconds is spent."""
+    runs = []
+    budget_start = time.perf_counter()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+        if time.perf_counter() - budget_start > max_seconds:
+            break
+    return runs
+
+
+def run_size(num_tasks: int, args, work_dir: str) -> list:
+    """Run the selected benchmarks on one synthetic project size."""
+    app_config = AppConfig()
+    app_config.general.chart.render_layer_cache = False  # Time full renders, not cache hits
+    app_config.general.chart.render_cache = False
+    app_config.general.chart.svg_in_memory = False  # Include the file write in the render time
+    project = generate_project(num_tasks, seed=args.seed, app_config=app_config)
+    project_json = project.to_json()
+    excel_path = os.path.join(work_dir, f"project_{num_tasks}.xlsx")
+    repository = ExcelRepository()
+    results = []
+
+    def record(name: str, fn, **extra):
+        if name not in args.benchmarks:
+            return
+        runs = _time_runs(fn, args.repeat, args.max_seconds)
+        result = {
+            "benchmark": name,
+            "tasks": num_tasks,
+            "runs": runs,
+            "min": min(runs),
+            "median": statistics.median(runs),
+            "mean": statistics.mean(runs),
+        }
+        result.update(extra)
+        results.append(result)
+        print(f"  {name:<14} {result['median']:10.4f}s median of {len(runs)}")
+
+    service = GanttChartService(app_config, output_folder=work_dir, output_filename=f"chart_{num_tasks}.svg")
+    record("generate_svg", lambda: service.generate_svg(project_json))
+    if results and results[-1]["benchmark"] == "generate_svg":
+        stats = service.last_render_stats or {}
+        results[-1]["elements"] = stats.get("elements")
+        results[-1]["phases"] = {name: phase["seconds"] for name, phase in stats.get("phases", {}).items()}
+        svg_path = os.path.join(work_dir, f"chart_{num_tasks}.svg")
+        results[-1]["svg_bytes"] = os.path.getsize(svg_path) if os.path.exists(svg_path) else None
+
+    record("to_json", project.to_json)
+    record("from_json", lambda: ProjectData.from_json(json.loads(json.dumps(project_json))))
+    record("excel_save", lambda: repository.save(excel_path, project))
+    if "excel_load" in args.benchmarks and not os.path.exists(excel_path):
+        repository.save(excel_path, project)
+    record("excel_load", lambda: repository.load(excel_path, ProjectData))
+    record("update_links", lambda: project.update_links(list(project.links)), links=len(project.links))
+    return results
+
+
+def compare(results: list, baseline_path: str):
+    """Print each benchmark's median time relative to a baseline results file."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["benchmark"], r["tasks"]): r for r in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path} (median, lower is better):")
+    for result in results:
+        before = baseline.get((result["benchmark"], result["tasks"]))
+        if not before:
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else float("inf")
+        print(f"  {result['benchmark']:<14} {result['tasks']:>7} tasks  "
+              f"{before['median']:10.4f}s -> {result['median']:10.4f}s  ({ratio:.2f}x)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run Compact Gantt benchmarks on synthetic projects.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Task counts to benchmark")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS,
+                        help="Benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark and size")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="Stop repeating a benchmark once it has used this much time")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic projects")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+    results = []
+    with tempfile.TemporaryDirectory(prefix="compactgantt-bench-") as work_dir:
+        for num_tasks in args.sizes:
+            print(f"{num_tasks} tasks:")
+            results.extend(run_size(num_tasks, args, work_dir))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "sizes": args.sizes,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
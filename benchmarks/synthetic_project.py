@@ -0,0 +1,128 @@
+# File: synthetic_project.py
+"""Seeded generator of synthetic ProjectData for benchmarks.
+
+The same arguments and seed always produce the same project, so timings from different
+commits are measured on identical data.
+"""
+
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path (go up one level from benchmarks folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models import Task, Link, Pipe, Curtain, Swimlane, Note
+from models.project import ProjectData
+
+FILL_COLORS = ["blue", "green", "orange", "purple", "red", "teal"]
+LABEL_CONTENTS = ["None", "Name only", "Date only", "Name and Date"]
+
+
+def generate_project(num_tasks: int, seed: int = 0, num_links: int = None, num_swimlanes: int = None,
+                     num_pipes: int = 5, num_curtains: int = 3, num_notes: int = 3,
+                     start_date: str = "2025-01-01", span_days: int = 730, max_duration_days: int = 60,
+                     milestone_ratio: float = 0.1, num_rows: int = None, app_config=None) -> ProjectData:
+    """Build a reproducible synthetic project.
+
+    Args:
+        num_tasks: Number of tasks
+        seed: Random seed
+        num_links: Number of links (default: half the number of tasks)
+        num_swimlanes: Number of swimlanes splitting the rows (default: up to 10)
+        num_pipes, num_curtains, num_notes: Number of each element
+        start_date: Chart start date (yyyy-mm-dd)
+        span_days: Chart length in days; task start dates are spread across it
+        max_duration_days: Longest task duration in days
+        milestone_ratio: Fraction of tasks that are milestones
+        num_rows: Number of chart rows (default: one per ten tasks, at least 10)
+        app_config: Optional AppConfig passed to ProjectData
+
+    Returns:
+        ProjectData with the generated elements
+    """
+    rnd = random.Random(seed)
+    if num_links is None:
+        num_links = num_tasks // 2
+    if num_rows is None:
+        num_rows = max(10, num_tasks // 10)
+    if num_swimlanes is None:
+        num_swimlanes = min(10, num_rows)
+    chart_start = date.fromisoformat(start_date)
+    chart_end = chart_start + timedelta(days=span_days)
+
+    project = ProjectData(app_config)
+    frame = project.frame_config
+    frame.chart_start_date = chart_start.isoformat()
+    frame.chart_end_date = chart_end.isoformat()
+    frame.num_rows = num_rows
+    frame.header_text = f"Synthetic project: {num_tasks} tasks (seed {seed})"
+    frame.footer_text = "Benchmark"
+    frame.show_row_numbers = True
+
+    starts = []
+    for task_id in range(1, num_tasks + 1):
+        task_start = chart_start + timedelta(days=rnd.randrange(span_days))
+        is_milestone = rnd.random() < milestone_ratio
+        task_finish = task_start if is_milestone else task_start + timedelta(days=rnd.randint(1, max_duration_days))
+        starts.append(task_start)
+        project.tasks.append(Task(
+            task_id=task_id,
+            task_name=f"Task {task_id}",
+            start_date=task_start.isoformat(),
+            finish_date=task_finish.isoformat(),
+            row_number=rnd.randint(1, num_rows),
+            is_milestone=is_milestone,
+            label_placement=rnd.choice(["Inside", "Outside"]),
+            label_content=rnd.choice(LABEL_CONTENTS),
+            fill_color=rnd.choice(FILL_COLORS)
+        ))
+
+    # Links point from the earlier task to the later one, so most of them are valid
+    for link_id in range(1, num_links + 1 if num_tasks > 1 else 1):
+        first, second = rnd.sample(range(num_tasks), 2)
+        if starts[second] < starts[first]:
+            first, second = second, first
+        project.links.append(Link(
+            link_id=link_id,
+            from_task_id=first + 1,
+            to_task_id=second + 1,
+            line_style=rnd.choice(["solid", "dashed", "dotted"]),
+            link_routing=rnd.choice(["auto", "HV", "VH"])
+        ))
+
+    if num_swimlanes:
+        rows_per_lane, extra_rows = divmod(num_rows, num_swimlanes)
+        for swimlane_id in range(1, num_swimlanes + 1):
+            row_count = rows_per_lane + (extra_rows if swimlane_id == num_swimlanes else 0)
+            project.swimlanes.append(Swimlane(
+                swimlane_id=swimlane_id,
+                row_count=row_count,
+                title=f"Lane {swimlane_id}",
+                background_color="#eef" if swimlane_id % 2 else ""
+            ))
+
+    for pipe_id in range(1, num_pipes + 1):
+        pipe_date = chart_start + timedelta(days=rnd.randrange(span_days))
+        project.pipes.append(Pipe(pipe_id=pipe_id, date=pipe_date.isoformat(), name=f"Pipe {pipe_id}"))
+
+    for curtain_id in range(1, num_curtains + 1):
+        curtain_start = chart_start + timedelta(days=rnd.randrange(span_days))
+        curtain_end = curtain_start + timedelta(days=rnd.randint(7, 60))
+        project.curtains.append(Curtain(curtain_id=curtain_id, start_date=curtain_start.isoformat(),
+                                        end_date=curtain_end.isoformat(), color="grey",
+                                        name=f"Curtain {curtain_id}"))
+
+    for note_id in range(1, num_notes + 1):
+        project.notes.append(Note(
+            note_id=note_id,
+            x=rnd.randint(50, 500),
+            y=rnd.randint(80, 400),
+            width=120,
+            height=50,
+            text=f"Note {note_id}: synthetic annotation text that wraps over more than one line"
+        ))
+
+    return project
@@ -347,14 +347,22 @@ class AppConfig:
     def get_table_config(self, key: str) -> TableConfig:
         return self.tables.get(key, None)
 
-    def _get_settings_file(self) -> str:
-        """Get path to settings file."""
+    def _get_config_dir(self) -> Path:
+        """Get the per-user settings folder, creating it if needed."""
         if os.name == 'nt':  # Windows
             config_dir = Path(os.getenv('APPDATA', '')) / 'compactgantt'
         else:  # Linux/Mac
             config_dir = Path.home() / '.config' / 'compactgantt'
         config_dir.mkdir(parents=True, exist_ok=True)
-        return str(config_dir / 'settings.json')
+        return config_dir
+
+    def _get_settings_file(self) -> str:
+        """Get path to settings file."""
+        return str(self._get_config_dir() / 'settings.json')
+
+    def get_font_metrics_file(self) -> str:
+        """Get path to the font metrics table used to measure text without Qt."""
+        return str(self._get_config_dir() / 'font_metrics.json')
 
     def _load_settings(self):
         """Load window settings from file if it exists."""
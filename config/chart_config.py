@@ -10,6 +10,28 @@ class ChartConfig:
     # SVG generation settings
     svg_output_folder: str = "svg"
     svg_output_filename: str = "gantt_chart.svg"
+    svg_in_memory: bool = True  # Pass SVG bytes straight to the display; write svg_output_folder in the background
+    svg_backend: str = "streaming"  # "streaming" writes elements as they are drawn; "svgwrite" builds the full element tree first
+    svg_compact: bool = False  # Streaming backend only: share repeated styles via <g>, <defs>/<use> for arrowheads and milestones
+    batch_gridlines: bool = True  # Merge gridlines and scale ticks into one <path> per stroke style
+    render_layer_cache: bool = True  # Reuse unchanged render layers, so an edit regenerates only the layers it affects
+    render_layer_cache_max_mb: float = 32.0  # Streaming backend: memory for cached layer markup; layers beyond it are redrawn each render
+    render_cache: bool = True  # Return the stored SVG when identical project data and settings are rendered again
+    render_cache_max_mb: float = 64.0  # Memory for cached SVG documents
+    render_cache_disk: bool = False  # Also keep cached SVGs in svg_output_folder/.render_cache across sessions
+    render_cache_disk_max_mb: float = 256.0
+    render_stats_log: str = ""  # Append per-phase render stats to this JSONL file (empty = off)
+    render_stats_memory: bool = False  # Record peak memory per render phase with tracemalloc (slows rendering)
+    text_metrics_provider: str = "auto"  # "qt", "table" (glyph advances saved from Qt; no Qt needed), or "auto" (qt when a Qt application exists)
+
+    # Level of detail for dense timelines (applies below lod_time_scale_threshold pixels per day)
+    lod_enabled: bool = False
+    lod_time_scale_threshold: float = 1.0
+    lod_merge_gap: float = 1.0  # Bars in a row closer than this (pixels) merge into one summary bar
+    lod_min_label_width: float = 30.0  # Room (pixels) a label needs, or it is dropped
+    lod_min_row_height: float = 1.0  # Rows shorter than this (pixels) are merged into shared summary bands
+    lod_min_gridline_spacing: float = 4.0  # Gridlines and scale ticks closer than this (pixels) are skipped
+    lod_summary_color: str = "grey"  # Fill of summary bars merging tasks of different colors
 
     # Scale proportions
     scale_proportion_years: float = 0.05
@@ -79,11 +101,20 @@ class ChartConfig:
                           "header_footer_vertical_alignment_factor", "swimlane_top_vertical_alignment_factor",
                           "swimlane_bottom_vertical_alignment_factor", "id_badge_vertical_alignment_factor",
                           "id_badge_text_vertical_alignment_factor",
-                          "frame_border_width_heavy", "frame_border_width_light"]:
+                          "frame_border_width_heavy", "frame_border_width_light",
+                          "lod_time_scale_threshold", "lod_merge_gap", "lod_min_label_width",
+                          "lod_min_row_height", "lod_min_gridline_spacing", "render_cache_max_mb", "render_cache_disk_max_mb",
+                          "render_layer_cache_max_mb"]:
             value = getattr(self, field_name)
             if not isinstance(value, float) or value < 0:
                 raise ValueError(f"{field_name} must be a non-negative float")
         
+        if self.svg_backend not in ("streaming", "svgwrite"):
+            raise ValueError("svg_backend must be 'streaming' or 'svgwrite'")
+
+        if self.text_metrics_provider not in ("auto", "qt", "table"):
+            raise ValueError("text_metrics_provider must be 'auto', 'qt' or 'table'")
+
         # Validate font_family is a non-empty string
         if not isinstance(self.font_family, str) or not self.font_family.strip():
             raise ValueError("font_family must be a non-empty string")
@@ -10,6 +10,8 @@ from PyQt5.QtNetwork import QLocalServer, QLocalSocket
 from ui.main_window import MainWindow
 from models.project import ProjectData
 from services.gantt_chart_service import GanttChartService
+from services.render_worker import RenderController
+from services.text_metrics import ensure_font_metrics_table
 from config.app_config import AppConfig
 from ui.svg_display import SvgDisplay
 from utils.logging_config import setup_logging
@@ -166,9 +168,16 @@ def main():
     icon_path = Path(__file__).parent / "assets" / "favicon.ico"
     app.setWindowIcon(QIcon(str(icon_path)))
     # app_config already created above for crash reporter
+    # Save Qt's glyph advances so renders without Qt (batch workers) measure text the same way
+    ensure_font_metrics_table(app_config.get_font_metrics_file(), app_config.general.chart)
     project_data = ProjectData(app_config)  # Pass the shared instance
     gantt_chart_service = GanttChartService(app_config)  # Pass the shared instance
+    # Render on a worker thread; bursts of updates coalesce into one render
+    render_controller = RenderController(gantt_chart_service)
+    app.aboutToQuit.connect(render_controller.shutdown)
     svg_display = SvgDisplay(app_config)
+    app.aboutToQuit.connect(svg_display.svg_canvas.shutdown)
+    app.aboutToQuit.connect(svg_display.minimap.shutdown)
     data_entry = MainWindow(project_data, svg_display, app_config)  # Pass project_data, svg_display, and app_config
 
     def handle_svg_path(svg_path):
@@ -177,8 +186,11 @@ def main():
         else:
             print("No SVG generated due to invalid data")
 
-    data_entry.data_updated.connect(gantt_chart_service.generate_svg)
-    gantt_chart_service.svg_generated.connect(handle_svg_path)
+    data_entry.data_updated.connect(render_controller.request_render)
+    render_controller.svg_generated.connect(handle_svg_path)
+    render_controller.svg_bytes_generated.connect(svg_display.load_svg_bytes)
+    render_controller.geometry_map_generated.connect(svg_display.set_geometry_map)
+    svg_display.task_selected.connect(data_entry.select_task)
     data_entry.show()
     
     # Clean up on exit
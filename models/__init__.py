@@ -1,5 +1,6 @@
 from .frame import FrameConfig
 from .task import Task
+from .task_store import TaskStore
 from .link import Link
 from .pipe import Pipe
 from .curtain import Curtain
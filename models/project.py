@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Set
-from models import FrameConfig, Task, Link, Pipe, Curtain, Swimlane, Note
+from models import FrameConfig, Task, TaskStore, Link, Pipe, Curtain, Swimlane, Note
 from validators import DataValidator
 from datetime import datetime
 import logging
@@ -37,7 +37,8 @@ class ProjectData:
             swimlane_top_vertical_alignment_factor=app_config.general.chart.swimlane_top_vertical_alignment_factor,
             swimlane_bottom_vertical_alignment_factor=app_config.general.chart.swimlane_bottom_vertical_alignment_factor
         )
-        self.tasks: List[Task] = []
+        # Indexed by task_id, row, swimlane and dates; see tasks
+        self._tasks = TaskStore(swimlane_rows=lambda: [swimlane.row_count for swimlane in self.swimlanes])
         self.links: List[Link] = []
         self.swimlanes: List[Swimlane] = []
         self.pipes: List[Pipe] = []
@@ -45,6 +46,20 @@ class ProjectData:
         self.notes: List[Note] = []
         self.validator = DataValidator()
 
+    @property
+    def tasks(self) -> TaskStore:
+        """The tasks, as a list that also looks them up by ID, chart row, swimlane and date.
+
+        Assigning a list replaces the tasks through TaskStore.update(), so only added, removed
+        or changed tasks are re-indexed, even when every Task object is new.
+        """
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks: List[Task]):
+        if tasks is not self._tasks:
+            self._tasks.update(tasks)
+
     def to_json(self) -> Dict[str, Any]:
         tasks_data = [task.to_dict() for task in self.tasks]
         
@@ -176,8 +191,8 @@ class ProjectData:
         try:
             # Calculate valid status for each link
             for link in links:
-                from_task = next((t for t in self.tasks if t.task_id == link.from_task_id), None)
-                to_task = next((t for t in self.tasks if t.task_id == link.to_task_id), None)
+                from_task = self.tasks.get(link.from_task_id)
+                to_task = self.tasks.get(link.to_task_id)
                 
                 if from_task and to_task:
                     from_finish_date = from_task.finish_date or from_task.start_date
@@ -195,11 +210,9 @@ class ProjectData:
                 else:
                     link.valid = "No"
             
-            # Populate task names
-            task_name_map = {task.task_id: task.task_name for task in self.tasks}
-            for link in links:
-                link.from_task_name = task_name_map.get(link.from_task_id, "")
-                link.to_task_name = task_name_map.get(link.to_task_id, "")
+                # Populate task names
+                link.from_task_name = from_task.task_name if from_task else ""
+                link.to_task_name = to_task.task_name if to_task else ""
             
             self.links = links
         except Exception as e:
@@ -231,8 +244,8 @@ class ProjectData:
                 if not row_errors:
                     used_ids.add(safe_int(task.task_id))
             
-            # Update tasks list
-            self.tasks = tasks
+            # Replace the tasks; tasks are matched by ID, row and dates, so only changed ones are re-indexed
+            self.tasks.update(tasks)
         except Exception as e:
             logging.error(f"Error in update_tasks: {e}", exc_info=True)
             errors.append(f"Internal error: {str(e)}")
@@ -247,20 +260,16 @@ class ProjectData:
                     t.label_hide, t.label_placement]
                    for t in self.tasks]
         elif key == "links":
-            # Create a mapping of task_id to task_name for quick lookup
-            task_name_map = {task.task_id: task.task_name for task in self.tasks}
-            
             result = []
             for link in self.links:
+                from_task = self.tasks.get(link.from_task_id)
+                to_task = self.tasks.get(link.to_task_id)
                 # Populate task names
-                link.from_task_name = task_name_map.get(link.from_task_id, "")
-                link.to_task_name = task_name_map.get(link.to_task_id, "")
+                link.from_task_name = from_task.task_name if from_task else ""
+                link.to_task_name = to_task.task_name if to_task else ""
                 
                 # Calculate valid status if not already set
                 if link.valid is None:
-                    from_task = next((t for t in self.tasks if t.task_id == link.from_task_id), None)
-                    to_task = next((t for t in self.tasks if t.task_id == link.to_task_id), None)
-                    
                     if from_task and to_task:
                         from_finish_date = from_task.finish_date or from_task.start_date
                         to_start_date = to_task.start_date or to_task.finish_date
@@ -0,0 +1,341 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableSequence, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from models.task import Task
+
+UNDATED = "~"  # Sorts missing dates after every yyyy-mm-dd date in the date index
+INSORT_LIMIT = 32  # Date index changes made one at a time; more are applied with a single sort
+
+
+class TaskIds(Set):
+    """Set-like view of the task IDs in a TaskStore, optionally leaving one ID out, without copying."""
+
+    def __init__(self, by_id: dict, exclude=None):
+        self._by_id = by_id
+        self._exclude = exclude
+
+    def __contains__(self, task_id) -> bool:
+        return task_id != self._exclude and task_id in self._by_id
+
+    def __iter__(self) -> Iterator[int]:
+        return (task_id for task_id in self._by_id if task_id != self._exclude)
+
+    def __len__(self) -> int:
+        return len(self._by_id) - (self._exclude in self._by_id)
+
+
+class TaskStore(MutableSequence):
+    """The project's tasks in list order, with secondary indexes for lookups without scanning.
+
+    Behaves as a list of Task objects. Indexes by task_id, row_number, swimlane and dates are
+    kept in step with every insertion, removal and replacement; update() replaces the whole
+    list and re-indexes only the tasks that were added, removed or changed, matching tasks by
+    ID, row and dates rather than identity. Tasks edited in place are picked up by the next
+    update() or refresh().
+
+    Swimlanes are identified by their order (1-based position in ProjectData.swimlanes, as
+    the tabs number them); tasks on rows outside every swimlane are under None. Lookups return
+    tasks in list order.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = (), swimlane_rows: Callable[[], Sequence[int]] = None):
+        """
+        Args:
+            swimlane_rows: Returns the row_count of each swimlane in order; checked before each
+                swimlane lookup, so swimlanes may be edited in place. Without it set_swimlanes() is used.
+        """
+        self._tasks: List[Task] = []
+        self._entries: Dict[int, list] = {}  # entry -> [task, keys it is indexed under, see _index_keys()]
+        self._entry_of: Dict[int, int] = {}  # id(task) -> entry
+        self._next_entry = 0
+        self._counts: Dict[int, int] = {}  # id(task) -> occurrences in the list (normally 1)
+        self._by_id: Dict[int, set] = {}  # task_id -> entries
+        self._by_row: Dict[int, set] = {}
+        self._by_swimlane: Dict[Optional[int], set] = {}
+        self._by_date: list = []  # Sorted (start date, finish date, entry)
+        self._positions: Optional[Dict[int, int]] = {}  # id(task) -> first list position, None when stale
+        self._lane_first_rows: List[int] = []
+        self._lane_last_rows: List[int] = []
+        self._swimlane_rows = swimlane_rows
+        self.extend(tasks)
+
+    # --- List behaviour ---
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __getitem__(self, index):
+        return self._tasks[index]
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks)
+
+    def __contains__(self, task) -> bool:
+        return id(task) in self._counts or task in self._tasks
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TaskStore):
+            return self._tasks == other._tasks
+        return isinstance(other, list) and self._tasks == other
+
+    def __repr__(self) -> str:
+        return f"TaskStore({self._tasks!r})"
+
+    def __setitem__(self, index, value):
+        removed = self._tasks[index] if isinstance(index, slice) else [self._tasks[index]]
+        added = list(value) if isinstance(index, slice) else [value]
+        self._tasks[index] = added if isinstance(index, slice) else value
+        self._positions = None
+        for task in removed:
+            self._release(task)
+        for task in added:
+            self._retain(task)
+
+    def __delitem__(self, index):
+        removed = self._tasks[index] if isinstance(index, slice) else [self._tasks[index]]
+        del self._tasks[index]
+        self._positions = None
+        for task in removed:
+            self._release(task)
+
+    def insert(self, index: int, task: Task):
+        self._tasks.insert(index, task)
+        self._positions = None
+        self._retain(task)
+
+    def append(self, task: Task):
+        if self._positions is not None and id(task) not in self._positions:
+            self._positions[id(task)] = len(self._tasks)
+        self._tasks.append(task)
+        self._retain(task)
+
+    def clear(self):
+        self.update([])
+
+    def sort(self, key=None, reverse: bool = False):
+        self._tasks.sort(key=key, reverse=reverse)
+        self._positions = None
+
+    # --- Index maintenance ---
+
+    def update(self, tasks: Iterable[Task]):
+        """Replace the tasks, re-indexing only tasks that were added, removed or changed.
+
+        A task no longer listed hands its index entry to a new task with the same ID, row and
+        dates, so replacing every Task object with an equal copy (as the tasks tab does on each
+        sync) costs one dict update per task instead of a full re-index.
+        """
+        tasks = list(tasks)
+        counts: Dict[int, int] = {}
+        for task in tasks:
+            counts[id(task)] = counts.get(id(task), 0) + 1
+        entries, entry_of = self._entries, self._entry_of
+        date_changes = ([], [])
+        # Copies usually keep their position, so try the task that was at the same position first
+        old_tasks, unmatched = self._tasks, []
+        for position, task in enumerate(tasks):
+            if id(task) in entry_of:
+                self._reindex(task, date_changes)
+                continue
+            old = old_tasks[position] if position < len(old_tasks) else None
+            if old is not None and id(old) not in counts and id(old) in entry_of:
+                entry = entry_of[id(old)]
+                task_id, row_number, _, (start, finish, _) = entries[entry][1]
+                if (task_id == task.task_id and row_number == task.row_number and
+                        start == (task.start_date or UNDATED) and finish == (task.finish_date or UNDATED)):
+                    del entry_of[id(old)]
+                    entries[entry][0] = task
+                    entry_of[id(task)] = entry
+                    continue
+            unmatched.append(task)
+        released: Dict[tuple, List[int]] = {}  # content -> entries of tasks no longer listed
+        for task_key in [task_key for task_key in entry_of if task_key not in counts]:
+            entry = entry_of.pop(task_key)
+            task_id, row_number, _, (start, finish, _) = entries[entry][1]
+            released.setdefault((task_id, row_number, start, finish), []).append(entry)
+        for task in unmatched:
+            if id(task) not in entry_of and released:
+                matches = released.get((task.task_id, task.row_number,
+                                        task.start_date or UNDATED, task.finish_date or UNDATED))
+                if matches:
+                    entry = matches.pop()
+                    entries[entry][0] = task
+                    entry_of[id(task)] = entry
+                    continue
+            self._reindex(task, date_changes)
+        for entries in released.values():
+            for entry in entries:
+                self._remove_entry(entry, date_changes)
+        self._tasks = tasks
+        self._counts = counts
+        self._positions = None
+        self._apply_date_changes(date_changes)
+
+    def refresh(self):
+        """Re-index tasks whose ID, row or dates were changed in place."""
+        date_changes = ([], [])
+        for task in self._tasks:
+            self._reindex(task, date_changes)
+        self._apply_date_changes(date_changes)
+
+    def set_swimlanes(self, row_counts: Sequence[int]):
+        """Set the rows each swimlane spans (in swimlane order) and regroup the swimlane index."""
+        first_rows, last_rows, first_row = [], [], 1
+        for row_count in row_counts:
+            first_rows.append(first_row)
+            last_rows.append(first_row + row_count - 1)
+            first_row += row_count
+        if first_rows == self._lane_first_rows and last_rows == self._lane_last_rows:
+            return
+        self._lane_first_rows, self._lane_last_rows = first_rows, last_rows
+        self._by_swimlane = {}
+        for row_number, bucket in self._by_row.items():
+            swimlane = self._swimlane_of_row(row_number)
+            self._by_swimlane.setdefault(swimlane, set()).update(bucket)
+        for item in self._entries.values():
+            task_id, row_number, _, date_key = item[1]
+            item[1] = (task_id, row_number, self._swimlane_of_row(row_number), date_key)
+
+    def _retain(self, task: Task):
+        self._counts[id(task)] = self._counts.get(id(task), 0) + 1
+        self._reindex(task)
+
+    def _release(self, task: Task):
+        remaining = self._counts.get(id(task), 0) - 1
+        if remaining > 0:
+            self._counts[id(task)] = remaining
+            return
+        self._counts.pop(id(task), None)
+        self._remove_entry(self._entry_of.pop(id(task)))
+
+    def _index_keys(self, task: Task, entry: Optional[int] = None) -> tuple:
+        """(task_id, row_number, swimlane, date key) of a task; the entry makes the date key unique."""
+        date_key = (task.start_date or UNDATED, task.finish_date or UNDATED, entry)
+        return task.task_id, task.row_number, self._swimlane_of_row(task.row_number), date_key
+
+    def _reindex(self, task: Task, date_changes: tuple = None):
+        """Index a task, or re-index it if its ID, row or dates changed.
+
+        With date_changes, (added, removed) lists, date index changes are collected for
+        _apply_date_changes() instead of being made one at a time.
+        """
+        entry = self._entry_of.get(id(task))
+        if entry is None:
+            entry = self._next_entry
+            self._next_entry += 1
+            self._entry_of[id(task)] = entry
+            self._entries[entry] = [task, None]
+        keys = self._index_keys(task, entry)
+        old = self._entries[entry][1]
+        if old == keys:
+            return
+        if old is not None:
+            self._unindex(entry, old, date_changes)
+        self._entries[entry][1] = keys
+        task_id, row_number, swimlane, date_key = keys
+        self._by_id.setdefault(task_id, set()).add(entry)
+        self._by_row.setdefault(row_number, set()).add(entry)
+        self._by_swimlane.setdefault(swimlane, set()).add(entry)
+        if date_changes is None:
+            insort(self._by_date, date_key)
+        else:
+            date_changes[0].append(date_key)
+
+    def _remove_entry(self, entry: int, date_changes: tuple = None):
+        self._unindex(entry, self._entries.pop(entry)[1], date_changes)
+
+    def _unindex(self, entry: int, keys: tuple, date_changes: tuple = None):
+        task_id, row_number, swimlane, date_key = keys
+        for index, key in ((self._by_id, task_id), (self._by_row, row_number), (self._by_swimlane, swimlane)):
+            bucket = index[key]
+            bucket.discard(entry)
+            if not bucket:
+                del index[key]
+        if date_changes is None:
+            del self._by_date[bisect_left(self._by_date, date_key)]
+        else:
+            date_changes[1].append(date_key)
+
+    def _apply_date_changes(self, date_changes: tuple):
+        """Apply date index changes collected by _reindex() and _unindex()."""
+        added, removed = date_changes
+        if len(added) + len(removed) <= INSORT_LIMIT:
+            for date_key in removed:
+                del self._by_date[bisect_left(self._by_date, date_key)]
+            for date_key in added:
+                insort(self._by_date, date_key)
+            return
+        # Many changes (loading a project, pasting rows): one sort beats shifting the list each time
+        if removed:
+            removed = set(removed)
+            self._by_date = [date_key for date_key in self._by_date if date_key not in removed]
+        self._by_date.extend(added)
+        self._by_date.sort()
+
+    def _swimlane_of_row(self, row_number) -> Optional[int]:
+        lane = bisect_right(self._lane_first_rows, row_number) - 1
+        if lane < 0 or row_number > self._lane_last_rows[lane]:
+            return None
+        return lane + 1
+
+    def _in_list_order(self, bucket: Optional[set]) -> List[Task]:
+        if not bucket:
+            return []
+        tasks = [self._entries[entry][0] for entry in bucket]
+        if len(tasks) == 1:
+            return tasks
+        if self._positions is None:
+            self._positions = {}
+            for position, task in enumerate(self._tasks):
+                self._positions.setdefault(id(task), position)
+        return sorted(tasks, key=lambda task: self._positions[id(task)])
+
+    # --- Lookups ---
+
+    def get(self, task_id) -> Optional[Task]:
+        """Return the first task with task_id, or None."""
+        bucket = self._by_id.get(task_id)
+        if not bucket:
+            return None
+        if len(bucket) == 1:
+            return self._entries[next(iter(bucket))][0]
+        return self._in_list_order(bucket)[0]
+
+    def with_id(self, task_id) -> List[Task]:
+        """All tasks with task_id (more than one only while IDs are being edited)."""
+        return self._in_list_order(self._by_id.get(task_id))
+
+    def task_ids(self, exclude=None) -> TaskIds:
+        """Set-like view of the task IDs in use, leaving out exclude."""
+        return TaskIds(self._by_id, exclude)
+
+    def in_row(self, row_number: int) -> List[Task]:
+        return self._in_list_order(self._by_row.get(row_number))
+
+    def rows(self) -> List[int]:
+        """Chart rows that have tasks, ascending."""
+        return sorted(self._by_row)
+
+    def in_swimlane(self, swimlane: Optional[int]) -> List[Task]:
+        """Tasks on the rows of a swimlane (by order), or outside every swimlane for None."""
+        self._sync_swimlanes()
+        return self._in_list_order(self._by_swimlane.get(swimlane))
+
+    def swimlane_of(self, task: Task) -> Optional[int]:
+        """Order of the swimlane containing a task's row, or None."""
+        self._sync_swimlanes()
+        return self._swimlane_of_row(task.row_number)
+
+    def _sync_swimlanes(self):
+        if self._swimlane_rows is not None:
+            self.set_swimlanes(self._swimlane_rows())
+
+    def by_date(self) -> List[Task]:
+        """All tasks sorted by start date, then finish date; tasks without dates come last."""
+        return [self._entries[entry][0] for _, _, entry in self._by_date]
+
+    def starting_between(self, first: str, last: str) -> List[Task]:
+        """Tasks starting on or between two internal (yyyy-mm-dd) dates, sorted by date."""
+        lo = bisect_left(self._by_date, (first,))
+        hi = bisect_left(self._by_date, (last + "\x00",))
+        return [self._entries[entry][0] for _, _, entry in self._by_date[lo:hi]]
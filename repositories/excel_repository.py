@@ -114,6 +114,16 @@ class ExcelRepository:
         
         return project
     
+    def load_typography(self, file_path: str) -> Dict[str, Any]:
+        """Read only the Typography sheet of an Excel file as chart_config fields ({} if absent)."""
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if "Typography" not in wb.sheetnames:
+                return {}
+            return self._read_typography_sheet(wb["Typography"])
+        finally:
+            wb.close()
+    
     def _create_layout_sheet(self, wb: Workbook, frame_config: FrameConfig) -> None:
         """Create Layout worksheet with chart dimensions, margins, and rows."""
         ws = wb.create_sheet("Layout")
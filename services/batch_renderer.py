@@ -0,0 +1,203 @@
+# File: batch_renderer.py
+"""Headless rendering of Excel project workbooks to SVG (and optionally PNG).
+
+Workbooks are spread over a pool of worker processes. Workers measure text with the font metrics
+table (see services/text_metrics.py), to which this process adds every font the workbooks use,
+measured with Qt, before the pool starts, so they only start an offscreen QGuiApplication to rasterize PNGs or when qt_metrics is set.
+No window is ever created.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+import logging
+import multiprocessing
+import os
+import time
+
+# Logging is configured centrally in utils/logging_config.py
+
+_app = None  # Per-process QGuiApplication
+
+
+def find_workbooks(paths: Iterable[str], recursive: bool = False) -> List[Tuple[str, str]]:
+    """Expand files and directories into the .xlsx workbooks to render.
+
+    Returns:
+        List of (workbook path, output name) pairs. The output name is the workbook's path
+        relative to the directory it was found in, without the extension, so workbooks from
+        subdirectories keep their layout in the output folder.
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        ValueError: If two workbooks would write the same output files
+    """
+    workbooks = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            pattern = "**/*.xlsx" if recursive else "*.xlsx"
+            for workbook in sorted(path.glob(pattern)):
+                if not workbook.name.startswith("~$"):  # Skip Excel lock files
+                    workbooks.append((str(workbook), str(workbook.relative_to(path).with_suffix(""))))
+        elif path.is_file():
+            workbooks.append((str(path), path.stem))
+        else:
+            raise FileNotFoundError(f"No such file or directory: {path}")
+
+    seen = {}
+    for workbook, output_name in workbooks:
+        if output_name in seen:
+            raise ValueError(f"{workbook} and {seen[output_name]} would both be written as {output_name}")
+        seen[output_name] = workbook
+    return workbooks
+
+
+def _ensure_qt_application():
+    global _app
+    if _app is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtGui import QGuiApplication
+        _app = QGuiApplication.instance() or QGuiApplication(["compactgantt-batch"])
+
+
+def _init_worker(log_level: int, use_qt: bool):
+    logging.basicConfig(level=log_level, format="%(asctime)s - %(processName)s - %(levelname)s - %(message)s")
+    if use_qt:
+        _ensure_qt_application()
+
+
+def _prepare_metrics_table(workbooks: List[Tuple[str, str]]):
+    """Measure every font the workbooks render with in Qt, so workers find them in the metrics table.
+
+    Only each workbook's Typography sheet is read here; a workbook that cannot be read is
+    left for its worker to report.
+    """
+    from config.app_config import AppConfig
+    from config.chart_config import ChartConfig
+    from repositories.excel_repository import ExcelRepository
+    from services.text_metrics import ensure_font_metrics_table
+    _ensure_qt_application()
+    app_config = AppConfig()
+    chart_configs = [app_config.general.chart]
+    repository = ExcelRepository()
+    for workbook, _ in workbooks:
+        try:
+            typography = repository.load_typography(workbook)
+        except Exception as e:
+            logging.warning(f"Failed to read typography of {workbook}: {e}")
+            continue
+        chart_config = ChartConfig()
+        # Same fields render_workbook() applies from the loaded project
+        for key, value in typography.items():
+            if hasattr(chart_config, key):
+                setattr(chart_config, key, value)
+        chart_configs.append(chart_config)
+    ensure_font_metrics_table(app_config.get_font_metrics_file(), *chart_configs)
+
+
+def render_workbook(workbook: str, output_name: str, output_dir: str, png: bool = False,
+                    transparent: bool = True, qt_metrics: bool = False, png_scale: float = 1.0) -> dict:
+    """Load one workbook and render it to output_dir/output_name.svg (and .png).
+
+    Args:
+        png_scale: PNG pixels per SVG pixel (the PNG is rendered in tiles, so size is not limited by memory)
+        qt_metrics: Measure text with Qt (as the GUI does) instead of the font metrics table
+
+    Returns:
+        Result dictionary: workbook, ok, error, svg, png, tasks, elements, and load_seconds,
+        render_seconds, png_seconds and total_seconds
+    """
+    if png or qt_metrics:
+        _ensure_qt_application()
+    from config.app_config import AppConfig
+    from models.project import ProjectData
+    from repositories.excel_repository import ExcelRepository
+    from services.gantt_chart_service import GanttChartService
+    from services.raster_export import export_png_tiled
+
+    result = {"workbook": workbook, "ok": False, "error": None, "svg": None, "png": None,
+              "tasks": None, "elements": None, "load_seconds": 0.0, "render_seconds": 0.0,
+              "png_seconds": 0.0, "total_seconds": 0.0}
+    start = time.perf_counter()
+    try:
+        project = ExcelRepository().load(workbook, ProjectData)
+        data = project.to_json()
+        app_config = AppConfig()
+        # Same as loading in the GUI: the workbook's typography settings drive the chart
+        for key, value in data["chart_config"].items():
+            setattr(app_config.general.chart, key, value)
+        app_config.general.chart.svg_in_memory = False
+        app_config.general.chart.render_cache = False  # Each workbook renders once; stream it to the file
+        app_config.general.chart.text_metrics_provider = "qt" if qt_metrics else "table"
+        loaded = time.perf_counter()
+        result["load_seconds"] = loaded - start
+        result["tasks"] = len(project.tasks)
+
+        svg_path = os.path.join(output_dir, output_name + ".svg")
+        service = GanttChartService(app_config, output_folder=os.path.dirname(svg_path),
+                                    output_filename=os.path.basename(svg_path))
+        svg_path = service.generate_svg(data)
+        rendered = time.perf_counter()
+        result["render_seconds"] = rendered - loaded
+        if not svg_path:
+            raise RuntimeError("SVG generation failed (see log)")
+        result["svg"] = svg_path
+        stats = service.last_render_stats or {}
+        result["elements"] = stats.get("elements")
+
+        if png:
+            png_path = os.path.join(output_dir, output_name + ".png")
+            export_png_tiled(svg_path, png_path, scale=png_scale, transparent=transparent)
+            result["png"] = os.path.abspath(png_path)
+            result["png_seconds"] = time.perf_counter() - rendered
+        result["ok"] = True
+    except Exception as e:
+        logging.error(f"Failed to render {workbook}: {e}", exc_info=True)
+        result["error"] = str(e)
+    result["total_seconds"] = time.perf_counter() - start
+    return result
+
+
+def render_batch(workbooks: List[Tuple[str, str]], output_dir: str, jobs: Optional[int] = None,
+                 png: bool = False, transparent: bool = True, log_level: int = logging.WARNING,
+                 on_result: Callable[[dict], None] = None, qt_metrics: bool = False,
+                 png_scale: float = 1.0) -> List[dict]:
+    """Render workbooks from find_workbooks() across a process pool.
+
+    Args:
+        jobs: Worker processes (default: CPU count); 1 renders in this process
+        on_result: Called with each result as soon as its workbook finishes
+        qt_metrics: Start Qt in every worker and measure text with it instead of the table
+        png_scale: PNG pixels per SVG pixel
+
+    Returns:
+        Results in completion order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(workbooks) or 1))
+    results = []
+
+    def finished(result: dict):
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    if not qt_metrics:
+        _prepare_metrics_table(workbooks)
+
+    if jobs == 1:
+        for workbook, output_name in workbooks:
+            finished(render_workbook(workbook, output_name, output_dir, png, transparent, qt_metrics,
+                                     png_scale))
+        return results
+
+    # Spawned workers: forking a process that has loaded Qt is not safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=_init_worker,
+                             initargs=(log_level, png or qt_metrics)) as pool:
+        futures = [pool.submit(render_workbook, workbook, output_name, output_dir, png, transparent,
+                               qt_metrics, png_scale)
+                   for workbook, output_name in workbooks]
+        for future in as_completed(futures):
+            finished(future.result())
+    return results
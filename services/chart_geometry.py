@@ -0,0 +1,234 @@
+# File: chart_geometry.py
+"""Columnar date-to-pixel geometry for tasks, pipes, curtains and the calendar scales.
+
+Dates are converted to int64 day ordinals once per render, then positions and visibility
+masks for a whole set of items are computed with NumPy array operations. Results are
+converted back with .tolist() so the SVG writer sees plain Python floats, and the arithmetic
+follows the same order as the scalar code so coordinates are unchanged.
+"""
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
+import numpy as np
+
+# Ordinal stored for dates that are missing or fail to parse; always paired with a False mask
+INVALID_ORDINAL = 0
+
+# date.toordinal() of the NumPy datetime64 epoch (1970-01-01)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+CALENDAR_INTERVALS = ("years", "months", "weeks", "days")
+
+# Average period length in days, for estimating gridline spacing
+AVERAGE_INTERVAL_DAYS = {"years": 365.2425, "months": 30.436875, "weeks": 7.0, "days": 1.0}
+
+
+def day_ordinals(date_strs: Iterable[str], parse_date: Callable[[str], Optional[datetime]]) -> tuple:
+    """Convert date strings to day ordinals, parsing each distinct string only once.
+
+    Args:
+        date_strs: Internal (yyyy-mm-dd) date strings; blanks and None are allowed
+        parse_date: Function returning a datetime, or None if the string is invalid
+
+    Returns:
+        Tuple of (ordinals, valid) int64 and bool arrays of the same length as date_strs
+    """
+    parsed = {}
+    ordinals = []
+    for date_str in date_strs:
+        ordinal = parsed.get(date_str)
+        if ordinal is None:
+            date = parse_date(date_str) if date_str and date_str.strip() else None
+            ordinal = date.toordinal() if date else -1
+            parsed[date_str] = ordinal
+        ordinals.append(ordinal)
+    ordinals = np.array(ordinals, dtype=np.int64)
+    valid = ordinals >= 0
+    ordinals[~valid] = INVALID_ORDINAL
+    return ordinals, valid
+
+
+class TimelineAxis:
+    """Maps day ordinals to x positions on a timeline of a given pixel width."""
+
+    def __init__(self, x: float, width: float, start_date: datetime, end_date: datetime):
+        self.x = x
+        self.width = width
+        self.start = start_date.toordinal()
+        self.end = end_date.toordinal()
+        self.total_days = max(self.end - self.start, 1)
+        self.time_scale = width / self.total_days
+
+    def days(self, ordinals: np.ndarray) -> np.ndarray:
+        """Days from the timeline start date."""
+        return ordinals - self.start
+
+    def x_of(self, days: np.ndarray) -> np.ndarray:
+        """X position of the left edge of the given day offsets."""
+        return self.x + days * self.time_scale
+
+    def contains_x(self, x_pos: np.ndarray) -> np.ndarray:
+        """Mask of x positions within the timeline's horizontal bounds."""
+        return (self.x <= x_pos) & (x_pos <= self.x + self.width)
+
+
+def task_columns(axis: TimelineAxis, start_ordinals: np.ndarray, finish_ordinals: np.ndarray,
+                 valid: np.ndarray, rows: np.ndarray, y: float, row_height: float, num_rows: int) -> dict:
+    """Compute task bar geometry and visibility for all tasks at once.
+
+    A task is visible when its dates are valid, finish is not before start, it overlaps the
+    timeline date range, and its row is within num_rows.
+
+    Args:
+        axis: Timeline axis
+        start_ordinals, finish_ordinals: Task dates as day ordinals
+        valid: Mask of tasks whose dates parsed
+        rows: 1-based task row numbers
+        y: Top of the task area
+        row_height: Height per row
+        num_rows: Number of rows in the chart
+
+    Returns:
+        Dictionary of arrays: visible, x_start, x_end, width_task, y_task, row_num
+    """
+    start_days = axis.days(start_ordinals)
+    finish_days = axis.days(finish_ordinals)
+    visible = (valid & (finish_days >= start_days) & (finish_days >= 0)
+               & (start_ordinals <= axis.end) & (rows <= num_rows))
+
+    x_start = axis.x_of(np.maximum(start_days, 0))
+    x_end = axis.x_of(np.minimum(finish_days + 1, axis.total_days))
+    width_task = np.where(start_days == finish_days, axis.time_scale,
+                          np.maximum(x_end - x_start, axis.time_scale))
+    row_num = rows - 1  # Convert to 0-based index
+    y_task = y + row_num * row_height
+
+    return {
+        "visible": visible,
+        "x_start": x_start,
+        "x_end": x_end,
+        "width_task": width_task,
+        "y_task": y_task,
+        "row_num": row_num
+    }
+
+
+def pipe_columns(axis: TimelineAxis, ordinals: np.ndarray, valid: np.ndarray) -> dict:
+    """Compute pipe x positions and visibility for all pipes at once.
+
+    Returns:
+        Dictionary of arrays: visible, x_pos
+    """
+    x_pos = axis.x_of(axis.days(ordinals))
+    in_range = (ordinals >= axis.start) & (ordinals <= axis.end)
+    return {
+        "visible": valid & in_range & axis.contains_x(x_pos),
+        "x_pos": x_pos
+    }
+
+
+def curtain_columns(axis: TimelineAxis, start_ordinals: np.ndarray, end_ordinals: np.ndarray,
+                    valid: np.ndarray) -> dict:
+    """Compute curtain edges, clamped fill extents, and visibility for all curtains at once.
+
+    Returns:
+        Dictionary of arrays: visible (overlaps the date range), x_start, x_end,
+        x_start_visible, x_end_visible, show_fill, show_start_line, show_end_line
+    """
+    x_start = axis.x_of(axis.days(start_ordinals))
+    x_end = axis.x_of(axis.days(end_ordinals))
+    right = axis.x + axis.width
+    x_start_visible = np.maximum(axis.x, np.minimum(x_start, right))
+    x_end_visible = np.maximum(axis.x, np.minimum(x_end, right))
+    return {
+        "visible": valid & (end_ordinals >= axis.start) & (start_ordinals <= axis.end),
+        "x_start": x_start,
+        "x_end": x_end,
+        "x_start_visible": x_start_visible,
+        "x_end_visible": x_end_visible,
+        "show_fill": x_start_visible < x_end_visible,
+        "show_start_line": axis.contains_x(x_start),
+        "show_end_line": axis.contains_x(x_end)
+    }
+
+
+def _datetime64_days(ordinals: np.ndarray) -> np.ndarray:
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _ordinals_of(dates64: np.ndarray) -> np.ndarray:
+    return dates64.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+
+
+def weekdays(ordinals: np.ndarray) -> np.ndarray:
+    """Day of week as in date.weekday() (Monday is 0); ordinal 1 is a Monday."""
+    return (ordinals - 1) % 7
+
+
+def years(ordinals: np.ndarray) -> np.ndarray:
+    return _datetime64_days(ordinals).astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def months(ordinals: np.ndarray) -> np.ndarray:
+    """Month of year, 1 to 12."""
+    return _datetime64_days(ordinals).astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+
+def iso_weeks(ordinals: np.ndarray) -> np.ndarray:
+    """ISO 8601 week numbers, as in date.isocalendar()[1]."""
+    # An ISO week belongs to the year containing its Thursday
+    thursdays = ordinals - weekdays(ordinals) + 3
+    year_starts = _ordinals_of(_datetime64_days(thursdays).astype("datetime64[Y]"))
+    return (thursdays - year_starts) // 7 + 1
+
+
+class CalendarBoundaries:
+    """Day ordinals where each calendar period starts, for one chart date range.
+
+    For each interval the boundaries are the period starts after the chart start date, up to
+    and including the first one after the end date, matching a walk from the start date that
+    steps to the next Monday, first of month or first of year until it passes the end date.
+    """
+
+    def __init__(self, start_ordinal: int, end_ordinal: int):
+        self.start = start_ordinal
+        self.end = end_ordinal
+        first_month = _datetime64_days(np.array([start_ordinal]))[0].astype("datetime64[M]")
+        last_month = _datetime64_days(np.array([end_ordinal]))[0].astype("datetime64[M]")
+        first_year = first_month.astype("datetime64[Y]")
+        last_year = last_month.astype("datetime64[Y]")
+        first_monday = start_ordinal + 7 - (start_ordinal - 1) % 7
+        self._boundaries = {
+            "years": _ordinals_of(np.arange(first_year + 1, last_year + 2)),
+            "months": _ordinals_of(np.arange(first_month + 1, last_month + 2)),
+            "weeks": np.arange(first_monday, max(end_ordinal, first_monday) + 8, 7, dtype=np.int64),
+            "days": np.arange(start_ordinal + 1, end_ordinal + 2, dtype=np.int64),
+        }
+        for interval, boundaries in self._boundaries.items():
+            # Keep the first boundary after the end date, which closes the last period
+            keep = np.searchsorted(boundaries, end_ordinal, side="right") + 1
+            self._boundaries[interval] = boundaries[:keep]
+
+    def boundaries(self, interval: str) -> np.ndarray:
+        """Period starts after the chart start date that are on or before the end date."""
+        boundaries = self._boundaries[interval]
+        return boundaries[boundaries <= self.end]
+
+    def periods(self, interval: str) -> tuple:
+        """Periods touching the chart range, the first one beginning at the chart start date.
+
+        Returns:
+            Tuple of (starts, ends) day ordinal arrays; each end is the next period's start
+        """
+        if self.end < self.start:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        ends = self._boundaries[interval]
+        starts = np.concatenate(([self.start], ends[:-1])).astype(np.int64)
+        return starts, ends
+
+
+@lru_cache(maxsize=16)
+def calendar_boundaries(start_ordinal: int, end_ordinal: int) -> CalendarBoundaries:
+    """Return the (shared, read-only) boundary table for a chart date range."""
+    return CalendarBoundaries(start_ordinal, end_ordinal)
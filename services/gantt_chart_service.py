@@ -1,34 +1,97 @@
 # File: gantt_chart_service.py
 import svgwrite
+import calendar
 from datetime import datetime, timedelta
+import dataclasses
+import hashlib
+import io
+import json
+import math
 import os
+import threading
 from typing import Optional
+import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
-from PyQt5.QtGui import QFont, QFontMetrics
 from config.app_config import AppConfig
 import logging
 from models.link import Link
 from models.task import Task
-from utils.conversion import is_valid_internal_date
+from utils.conversion import parse_internal_date, internal_date_cache_info
 from models.pipe import Pipe
 from models.curtain import Curtain
 from models.swimlane import Swimlane
 from models.note import Note
+from services import chart_geometry
+from services.interval_index import IntervalIndex
+from services.text_metrics import TextMetricsService
+from services.svg_stream import StreamingDrawing, SvgDefinitions
+from services.render_profiler import RenderProfiler, TimedWriter, append_render_stats
+from services.render_cache import RenderCache, canonical_json, content_key
+from version import __version__
 
 # Logging is configured centrally in utils/logging_config.py
 
+# Stable ids: raster export renders only the content group to leave out the background
+CHART_BACKGROUND_ID = "chart-background"
+CHART_CONTENT_ID = "chart-content"
+GEOMETRY_MAP_VERSION = 1  # Bump when the layout of geometry map regions changes
+
 class GanttChartService(QObject):
     svg_generated = pyqtSignal(str)
+    svg_bytes_generated = pyqtSignal(bytes)
+    render_stats_updated = pyqtSignal(dict)  # Phase stats of each finished render (see last_render_stats)
+    geometry_map_generated = pyqtSignal(object)  # Emitted before the SVG signals (see last_geometry_map)
 
     def __init__(self, app_config=None, output_folder: str = None, output_filename: str = None):
         super().__init__()
-        self.config = app_config if app_config else AppConfig()  # Use passed instance or create new
+        self._config = app_config if app_config else AppConfig()  # Use passed instance or create new
         self.output_folder = output_folder or self.config.general.svg_output_folder
         self.output_filename = output_filename or self.config.general.svg_output_filename
         self.dwg = None
         self.data = {"frame_config": {}, "tasks": []}
-        self.font = QFont(self.config.general.font_family, self.config.general.task_font_size)
-        self.font_metrics = QFontMetrics(self.font)
+        self._task_geometry = {}  # task_id -> geometry index entry, rebuilt by render_tasks()
+        self._hit_regions = []  # Regions of drawn items in drawing order, see last_geometry_map
+        self._hit_link = None  # (link_id, label) of the link whose segments _create_link_line() draws
+        self._last_geometry_map = None
+        self._line_batch = None  # (stroke, stroke_width) -> path segments while batching lines
+        self._layer_cache = {}  # layer name -> cached output of the last render of that layer
+        self._settings_key = None  # Digest of _render_settings(), set by _begin_render()
+        self._data_keys = {}  # data list name -> digest, set by _begin_render()
+        self._date_indexes = {}  # "tasks"/"pipes"/"curtains" -> parsed dates and IntervalIndex
+        self._svg_definitions = SvgDefinitions()  # <defs> shapes shared by compact renders
+        self._svg_write_thread = None  # Background writer for in-memory mode
+        self.text_metrics = None
+        self._text_metrics_settings = None
+        self.render_cache = None
+        self._render_cache_settings = None
+        self.id_badge_overlay = None
+        self.profiler = RenderProfiler(self._element_count)
+        self._last_render_stats = None
+        self.config = self._config  # Builds text_metrics and render_cache
+
+    @property
+    def config(self):
+        return self._config
+
+    @config.setter
+    def config(self, app_config):
+        """Render with app_config from now on, rebuilding the text metrics and render cache if their settings changed."""
+        self._config = app_config
+        chart = app_config.general.chart
+        text_metrics_settings = (chart.text_metrics_provider, app_config.get_font_metrics_file(),
+                                 chart.label_text_width_factor)
+        if text_metrics_settings != self._text_metrics_settings:
+            provider, table_path, width_factor = text_metrics_settings
+            self.text_metrics = TextMetricsService(provider=provider, table_path=table_path, width_factor=width_factor)
+            self._text_metrics_settings = text_metrics_settings
+        render_cache_settings = (
+            int(chart.render_cache_max_mb * 1024 * 1024),
+            os.path.join(self.output_folder, ".render_cache") if chart.render_cache_disk else None,
+            int(chart.render_cache_disk_max_mb * 1024 * 1024))
+        if render_cache_settings != self._render_cache_settings:
+            max_bytes, disk_folder, max_disk_bytes = render_cache_settings
+            self.render_cache = RenderCache(max_bytes=max_bytes, disk_folder=disk_folder, max_disk_bytes=max_disk_bytes)
+            self._render_cache_settings = render_cache_settings
 
     def _get_frame_config(self, key: str, default):
         """Get a value from frame_config with a default fallback."""
@@ -36,42 +99,239 @@ class GanttChartService(QObject):
 
     @pyqtSlot(dict)
     def generate_svg(self, data):
-        # Update font and font_metrics to use current config values
-        self.font = QFont(self.config.general.font_family, self.config.general.task_font_size)
-        self.font_metrics = QFontMetrics(self.font)
+        """Render the chart and publish it.
+        
+        In in-memory mode (chart.svg_in_memory) the SVG bytes are emitted via svg_bytes_generated
+        and the file in the output folder is written by a background thread, which publishes the
+        render stats once the file is written. Otherwise the file is written first and its path
+        is emitted via svg_generated. Either way the file write is timed as the "save" phase.
+        
+        Returns:
+            Absolute path of the SVG file, or None if generation failed
+        """
         if not data or "frame_config" not in data:
             logging.warning("Skipping SVG generation: Invalid or empty data")
             self.svg_generated.emit("")
             return
         try:
-            self.data = data
-            width = data["frame_config"].get("outer_width", self.config.general.outer_width)
-            height = data["frame_config"].get("outer_height", self.config.general.outer_height)
-            self.dwg = svgwrite.Drawing(
-                filename=os.path.abspath(os.path.join(self.output_folder, self.output_filename)),
-                size=(width, height))
-            self.render()
             svg_path = os.path.abspath(os.path.join(self.output_folder, self.output_filename))
-            self.svg_generated.emit(svg_path)
+            cache_key = self._begin_render(data)
+            cached = self._get_cached_render(cache_key)
+            if self.config.general.chart.svg_in_memory:
+                svg_bytes = cached or self._render_svg_bytes(data, cache_key)
+                self.geometry_map_generated.emit(self._last_geometry_map)
+                self.svg_bytes_generated.emit(svg_bytes)
+                self._write_svg_in_background(svg_path, svg_bytes, cache_hit=cached is not None)
+            else:
+                os.makedirs(self.output_folder, exist_ok=True)
+                temp_path = svg_path + ".tmp"
+                if cached or cache_key:
+                    # Render in memory so the document can be cached, then write it out
+                    svg_bytes = cached or self._render_svg_bytes(data, cache_key)
+                    with self.profiler.phase("save"):
+                        with open(temp_path, "wb") as f:
+                            f.write(svg_bytes)
+                else:
+                    with open(temp_path, "w", encoding="utf-8") as f:
+                        # Elements are written as they are drawn; the writes count as "save"
+                        self._render_drawing(data, TimedWriter(f, self.profiler))
+                with self.profiler.phase("save"):
+                    os.replace(temp_path, svg_path)
+                self.geometry_map_generated.emit(self._last_geometry_map)
+                self.svg_generated.emit(svg_path)
+                self._publish_render_stats(cache_hit=cached is not None)
             return svg_path
         except Exception as e:
             logging.error(f"SVG generation failed: {e}", exc_info=True)
+            self.profiler.finish()
             self.svg_generated.emit("")
             return
 
+    def render_svg_bytes(self, data) -> bytes:
+        """Render the chart and return the SVG document as UTF-8 bytes without touching the disk."""
+        cache_key = self._begin_render(data)
+        cached = self._get_cached_render(cache_key)
+        svg_bytes = cached or self._render_svg_bytes(data, cache_key)
+        self._publish_render_stats(cache_hit=cached is not None)
+        return svg_bytes
+
+    def _render_svg_bytes(self, data, cache_key: str = None) -> bytes:
+        buffer = io.StringIO()
+        self._render_drawing(data, buffer)
+        with self.profiler.phase("serialization"):
+            svg_bytes = buffer.getvalue().encode("utf-8")
+        if cache_key:
+            # The geometry map travels with the document as its side-car
+            self.render_cache.put(cache_key, svg_bytes, sidecar=canonical_json(self._last_geometry_map))
+        return svg_bytes
+
+    def _get_cached_render(self, cache_key: Optional[str]) -> Optional[bytes]:
+        """Return the cached SVG for cache_key and restore its geometry map, or None on a miss."""
+        entry = self.render_cache.get_entry(cache_key) if cache_key else None
+        if entry is None or entry[1] is None:
+            return None  # Documents cached without a geometry map are rendered again
+        svg_bytes, sidecar = entry
+        self._last_geometry_map = json.loads(sidecar)
+        return svg_bytes
+
+    def _begin_render(self, data) -> Optional[str]:
+        """Start a profiled render of data and hash its inputs.
+        
+        Sets the settings and per-list digests that key the render layers and date indexes.
+        
+        Returns:
+            Render cache key of the whole document, or None when chart.render_cache is off
+        """
+        self.data = data
+        self.dwg = None
+        self.id_badge_overlay = None
+        self._hit_regions = []
+        self._last_geometry_map = None
+        self.wait_for_svg_write()  # It times and publishes the previous render's stats
+        self.profiler.start(track_memory=self.config.general.chart.render_stats_memory)
+        with self.profiler.phase("layout"):
+            # Each layer is keyed by a hash of the inputs that affect it, so an edit only
+            # regenerates the affected layers and the rest are spliced in from cache
+            self._settings_key = self._digest(self._render_settings())
+            self._data_keys = {name: self._digest(data.get(name, []))
+                               for name in ("tasks", "links", "swimlanes", "pipes", "curtains", "notes")}
+            if not self.config.general.chart.render_cache:
+                return None
+            # The digests cover the whole payload; the version and text measurement also shape output
+            return content_key({"version": __version__, "text_metrics": self.text_metrics.provider,
+                                "settings": self._settings_key, "data": self._data_keys})
+
+    @property
+    def last_render_stats(self) -> Optional[dict]:
+        """Phase statistics of the last finished render, or None before the first one.
+        
+        Top-level keys: timestamp, total_seconds, elements, backend, tasks, cache_hit (served
+        from the render cache, so nothing was drawn), render_cache (its hit/miss counters),
+        phases, and peak_memory_bytes when chart.render_stats_memory is on. phases maps each phase
+        (layout, header_footer, scales, swimlanes, gridlines, pipes, curtains, tasks, links,
+        notes, overlay, serialization, save) to its seconds, elements, calls and cache_hits
+        (renders served from the layer cache), plus peak_memory_bytes when tracked. With the
+        streaming backend most serialization happens inside the drawing phases; file writes made
+        while drawing are counted under save. In in-memory mode the stats are published after
+        the background file write (see wait_for_svg_write()).
+        """
+        return self._last_render_stats
+
+    @property
+    def last_geometry_map(self) -> Optional[dict]:
+        """Where the last rendered chart drew each task, link, pipe, curtain and note.
+        
+        A JSON-compatible dict with keys version, width and height (of the SVG document) and
+        regions: a list of [kind, id, x, y, width, height, label] in drawing order, so later
+        regions are on top. kind is "task", "link", "pipe", "curtain" or "note", id is the
+        item's task_id, link_id, ... and x, y, width, height its bounding box in SVG units (a
+        link has one region per line segment; lines have zero width or height). label is a
+        short description for tooltips. None before the first render or after a failed one.
+        """
+        return self._last_geometry_map
+
+    def _add_hit_region(self, kind: str, element_id, x: float, y: float, width: float, height: float,
+                        label: str = ""):
+        """Record where an item was drawn for the geometry map."""
+        self._hit_regions.append([kind, element_id, round(x, 2), round(y, 2), round(width, 2), round(height, 2),
+                                  label])
+
+    def _publish_render_stats(self, cache_hit: bool = False):
+        """Finish the profiled render, then store, log and emit its stats."""
+        stats = self.profiler.finish(backend=self.config.general.chart.svg_backend,
+                                     tasks=len(self.data.get("tasks", [])), cache_hit=cache_hit,
+                                     render_cache=self.render_cache.stats())
+        if stats is None:
+            return
+        self._last_render_stats = stats
+        logging.debug(f"Rendered {stats['elements']} elements in {stats['total_seconds']:.3f}s")
+        log_path = self.config.general.chart.render_stats_log
+        if log_path:
+            append_render_stats(log_path, stats)
+        self.render_stats_updated.emit(stats)
+
+    def _element_count(self) -> int:
+        """Top-level elements drawn so far in the current render, including ID badges."""
+        if self.dwg is None:
+            return 0
+        if isinstance(self.dwg, StreamingDrawing):
+            count = self.dwg.element_count
+        else:
+            count = len(self.dwg.elements)
+        if self.id_badge_overlay is not None:
+            count += len(self.id_badge_overlay.elements)
+        return count
+
+    def _render_drawing(self, data, stream):
+        """Render data into a new drawing (self.dwg) and write the SVG document to a text stream.
+        
+        Call _begin_render(data) first. With the streaming backend (chart.svg_backend) elements
+        are written to the stream as they are drawn; with svgwrite the element tree is built
+        first and serialized at the end.
+        """
+        width = data["frame_config"].get("outer_width", self.config.general.outer_width)
+        height = data["frame_config"].get("outer_height", self.config.general.outer_height)
+        filename = os.path.abspath(os.path.join(self.output_folder, self.output_filename))
+        if self.config.general.chart.svg_backend == "streaming":
+            definitions = self._svg_definitions if self.config.general.chart.svg_compact else None
+            self.dwg = StreamingDrawing(stream, filename=filename, size=(width, height), definitions=definitions)
+            self.render()
+            with self.profiler.phase("serialization"):
+                self.dwg.close()
+            if definitions is not None:
+                self._prune_definitions()
+        else:
+            self.dwg = svgwrite.Drawing(filename=filename, size=(width, height))
+            self.render()
+            with self.profiler.phase("serialization"):
+                self.dwg.write(stream)
+        self._last_geometry_map = {"version": GEOMETRY_MAP_VERSION, "width": width, "height": height,
+                                   "regions": self._hit_regions}
+        logging.debug(f"Internal date parse cache: {internal_date_cache_info()}")
+
+    def _prune_definitions(self):
+        """Keep only the <defs> shapes referenced by the last document or by a cached layer."""
+        referenced = set(self.dwg.references)
+        for cached in self._layer_cache.values():
+            referenced.update(cached["references"])
+        self._svg_definitions.retain(referenced)
+
+    def _compact_svg(self) -> bool:
+        """True when the current drawing shares styles and <defs>/<use> shapes (chart.svg_compact)."""
+        return isinstance(self.dwg, StreamingDrawing) and self.dwg.compact
+
+    def _write_svg_in_background(self, svg_path: str, svg_bytes: bytes, cache_hit: bool = False):
+        """Write SVG bytes to svg_path on a background thread, replacing the file atomically.
+        
+        The write is timed as the render's "save" phase; the thread then publishes the render stats.
+        """
+        # Finish the previous write first so writes land in order
+        self.wait_for_svg_write()
+
+        def write():
+            with self.profiler.phase("save"):
+                try:
+                    os.makedirs(os.path.dirname(svg_path), exist_ok=True)
+                    temp_path = svg_path + ".tmp"
+                    with open(temp_path, "wb") as f:
+                        f.write(svg_bytes)
+                    os.replace(temp_path, svg_path)
+                except OSError as e:
+                    logging.error(f"Failed to write SVG to {svg_path}: {e}")
+            self._publish_render_stats(cache_hit=cache_hit)
+
+        self._svg_write_thread = threading.Thread(target=write, name="svg-writer", daemon=True)
+        self._svg_write_thread.start()
+
+    def wait_for_svg_write(self):
+        """Block until any background SVG file write has finished and published its render stats."""
+        if self._svg_write_thread is not None:
+            self._svg_write_thread.join()
+            self._svg_write_thread = None
+
     def _parse_internal_date(self, date_str: str) -> datetime:
         """Safely parse an internal date string (yyyy-mm-dd), returning None if invalid."""
-        if not date_str:
-            return None
-        fmt = "%Y-%m-%d"
-        try:
-            fmt = self.config.general.chart_date_config.get_internal_format()
-        except Exception:
-            pass  # Fallback to default
-        try:
-            return datetime.strptime(date_str.strip(), fmt)
-        except (ValueError, TypeError):
-            return None
+        return parse_internal_date(date_str)
     
     def _convert_to_model_object(self, data, model_class):
         """Convert data to model object, handling both dict and object inputs.
@@ -96,7 +356,8 @@ class GanttChartService(QObject):
         width = self._get_frame_config("outer_width", self.config.general.outer_width)
         height = self._get_frame_config("outer_height", self.config.general.outer_height)
         # Render background first
-        self.dwg.add(self.dwg.rect(insert=(0, 0), size=(width, height), fill="white", stroke="none"))
+        self.dwg.add(self.dwg.rect(insert=(0, 0), size=(width, height), fill="white", stroke="none",
+                                   id=CHART_BACKGROUND_ID))
 
     def render_outer_frame_border(self):
         """Render outer frame border last so it appears on top of all other elements."""
@@ -159,8 +420,13 @@ class GanttChartService(QObject):
         # self.dwg.add(self.dwg.rect(insert=(margins[3], y), size=(width, height),
         #                            fill="none", stroke="blue", stroke_width=1, stroke_dasharray="4"))
 
-    def render_single_timeline(self):
-        """Render a single continuous timeline instead of multiple time frames."""
+    def _calculate_timeline_layout(self) -> Optional[dict]:
+        """Calculate the position, date range, and row frame geometry of the single continuous timeline.
+        
+        Returns:
+            Dictionary with x, y, width, height, start_date, end_date, time_scale, scale_configs,
+            scale_heights, row_y, row_frame_height, num_rows; or None if the chart dates are invalid
+        """
         margins = self._get_frame_config("margins", (10, 10, 10, 10))
         header_height = self._get_frame_config("header_height", 20)
         footer_height = self._get_frame_config("footer_height", 20)
@@ -183,29 +449,38 @@ class GanttChartService(QObject):
         chart_end = self._parse_internal_date(chart_end_str) if chart_end_str else None
         if not chart_start or not chart_end:
             logging.warning("Invalid chart start/end date; aborting render")
-            return
+            return None
         
-        # Render scales, rows, and tasks in one continuous timeline
-        row_y, row_frame_height = self.render_scales_and_rows(margins[3], inner_y, inner_width, inner_height, chart_start, chart_end)
-        # Render links after tasks, using row frame position and height
-        self.render_links(margins[3], row_y, inner_width, row_frame_height, chart_start, chart_end)
-
+        # Calculate time scale
+        total_days = max((chart_end - chart_start).days, 1)
+        time_scale = inner_width / total_days if total_days > 0 else inner_width
+        
+        # Scales stack above the row frame
+        scale_configs = self._build_scale_configs()
+        row_frame_height, scale_heights = self._calculate_scale_heights(scale_configs, inner_height)
+        row_y = inner_y
+        for _, scale_height in scale_heights:
+            row_y += scale_height
+        
+        return {
+            "x": margins[3],
+            "y": inner_y,
+            "width": inner_width,
+            "height": inner_height,
+            "start_date": chart_start,
+            "end_date": chart_end,
+            "time_scale": time_scale,
+            "scale_configs": scale_configs,
+            "scale_heights": scale_heights,
+            "row_y": row_y,
+            "row_frame_height": row_frame_height,
+            "num_rows": self._get_frame_config("num_rows", 1)
+        }
 
     def _truncate_text_to_fit(self, text: str, max_width: float) -> str:
         """Truncate text to fit within max_width, adding ellipsis if needed."""
-        text_width = self.font_metrics.horizontalAdvance(text)
-        if text_width <= max_width:
-            return text
-        
-        left, right = 1, len(text)
-        while left <= right:
-            mid = (left + right) // 2
-            test_text = text[:mid] + "…"
-            if self.font_metrics.horizontalAdvance(test_text) <= max_width:
-                left = mid + 1
-            else:
-                right = mid - 1
-        return text[:right] + "…" if right > 0 else ""
+        return self.text_metrics.truncate(text, max_width, self.config.general.font_family,
+                                          self.config.general.task_font_size)
 
     def _format_label_text(self, task_name: str, start_date_str: str, finish_date_str: str, 
                           label_content: str, is_milestone: bool, task_date_format: Optional[str] = None) -> str:
@@ -327,9 +602,7 @@ class GanttChartService(QObject):
         text_vertical_factor = self.config.general.chart.id_badge_text_vertical_alignment_factor
         
         # Use font metrics for the configured font size
-        temp_font = QFont(self.config.general.font_family, font_size)
-        temp_metrics = QFontMetrics(temp_font)
-        text_width = temp_metrics.horizontalAdvance(id_text)
+        text_width = self.text_metrics.width(id_text, self.config.general.font_family, font_size)
         text_height = font_size * 1.2
         badge_w = text_width + pad_x * 2
         badge_h = text_height + pad_y * 2
@@ -427,8 +700,7 @@ class GanttChartService(QObject):
         """
         start_date_str = task.get("start_date", "")
         finish_date_str = task.get("finish_date", "")
-        # A task is a milestone if explicitly marked or if start_date equals finish_date
-        is_milestone = task.get("is_milestone", False) or (start_date_str and finish_date_str and start_date_str == finish_date_str)
+        is_milestone = self._is_milestone(task)
         label_placement = task.get("label_placement") or "Inside"  # Match Task model default
         # Backward compatibility: if label_content is missing, use label_hide
         label_content = task.get("label_content")
@@ -463,94 +735,55 @@ class GanttChartService(QObject):
             "date_format": date_format
         }
     
-    def _validate_and_parse_task_dates(self, task_info: dict, start_date: datetime, end_date: datetime, num_rows: int) -> tuple:
-        """Validate and parse task dates, checking if task should be rendered.
-        
-        Args:
-            task_info: Dictionary with task information from _extract_task_info()
-            start_date: Timeline start date
-            end_date: Timeline end date
-            num_rows: Number of rows in chart
-            
-        Returns:
-            Tuple of (task_start, task_finish) as datetime objects, or (None, None) if invalid
-        """
-        start_date_str = task_info["start_date_str"]
-        finish_date_str = task_info["finish_date_str"]
-        is_milestone = task_info["is_milestone"]
-        task_name = task_info["task_name"]
-        task_row = task_info["task_row"]
-        
-        if not start_date_str and not finish_date_str:
-            return (None, None)
-        
-        # Validate that both dates are valid
-        if not is_valid_internal_date(start_date_str):
-            logging.warning(f"Skipping task {task_name} due to invalid start date: {start_date_str}")
-            return (None, None)
-        if not is_valid_internal_date(finish_date_str):
-            logging.warning(f"Skipping task {task_name} due to invalid finish date: {finish_date_str}")
-            return (None, None)
-        
-        # Parse dates using centralized helper
-        date_to_use = start_date_str if start_date_str else finish_date_str
-        task_start = self._parse_internal_date(date_to_use)
-        task_finish = task_start
-        if not is_milestone and start_date_str and finish_date_str:
-            task_start = self._parse_internal_date(start_date_str)
-            task_finish = self._parse_internal_date(finish_date_str)
-        if not task_start or not task_finish:
-            logging.warning(f"Skipping task {task_name} due to invalid date(s)")
-            return (None, None)
-        
-        # Skip invalid tasks where finish date is before start date
-        if task_finish < task_start:
-            return (None, None)
-        
-        # Skip tasks outside timeline range
-        if task_finish < start_date or task_start > end_date:
-            return (None, None)
-        
-        # Skip tasks with row numbers beyond available rows
-        if task_row > num_rows:
-            return (None, None)
-        
-        return (task_start, task_finish)
+    def _is_milestone(self, task: dict):
+        """A task is a milestone if explicitly marked or if start_date equals finish_date."""
+        start_date_str = task.get("start_date", "")
+        finish_date_str = task.get("finish_date", "")
+        return task.get("is_milestone", False) or (start_date_str and finish_date_str and start_date_str == finish_date_str)
     
-    def _calculate_task_geometry(self, task_start: datetime, task_finish: datetime, task_row: int,
-                                 x: float, y: float, width: float, height: float,
-                                 start_date: datetime, end_date: datetime, num_rows: int,
-                                 time_scale: float, row_height: float, task_height: float) -> dict:
-        """Calculate task position and dimensions.
+    def _parse_task_dates(self, tasks: list) -> tuple:
+        """Convert task dates to day ordinals, logging tasks skipped for invalid dates.
+        
+        Milestones use their start date for both ends. Tasks with neither date are skipped
+        silently; tasks with only one date are skipped with a warning.
         
         Args:
-            task_start: Task start date (datetime)
-            task_finish: Task finish date (datetime)
-            task_row: Task row number (1-based)
-            x, y: Timeline position
-            width, height: Timeline dimensions
-            start_date, end_date: Timeline date range
-            num_rows: Number of rows
-            time_scale: Pixels per day
-            row_height: Height per row
-            task_height: Height of task bar
+            tasks: List of task dictionaries
             
         Returns:
-            Dictionary with: x_start, x_end, width_task, y_task, row_num
+            Tuple of (start_ordinals, finish_ordinals, valid) NumPy arrays
         """
-        total_days = max((end_date - start_date).days, 1)
-        row_num = task_row - 1  # Convert to 0-based index
-        x_start = x + max((task_start - start_date).days, 0) * time_scale
-        x_end = x + min((task_finish - start_date).days + 1, total_days) * time_scale
-        width_task = time_scale if task_start == task_finish else max(x_end - x_start, time_scale)
-        y_task = y + row_num * row_height
+        start_date_strs = [task.get("start_date", "") for task in tasks]
+        finish_date_strs = [task.get("finish_date", "") for task in tasks]
+        start_ordinals, start_valid = chart_geometry.day_ordinals(start_date_strs, self._parse_internal_date)
+        finish_ordinals, finish_valid = chart_geometry.day_ordinals(finish_date_strs, self._parse_internal_date)
+        
+        is_milestone = np.array([bool(self._is_milestone(task)) for task in tasks], dtype=bool)
+        finish_ordinals = np.where(is_milestone, start_ordinals, finish_ordinals)
+        valid = start_valid & finish_valid
+        
+        for i in np.flatnonzero(~valid).tolist():
+            if not start_date_strs[i] and not finish_date_strs[i]:
+                continue
+            task_name = tasks[i].get("task_name", "Unnamed")
+            if not start_valid[i]:
+                logging.warning(f"Skipping task {task_name} due to invalid start date: {start_date_strs[i]}")
+            else:
+                logging.warning(f"Skipping task {task_name} due to invalid finish date: {finish_date_strs[i]}")
         
+        return start_ordinals, finish_ordinals, valid
+    
+    def _build_tasks_date_index(self, tasks: list) -> dict:
+        start_ordinals, finish_ordinals, valid = self._parse_task_dates(tasks)
+        first_positions = {}  # task_id -> position of its first occurrence
+        for i, task in enumerate(tasks):
+            first_positions.setdefault(task.get("task_id"), i)
         return {
-            "x_start": x_start,
-            "x_end": x_end,
-            "width_task": width_task,
-            "y_task": y_task,
-            "row_num": row_num
+            "index": IntervalIndex(start_ordinals, finish_ordinals, valid),
+            "start_ordinals": start_ordinals,
+            "finish_ordinals": finish_ordinals,
+            "valid": valid,
+            "first_positions": first_positions
         }
     
     def _render_milestone(self, center_x: float, center_y: float, half_size: float, fill_color: str,
@@ -571,8 +804,14 @@ class GanttChartService(QObject):
             row_height: Height of task row
         """
         # Render as a circle - use fill_color from task
-        self.dwg.add(self.dwg.circle(center=(center_x, center_y), r=half_size, 
-                                     fill=fill_color, stroke="black", stroke_width=0.5))
+        if self._compact_svg():
+            shape_id = f"milestone-{half_size:g}".replace(".", "_")
+            if not self.dwg.defines(shape_id):
+                self.dwg.define(shape_id, self.dwg.circle(r=half_size, stroke="black", stroke_width=0.5, id=shape_id))
+            self.dwg.add(self.dwg.use(f"#{shape_id}", insert=(center_x, center_y), fill=fill_color))
+        else:
+            self.dwg.add(self.dwg.circle(center=(center_x, center_y), r=half_size, 
+                                         fill=fill_color, stroke="black", stroke_width=0.5))
         
         # Always render ID badge if enabled
         if show_ids:
@@ -642,129 +881,235 @@ class GanttChartService(QObject):
         """
         tasks = self.data.get("tasks", [])
         show_ids = getattr(self.config.general, "show_ids_on_chart", False)
+        # Geometry index reused by render_links(); first occurrence of a task_id wins
+        self._task_geometry = {}
         if not tasks:
             logging.warning("No tasks found in data! Tasks list is empty.")
             return
         
         # Calculate scales and dimensions
-        total_days = max((end_date - start_date).days, 1)
-        time_scale = width / total_days if total_days > 0 else width
         row_height = height / num_rows if num_rows > 0 else height
         task_height = row_height * 0.8
+        
+        # Only tasks whose dates overlap the timeline are extracted and laid out
+        dates = self._date_index("tasks")
+        axis = chart_geometry.TimelineAxis(x, width, start_date, end_date)
+        positions = dates["index"].overlapping(axis.start, axis.end)
+        task_infos = [self._extract_task_info(tasks[i]) for i in positions.tolist()]
+        start_ordinals = dates["start_ordinals"][positions]
+        finish_ordinals = dates["finish_ordinals"][positions]
+        rows = np.array([info["task_row"] for info in task_infos], dtype=np.int64)
+        columns = chart_geometry.task_columns(axis, start_ordinals, finish_ordinals, dates["valid"][positions],
+                                              rows, y, row_height, num_rows)
+        visible = columns["visible"].tolist()
+        x_starts = columns["x_start"].tolist()
+        x_ends = columns["x_end"].tolist()
+        widths = columns["width_task"].tolist()
+        y_tasks = columns["y_task"].tolist()
+        row_nums = columns["row_num"].tolist()
+        start_ordinals = start_ordinals.tolist()
+        finish_ordinals = finish_ordinals.tolist()
+        first_positions = dates["first_positions"]
+        lod = self._lod_active(axis.time_scale)
+        drawn = []  # Level-of-detail mode: (geometry, task_info, geometry index entry or None)
 
-        for task in tasks:
-            # Extract task information using key-based lookups
-            task_info = self._extract_task_info(task)
-            
-            # Validate and parse dates
-            task_start, task_finish = self._validate_and_parse_task_dates(
-                task_info, start_date, end_date, num_rows
-            )
-            if not task_start or not task_finish:
+        for i, (position, task_info) in enumerate(zip(positions.tolist(), task_infos)):
+            if not visible[i]:
                 continue
             
-            # Calculate task geometry
-            geometry = self._calculate_task_geometry(
-                task_start, task_finish, task_info["task_row"],
-                x, y, width, height, start_date, end_date, num_rows,
-                time_scale, row_height, task_height
-            )
-            
-            # Render milestone or regular task
             task_id = task_info.get("task_id")
-            if task_info["is_milestone"]:
-                half_size = task_height / 2
-                finish_date_str = task_info["finish_date_str"]
-                center_x = geometry["x_end"] if finish_date_str else geometry["x_start"]
-                center_y = geometry["y_task"] + row_height * 0.5
-                
-                self._render_milestone(
-                    center_x, center_y, half_size, task_info["fill_color"],
-                    task_info["label_text"], task_info["label_hide"], task_info["label_placement"],
-                    task_info["label_horizontal_offset"], geometry["y_task"], row_height,
-                    task_id=task_id, show_ids=show_ids
+            geometry = {
+                "x_start": x_starts[i],
+                "x_end": x_ends[i],
+                "width_task": widths[i],
+                "y_task": y_tasks[i],
+                "row_num": row_nums[i]
+            }
+            self._add_task_hit_region(task_info, geometry, task_height, row_height)
+            entry = None
+            if first_positions[task_id] == position:
+                entry = self._task_geometry[task_id] = self._index_task_geometry(
+                    task_info, start_ordinals[i], finish_ordinals[i], geometry, row_height, task_height
                 )
+            
+            if lod:
+                drawn.append((geometry, task_info, entry))
             else:
-                self._render_single_task(
-                    geometry["x_start"], geometry["x_end"], geometry["width_task"],
-                    geometry["y_task"], task_height, row_height, task_info["fill_color"],
-                    task_info["label_text"], task_info["label_hide"], task_info["label_placement"],
-                    task_info["label_horizontal_offset"], x, width,
-                    task_id=task_id, show_ids=show_ids
-                )
+                self._render_task(task_info, geometry, task_height, row_height, x, width, show_ids)
+        
+        if lod:
+            self._render_task_summaries(drawn, task_height, row_height, x, y, width, num_rows, show_ids)
+
+    def _add_task_hit_region(self, task_info: dict, geometry: dict, task_height: float, row_height: float):
+        """Record a task's bar (or milestone circle) for the geometry map, labelled with its name and dates."""
+        start_date_str, finish_date_str = task_info["start_date_str"], task_info["finish_date_str"]
+        rect_y = geometry["y_task"] + (row_height - task_height) / 2
+        if task_info["is_milestone"]:
+            center_x = geometry["x_end"] if finish_date_str else geometry["x_start"]
+            x_start, width_task = center_x - task_height / 2, task_height
+            dates = finish_date_str or start_date_str
+        else:
+            x_start, width_task = geometry["x_start"], geometry["width_task"]
+            dates = f"{start_date_str} – {finish_date_str}"
+        self._add_hit_region("task", task_info["task_id"], x_start, rect_y, width_task, task_height,
+                             f"{task_info['task_name']}\n{dates}")
 
-    def _get_task_position(self, task_id: int, x, y, width, height, start_date, end_date, num_rows):
-        """Get the position and dimensions of a task by its ID.
+    def _render_task(self, task_info: dict, geometry: dict, task_height: float, row_height: float,
+                     x: float, width: float, show_ids: bool, label_hide: Optional[bool] = None):
+        """Render a milestone or regular task from its task info and geometry.
         
-        Returns:
-            dict with keys: x_start, x_end, y_center, row_num, is_milestone, or None if not found
+        Args:
+            label_hide: Overrides task_info["label_hide"] when given
         """
-        total_days = max((end_date - start_date).days, 1)
-        time_scale = width / total_days if total_days > 0 else width
-        row_height = height / num_rows if num_rows > 0 else height
-        task_height = row_height * 0.8
+        task_id = task_info.get("task_id")
+        if label_hide is None:
+            label_hide = task_info["label_hide"]
+        if task_info["is_milestone"]:
+            half_size = task_height / 2
+            finish_date_str = task_info["finish_date_str"]
+            center_x = geometry["x_end"] if finish_date_str else geometry["x_start"]
+            center_y = geometry["y_task"] + row_height * 0.5
+            
+            self._render_milestone(
+                center_x, center_y, half_size, task_info["fill_color"],
+                task_info["label_text"], label_hide, task_info["label_placement"],
+                task_info["label_horizontal_offset"], geometry["y_task"], row_height,
+                task_id=task_id, show_ids=show_ids
+            )
+        else:
+            self._render_single_task(
+                geometry["x_start"], geometry["x_end"], geometry["width_task"],
+                geometry["y_task"], task_height, row_height, task_info["fill_color"],
+                task_info["label_text"], label_hide, task_info["label_placement"],
+                task_info["label_horizontal_offset"], x, width,
+                task_id=task_id, show_ids=show_ids
+            )
+
+    def _lod_active(self, time_scale: float) -> bool:
+        """Return True if level-of-detail rendering applies at time_scale pixels per day."""
+        chart = self.config.general.chart
+        return chart.lod_enabled and time_scale < chart.lod_time_scale_threshold
+
+    def _lod_skips_interval(self, interval: str, time_scale: float) -> bool:
+        """Return True if gridlines or scale ticks for interval are too dense to draw."""
+        spacing = chart_geometry.AVERAGE_INTERVAL_DAYS[interval] * time_scale
+        return self._lod_active(time_scale) and spacing < self.config.general.chart.lod_min_gridline_spacing
+
+    def _render_task_summaries(self, drawn: list, task_height: float, row_height: float,
+                               x: float, y: float, width: float, num_rows: int, show_ids: bool):
+        """Render tasks at reduced detail, so the output grows with the chart's pixel size rather than the task count.
+        
+        Rows shorter than lod_min_row_height pixels are grouped into bands of consecutive rows
+        at least that tall. Bars that touch or overlap within a row (or band) become one summary
+        bar; in a band every bar is a summary bar spanning the band's rows. A bar on its own in
+        a row is rendered as usual, keeping its label only when the row is as tall as the label
+        font and the label has lod_min_label_width pixels of room (its width for inside labels,
+        the gap to the next bar in the row for outside labels). Summary bars have no label or ID
+        badge, and their tasks are flagged "summarized" in the geometry index so render_links()
+        can skip links to them.
         
-        for task in self.data.get("tasks", []):
-            if task.get("task_id") != task_id:
+        Args:
+            drawn: List of (geometry, task_info, geometry index entry or None) for the visible tasks
+            y: The absolute y position of the first row (in pixels)
+            num_rows: The number of rows in the Gantt chart
+        """
+        chart = self.config.general.chart
+        half_size = task_height / 2
+        rows_per_band = max(1, math.ceil(chart.lod_min_row_height / row_height)) if row_height > 0 else 1
+        extents = []
+        for geometry, task_info, entry in drawn:
+            if task_info["is_milestone"]:
+                center_x = geometry["x_end"] if task_info["finish_date_str"] else geometry["x_start"]
+                left, right = center_x - half_size, center_x + half_size
+            else:
+                left, right = geometry["x_start"], geometry["x_start"] + geometry["width_task"]
+            extents.append((geometry["row_num"] // rows_per_band, left, right, (geometry, task_info, entry)))
+        extents.sort(key=lambda extent: (extent[0], extent[1]))
+        
+        spans = []  # [band, left, right, members]
+        for band, left, right, member in extents:
+            if spans and spans[-1][0] == band and left <= spans[-1][2] + chart.lod_merge_gap:
+                spans[-1][2] = max(spans[-1][2], right)
+                spans[-1][3].append(member)
+            else:
+                spans.append([band, left, right, [member]])
+        
+        right_edge = x + width
+        labels_fit = row_height >= self.config.general.task_font_size
+        show_ids = show_ids and row_height >= max(chart.id_badge_font_size, 8)
+        for k, (band, left, right, members) in enumerate(spans):
+            if len(members) == 1 and rows_per_band == 1:
+                geometry, task_info, _ = members[0]
+                if not task_info["is_milestone"] and task_info["label_placement"] == "Inside":
+                    room = right - left
+                else:
+                    next_left = spans[k + 1][1] if k + 1 < len(spans) and spans[k + 1][0] == band else right_edge
+                    room = next_left - right
+                label_hide = task_info["label_hide"] or not labels_fit or room < chart.lod_min_label_width
+                self._render_task(task_info, geometry, task_height, row_height, x, width, show_ids,
+                                  label_hide=label_hide)
                 continue
-                
-            start_date_str = task.get("start_date", "")
-            finish_date_str = task.get("finish_date", "")
-            is_milestone = task.get("is_milestone", False) or (start_date_str and finish_date_str and start_date_str == finish_date_str)
-            
-            if not start_date_str and not finish_date_str:
-                return None
-            
-            date_to_use = start_date_str if start_date_str else finish_date_str
-            task_start = self._parse_internal_date(date_to_use)
-            task_finish = task_start
-            if not is_milestone and start_date_str and finish_date_str:
-                task_start = self._parse_internal_date(start_date_str)
-                task_finish = self._parse_internal_date(finish_date_str)
-            if not task_start or not task_finish:
-                return None
             
-            # Skip invalid tasks where finish date is before start date
-            if task_finish < task_start:
-                return None
-            
-            if task_finish < start_date or task_start > end_date:
-                return None
-            
-            # Skip tasks with row numbers beyond available rows (don't clamp to last row)
-            task_row = task.get("row_number", 1)
-            if task_row > num_rows:
-                return None
-            
-            row_num = task_row - 1  # Convert to 0-based index
-            x_start = x + max((task_start - start_date).days, 0) * time_scale
-            x_end = x + min((task_finish - start_date).days + 1, total_days) * time_scale
-            width_task = time_scale if task_start == task_finish else max(x_end - x_start, time_scale)
-            y_task = y + row_num * row_height
+            for _, _, entry in members:
+                if entry:
+                    entry["summarized"] = True
+            colors = {task_info["fill_color"] for _, task_info, _ in members}
+            fill_color = colors.pop() if len(colors) == 1 else chart.lod_summary_color
+            left, right = max(left, x), min(right, right_edge)
+            band_rows = min(rows_per_band, num_rows - band * rows_per_band)
+            # From the top of the first row's bar to the bottom of the last row's
+            rect_y = y + band * rows_per_band * row_height + (row_height - task_height) / 2
+            rect_height = (band_rows - 1) * row_height + task_height
+            self.dwg.add(self.dwg.rect(insert=(left, rect_y), size=(right - left, rect_height),
+                                       fill=fill_color, stroke="none"))
+
+    def _index_task_geometry(self, task_info: dict, start_ordinal: int, finish_ordinal: int,
+                             geometry: dict, row_height: float, task_height: float) -> dict:
+        """Build the geometry index entry for a rendered task.
+        
+        Args:
+            task_info: Dictionary with task information from _extract_task_info()
+            start_ordinal, finish_ordinal: Task dates as day ordinals
+            geometry: Dictionary with x_start, x_end, width_task, y_task, row_num
+            row_height: Height of a row
+            task_height: Height of task bar
             
-            if is_milestone:
-                half_size = task_height / 2
-                center_x = x_end if finish_date_str else x_start
-                center_y = y_task + row_height * 0.5
-                return {
-                    "x_start": center_x - half_size,
-                    "x_end": center_x + half_size,
-                    "y_center": center_y,
-                    "row_num": row_num,
-                    "is_milestone": True
-                }
-            else:
-                y_offset = (row_height - task_height) / 2
-                rect_y = y_task + y_offset
-                return {
-                    "x_start": x_start,
-                    "x_end": x_end,
-                    "y_center": y_task + row_height * 0.5,
-                    "row_num": row_num,
-                    "is_milestone": False
-                }
-        
-        return None
+        Returns:
+            dict with keys: x_start, x_end, y_center, row_num, is_milestone,
+            start_ordinal, finish_ordinal, start_date_str, finish_date_str
+        """
+        y_center = geometry["y_task"] + row_height * 0.5
+        if task_info["is_milestone"]:
+            half_size = task_height / 2
+            center_x = geometry["x_end"] if task_info["finish_date_str"] else geometry["x_start"]
+            x_start = center_x - half_size
+            x_end = center_x + half_size
+        else:
+            x_start = geometry["x_start"]
+            x_end = geometry["x_end"]
+        
+        return {
+            "x_start": x_start,
+            "x_end": x_end,
+            "y_center": y_center,
+            "row_num": geometry["row_num"],
+            "is_milestone": bool(task_info["is_milestone"]),
+            "start_ordinal": start_ordinal,
+            "finish_ordinal": finish_ordinal,
+            "start_date_str": task_info["start_date_str"],
+            "finish_date_str": task_info["finish_date_str"]
+        }
+
+    def _get_task_position(self, task_id: int):
+        """Get the position and dimensions of a task by its ID from the geometry index.
+        
+        The index is built by render_tasks(), so this must be called after tasks are rendered.
+        
+        Returns:
+            dict with keys: x_start, x_end, y_center, row_num, is_milestone, or None if the task
+            was not found or is not drawn on the timeline
+        """
+        return self._task_geometry.get(task_id)
 
     def _render_arrowhead(self, x: float, y: float, direction: str = "left", size: float = 5, color: str = "black"):
         """Render an arrowhead at the specified position.
@@ -775,19 +1120,85 @@ class GanttChartService(QObject):
             size: Size of arrowhead in pixels
             color: Color of the arrowhead (default: "black")
         """
+        # Corner offsets from the tip
         if direction == "left":
             # Tip at (x, y), base to the left (flipped horizontally from previous)
-            points = [(x, y), (x - size, y - size/2), (x - size, y + size/2)]
+            offsets = [(0, 0), (-size, -size/2), (-size, size/2)]
         elif direction == "right":
             # Tip at (x, y), base to the right (flipped horizontally from previous)
-            points = [(x, y), (x + size, y - size/2), (x + size, y + size/2)]
+            offsets = [(0, 0), (size, -size/2), (size, size/2)]
         elif direction == "up":
-            points = [(x, y), (x - size/2, y + size), (x + size/2, y + size)]
+            offsets = [(0, 0), (-size/2, size), (size/2, size)]
         else:  # down
-            points = [(x, y), (x - size/2, y - size), (x + size/2, y - size)]
+            offsets = [(0, 0), (-size/2, -size), (size/2, -size)]
+        
+        if self._compact_svg():
+            # One shared shape per direction and size, placed with <use>
+            shape_id = f"arrowhead-{direction}-{size:g}".replace(".", "_")
+            if not self.dwg.defines(shape_id):
+                self.dwg.define(shape_id, self.dwg.polygon(points=offsets, stroke="none", id=shape_id))
+            self.dwg.add(self.dwg.use(f"#{shape_id}", insert=(x, y), fill=color))
+            return
         
+        points = [(x + dx, y + dy) for dx, dy in offsets]
         self.dwg.add(self.dwg.polygon(points=points, fill=color, stroke="none"))
 
+    def _build_pipes_date_index(self, pipes_data: list) -> dict:
+        pipes = [self._convert_to_model_object(pipe_data, Pipe) for pipe_data in pipes_data]
+        ordinals, valid = chart_geometry.day_ordinals((pipe.date for pipe in pipes), self._parse_internal_date)
+        return {
+            "index": IntervalIndex(ordinals, ordinals, valid),
+            "items": pipes,
+            "ordinals": ordinals,
+            "valid": valid
+        }
+
+    def _build_curtains_date_index(self, curtains_data: list) -> dict:
+        curtains = [self._convert_to_model_object(curtain_data, Curtain) for curtain_data in curtains_data]
+        start_ordinals, start_valid = chart_geometry.day_ordinals(
+            (curtain.start_date for curtain in curtains), self._parse_internal_date)
+        end_ordinals, end_valid = chart_geometry.day_ordinals(
+            (curtain.end_date for curtain in curtains), self._parse_internal_date)
+        valid = start_valid & end_valid
+        # Index the span between the two dates whichever way round they were entered
+        return {
+            "index": IntervalIndex(np.minimum(start_ordinals, end_ordinals),
+                                   np.maximum(start_ordinals, end_ordinals), valid),
+            "items": curtains,
+            "start_ordinals": start_ordinals,
+            "end_ordinals": end_ordinals,
+            "valid": valid
+        }
+
+    def _date_index(self, kind: str) -> dict:
+        """Return parsed dates and the IntervalIndex for data[kind] ("tasks", "pipes" or "curtains").
+        
+        The index is rebuilt only when the list's digest from render() changes, so renders
+        that only move the timeline window skip date parsing entirely.
+        """
+        key = self._data_keys.get(kind)
+        cached = self._date_indexes.get(kind)
+        if cached is None or key is None or cached["key"] != key:
+            build = getattr(self, f"_build_{kind}_date_index")
+            cached = dict(build(self.data.get(kind, [])), key=key)
+            self._date_indexes[kind] = cached
+        return cached
+
+    def items_in_date_range(self, kind: str, start_date: datetime, end_date: datetime) -> list:
+        """Return positions in the last rendered data[kind] of items overlapping a date range.
+        
+        Args:
+            kind: "tasks", "pipes" or "curtains"
+            start_date, end_date: Range to query (inclusive)
+            
+        Returns:
+            Ascending list of positions; items with missing or invalid dates are never included
+        """
+        if kind not in ("tasks", "pipes", "curtains"):
+            raise ValueError(f"Unknown item kind: {kind}")
+        index = self._date_index(kind)["index"]
+        return index.overlapping(start_date.toordinal(), end_date.toordinal()).tolist()
+
     def render_pipes(self, x, row_y, width, row_frame_height, start_date, end_date):
         """Render vertical pipe lines at specific dates.
         
@@ -803,52 +1214,42 @@ class GanttChartService(QObject):
         if not pipes_data:
             return
         
-        total_days = max((end_date - start_date).days, 1)
-        time_scale = width / total_days if total_days > 0 else width
-        
-        for pipe_data in pipes_data:
-            # Convert dict to Pipe object if needed
-            pipe = self._convert_to_model_object(pipe_data, Pipe)
-            
-            # Validate date
-            if not is_valid_internal_date(pipe.date):
-                continue
-            
-            pipe_date = self._parse_internal_date(pipe.date)
-            if not pipe_date:
-                continue
-            
-            # Skip if pipe date is outside timeline range
-            if pipe_date < start_date or pipe_date > end_date:
-                continue
-            
-            # Calculate x position for the pipe
-            x_pos = x + (pipe_date - start_date).days * time_scale
+        dates = self._date_index("pipes")
+        axis = chart_geometry.TimelineAxis(x, width, start_date, end_date)
+        positions = dates["index"].overlapping(axis.start, axis.end).tolist()
+        pipes = [dates["items"][i] for i in positions]
+        columns = chart_geometry.pipe_columns(axis, dates["ordinals"][positions], dates["valid"][positions])
+        x_positions = columns["x_pos"].tolist()
+        
+        # Only pipes within the timeline range and visible area are drawn
+        for i in np.flatnonzero(columns["visible"]).tolist():
+            pipe = pipes[i]
+            x_pos = x_positions[i]
+            # Draw vertical line spanning all rows
+            self.dwg.add(self.dwg.line(
+                (x_pos, row_y),
+                (x_pos, row_y + row_frame_height),
+                stroke=pipe.color if pipe.color else "red",
+                stroke_width=1.0
+            ))
+            self._add_hit_region("pipe", pipe.pipe_id, x_pos, row_y, 0, row_frame_height,
+                                 "\n".join(part for part in (pipe.name, pipe.date) if part))
             
-            # Only render if within visible area
-            if x <= x_pos <= x + width:
-                # Draw vertical line spanning all rows
-                self.dwg.add(self.dwg.line(
-                    (x_pos, row_y),
-                    (x_pos, row_y + row_frame_height),
-                    stroke=pipe.color if pipe.color else "red",
-                    stroke_width=1.0
+            # Render name if provided (rotated 90 degrees along the line)
+            if pipe.name:
+                # Position name at top of the line, rotated 90 degrees
+                name_group = self.dwg.g(transform=f"translate({x_pos}, {row_y}) rotate(-90)")
+                name_group.add(self.dwg.text(
+                    pipe.name,
+                    insert=(0, 0),
+                    text_anchor="start",
+                    dominant_baseline="middle",
+                    font_size=str(self.config.general.task_font_size),
+                    font_family=self.config.general.font_family,
+                    fill=pipe.color if pipe.color else "red"
                 ))
-                
-                # Render name if provided (rotated 90 degrees along the line)
-                if pipe.name:
-                    # Position name at top of the line, rotated 90 degrees
-                    name_group = self.dwg.g(transform=f"translate({x_pos}, {row_y}) rotate(-90)")
-                    self.dwg.add(name_group)
-                    name_group.add(self.dwg.text(
-                        pipe.name,
-                        insert=(0, 0),
-                        text_anchor="start",
-                        dominant_baseline="middle",
-                        font_size=str(self.config.general.task_font_size),
-                        font_family=self.config.general.font_family,
-                        fill=pipe.color if pipe.color else "red"
-                    ))
+                # Fill the group before adding it: the streaming backend serializes on add
+                self.dwg.add(name_group)
 
     def _extract_swimlanes(self) -> list:
         """Extract and convert swimlane data to Swimlane objects.
@@ -1091,36 +1492,32 @@ class GanttChartService(QObject):
         if not curtains_data:
             return
         
-        total_days = max((end_date - start_date).days, 1)
-        time_scale = width / total_days if total_days > 0 else width
-        
-        for curtain_data in curtains_data:
-            # Convert dict to Curtain object if needed
-            curtain = self._convert_to_model_object(curtain_data, Curtain)
-            
-            # Validate dates
-            if not is_valid_internal_date(curtain.start_date) or not is_valid_internal_date(curtain.end_date):
-                continue
-            
-            curtain_start = self._parse_internal_date(curtain.start_date)
-            curtain_end = self._parse_internal_date(curtain.end_date)
-            if not curtain_start or not curtain_end:
-                continue
-            
-            # Skip if curtain is completely outside timeline range
-            if curtain_end < start_date or curtain_start > end_date:
-                continue
-            
-            # Calculate x positions for the curtain lines
-            x_start = x + (curtain_start - start_date).days * time_scale
-            x_end = x + (curtain_end - start_date).days * time_scale
-            
-            # Clamp to visible area
-            x_start_visible = max(x, min(x_start, x + width))
-            x_end_visible = max(x, min(x_end, x + width))
+        dates = self._date_index("curtains")
+        axis = chart_geometry.TimelineAxis(x, width, start_date, end_date)
+        positions = dates["index"].overlapping(axis.start, axis.end).tolist()
+        curtains = [dates["items"][i] for i in positions]
+        columns = chart_geometry.curtain_columns(axis, dates["start_ordinals"][positions],
+                                                 dates["end_ordinals"][positions], dates["valid"][positions])
+        x_starts = columns["x_start"].tolist()
+        x_ends = columns["x_end"].tolist()
+        x_starts_visible = columns["x_start_visible"].tolist()
+        x_ends_visible = columns["x_end_visible"].tolist()
+        show_fill = columns["show_fill"].tolist()
+        show_start_line = columns["show_start_line"].tolist()
+        show_end_line = columns["show_end_line"].tolist()
+        
+        # Only curtains overlapping the timeline range are drawn
+        for i in np.flatnonzero(columns["visible"]).tolist():
+            curtain = curtains[i]
+            x_start, x_end = x_starts[i], x_ends[i]
+            x_start_visible, x_end_visible = x_starts_visible[i], x_ends_visible[i]
+            self._add_hit_region("curtain", curtain.curtain_id, x_start_visible, row_y,
+                                 x_end_visible - x_start_visible, row_frame_height,
+                                 "\n".join(part for part in (curtain.name, f"{curtain.start_date} – {curtain.end_date}")
+                                           if part))
             
             # Draw filled rectangle with semi-transparent fill (less saturated)
-            if x_start_visible < x_end_visible:
+            if show_fill[i]:
                 curtain_color = curtain.color if curtain.color else "red"
                 self.dwg.add(self.dwg.rect(
                     insert=(x_start_visible, row_y),
@@ -1131,7 +1528,7 @@ class GanttChartService(QObject):
                 ))
             
             # Draw left vertical line (border)
-            if x <= x_start <= x + width:
+            if show_start_line[i]:
                 self.dwg.add(self.dwg.line(
                     (x_start, row_y),
                     (x_start, row_y + row_frame_height),
@@ -1140,7 +1537,7 @@ class GanttChartService(QObject):
                 ))
             
             # Draw right vertical line (border)
-            if x <= x_end <= x + width:
+            if show_end_line[i]:
                 self.dwg.add(self.dwg.line(
                     (x_end, row_y),
                     (x_end, row_y + row_frame_height),
@@ -1149,9 +1546,8 @@ class GanttChartService(QObject):
                 ))
             
             # Render name if provided (rotated 90 degrees along the start line)
-            if curtain.name and x <= x_start <= x + width:
+            if curtain.name and show_start_line[i]:
                 name_group = self.dwg.g(transform=f"translate({x_start}, {row_y}) rotate(-90)")
-                self.dwg.add(name_group)
                 name_group.add(self.dwg.text(
                     curtain.name,
                     insert=(0, 0),
@@ -1161,6 +1557,7 @@ class GanttChartService(QObject):
                     font_family=self.config.general.font_family,
                     fill=curtain.color if curtain.color else "red"
                 ))
+                self.dwg.add(name_group)
 
     def _build_task_map(self) -> dict:
         """Build a task map for quick lookup using task_id as key.
@@ -1419,7 +1816,7 @@ class GanttChartService(QObject):
         }
     
     def _get_task_date_strings(self, from_task_id: int, to_task_id: int) -> dict:
-        """Get finish/start date strings for link validation.
+        """Get finish/start date strings for link validation from the geometry index.
         
         Args:
             from_task_id: Source task ID
@@ -1428,23 +1825,12 @@ class GanttChartService(QObject):
         Returns:
             Dictionary with from_finish_date_str, to_start_date_str
         """
-        from_task_data = None
-        to_task_data = None
-        for task in self.data.get("tasks", []):
-            task_id = task.get("task_id")
-            if task_id == from_task_id:
-                from_task_data = task
-            if task_id == to_task_id:
-                to_task_data = task
-        
-        from_finish_date_str = from_task_data.get("finish_date", "") if from_task_data else ""
-        to_start_date_str = to_task_data.get("start_date", "") if to_task_data else ""
+        from_task = self._task_geometry.get(from_task_id)
+        to_task = self._task_geometry.get(to_task_id)
         
         return {
-            "from_finish_date_str": from_finish_date_str,
-            "to_start_date_str": to_start_date_str,
-            "from_task_data": from_task_data,
-            "to_task_data": to_task_data
+            "from_finish_date_str": from_task["finish_date_str"] if from_task else "",
+            "to_start_date_str": to_task["start_date_str"] if to_task else ""
         }
     
     def _should_suppress_same_row_link(self, from_finish_date_str: str, to_start_date_str: str,
@@ -1498,6 +1884,10 @@ class GanttChartService(QObject):
         }
         if stroke_dasharray:
             line_attrs["stroke_dasharray"] = stroke_dasharray
+        if self._hit_link is not None:
+            link_id, label = self._hit_link
+            self._add_hit_region("link", link_id, min(start[0], end[0]), min(start[1], end[1]),
+                                 abs(end[0] - start[0]), abs(end[1] - start[1]), label)
         return self.dwg.line(start, end, **line_attrs)
     
     def _add_origin_marker(self, origin_x: float, origin_y: float, line_color: str):
@@ -1763,26 +2153,27 @@ class GanttChartService(QObject):
             stroke_dasharray = style_props["stroke_dasharray"]
             link_routing = style_props["link_routing"]
             
-            # Get task positions
-            from_task = self._get_task_position(link.from_task_id, x, row_y, width, row_frame_height, start_date, end_date, num_rows)
-            to_task = self._get_task_position(link.to_task_id, x, row_y, width, row_frame_height, start_date, end_date, num_rows)
+            # Get task positions from the geometry index built by render_tasks()
+            from_task = self._get_task_position(link.from_task_id)
+            to_task = self._get_task_position(link.to_task_id)
             
             if not from_task or not to_task:
                 continue  # Skip if either task not found
+            if from_task.get("summarized") or to_task.get("summarized"):
+                continue  # Level-of-detail mode: an end is inside a summary bar
             
             # Get task date strings for validation
             date_info = self._get_task_date_strings(link.from_task_id, link.to_task_id)
             from_finish_date_str = date_info["from_finish_date_str"]
             to_start_date_str = date_info["to_start_date_str"]
             
-            if not date_info["from_task_data"] or not date_info["to_task_data"]:
-                continue
-            
             # Calculate connection points
             connection_info = self._calculate_connection_points(
                 from_task, to_task, link_routing, row_height
             )
             
+            # Segments drawn for this link go into the geometry map
+            self._hit_link = (link.link_id, f"Task {link.from_task_id} → Task {link.to_task_id}")
             # Render link based on same row or different rows
             if connection_info["same_row"]:
                 self._render_same_row_link(
@@ -1802,6 +2193,7 @@ class GanttChartService(QObject):
                     from_task["row_num"], to_task["row_num"],
                     line_color, stroke_dasharray
                 )
+        self._hit_link = None
 
     def _build_scale_configs(self) -> list:
         """Build list of visible scale configurations.
@@ -1904,7 +2296,7 @@ class GanttChartService(QObject):
                                        stroke_width=self.config.general.frame_border_width_light))
     
     def _render_horizontal_gridlines(self, x: float, row_y: float, width: float,
-                                    row_frame_height: float, num_rows: int):
+                                    row_frame_height: float, num_rows: int, time_scale: float = None):
         """Render horizontal gridlines between rows.
         
         Args:
@@ -1913,15 +2305,23 @@ class GanttChartService(QObject):
             width: Width of gridlines
             row_frame_height: Height of row frame
             num_rows: Number of rows
+            time_scale: Pixels per day; in level-of-detail mode gridlines closer than
+                lod_min_gridline_spacing are skipped
         """
         if not self._get_frame_config("horizontal_gridlines", False):
             return
+        if (time_scale is not None and self._lod_active(time_scale) and num_rows > 0
+                and row_frame_height / num_rows < self.config.general.chart.lod_min_gridline_spacing):
+            return
         
+        self._begin_line_batch()
         for i in range(1, num_rows):  # Exclude first and last to avoid overlapping row frame border
             y_pos = row_y + i * (row_frame_height / num_rows)
-            self.dwg.add(self.dwg.line((x, y_pos), (x + width, y_pos), stroke="lightgrey", stroke_width=0.5))
+            self._draw_line((x, y_pos), (x + width, y_pos), "lightgrey", 0.5)
+        self._end_line_batch()
     
-    def _render_row_numbers(self, x: float, row_y: float, row_frame_height: float, num_rows: int):
+    def _render_row_numbers(self, x: float, row_y: float, row_frame_height: float, num_rows: int,
+                            time_scale: float = None):
         """Render row numbers if enabled.
         
         Args:
@@ -1929,11 +2329,16 @@ class GanttChartService(QObject):
             row_y: Y position of row frame
             row_frame_height: Height of row frame
             num_rows: Number of rows
+            time_scale: Pixels per day; in level-of-detail mode row numbers are skipped when
+                rows are shorter than their font
         """
         if not self._get_frame_config("show_row_numbers", False):
             return
         
         row_height = row_frame_height / num_rows if num_rows > 0 else row_frame_height
+        if (time_scale is not None and self._lod_active(time_scale)
+                and row_height < self.config.general.row_number_font_size):
+            return
         for i in range(num_rows):
             # Calculate Y position using the same alignment factor as scales
             row_top = row_y + i * row_height
@@ -1993,134 +2398,208 @@ class GanttChartService(QObject):
         
         vertical_gridline_intervals = self._get_vertical_gridline_intervals()
         
-        # Render gridlines for each enabled interval
+        # Render gridlines for each enabled interval at the period boundaries within the chart
+        table = chart_geometry.calendar_boundaries(start_date.toordinal(), end_date.toordinal())
+        self._begin_line_batch()
         for interval in vertical_gridline_intervals:
+            if self._lod_skips_interval(interval, time_scale):
+                continue
             line_weight = interval_line_weights.get(interval, 1.0)
-            current_date = self.next_period(start_date, interval)
-            prev_x = x
-            while current_date <= end_date:
-                x_pos = x + (current_date - start_date).days * time_scale
+            for x_pos in (x + (table.boundaries(interval) - table.start) * time_scale).tolist():
                 if x <= x_pos <= x + width:
-                    self.dwg.add(self.dwg.line((x_pos, row_y), (x_pos, row_y + row_frame_height),
-                                               stroke="lightgrey", stroke_width=line_weight))
-                prev_x = x_pos
-                current_date = self.next_period(current_date, interval)
+                    self._draw_line((x_pos, row_y), (x_pos, row_y + row_frame_height), "lightgrey", line_weight)
+        self._end_line_batch()
 
-    def render_scales_and_rows(self, x, y, width, height, start_date, end_date):
-        """Render time scales, row frame, gridlines, and row numbers.
-        
-        Also renders swimlanes, pipes, curtains, and tasks.
-        
-        Args:
-            x: X position
-            y: Y position
-            width: Width
-            height: Height
-            start_date: Timeline start date
-            end_date: Timeline end date
-            
-        Returns:
-            Tuple of (row_y, row_frame_height)
-        """
-        # Calculate time scale
-        total_days = max((end_date - start_date).days, 1)
-        time_scale = width / total_days if total_days > 0 else width
+    def _begin_line_batch(self):
+        """Start collecting _draw_line() segments if gridline batching (chart.batch_gridlines) is on."""
+        self._line_batch = {} if self.config.general.chart.batch_gridlines else None
 
-        # Build scale configurations
-        scale_configs = self._build_scale_configs()
-        
-        # Calculate heights
-        row_frame_height, scale_heights = self._calculate_scale_heights(scale_configs, height)
-        
-        # Render scale backgrounds
-        row_y = self._render_scale_backgrounds(x, y, width, scale_heights, start_date, end_date, time_scale)
-        
-        # Get number of rows
-        num_rows = self._get_frame_config("num_rows", 1)
-        
-        # Render row frame borders
-        self._render_row_frame_borders(x, row_y, width, row_frame_height, scale_configs)
+    def _draw_line(self, start: tuple, end: tuple, stroke: str, stroke_width: float):
+        """Draw a gridline or tick, as its own <line> or as part of the current batch."""
+        if self._line_batch is None:
+            self.dwg.add(self.dwg.line(start, end, stroke=stroke, stroke_width=stroke_width))
+            return
+        (x1, y1), (x2, y2) = start, end  # Full precision, so paths paint exactly like the lines
+        if x1 == x2:
+            segment = f"M{x1},{y1}V{y2}"
+        elif y1 == y2:
+            segment = f"M{x1},{y1}H{x2}"
+        else:
+            segment = f"M{x1},{y1}L{x2},{y2}"
+        self._line_batch.setdefault((stroke, stroke_width), []).append(segment)
 
-        # Render swimlane background tints (behind gridlines and task bars)
-        self.render_swimlane_backgrounds(x, row_y, width, row_frame_height, num_rows)
+    def _end_line_batch(self):
+        """Emit one <path> per (stroke, stroke_width) for the segments collected since _begin_line_batch()."""
+        batch, self._line_batch = self._line_batch, None
+        for (stroke, stroke_width), segments in (batch or {}).items():
+            self.dwg.add(self.dwg.path(d="".join(segments), fill="none",
+                                       stroke=stroke, stroke_width=stroke_width))
 
-        # Render horizontal gridlines
-        self._render_horizontal_gridlines(x, row_y, width, row_frame_height, num_rows)
-        
-        # Render row numbers
-        self._render_row_numbers(x, row_y, row_frame_height, num_rows)
-        
-        # Render vertical gridlines
-        self._render_vertical_gridlines(x, row_y, width, row_frame_height, start_date, end_date, time_scale)
+    def _render_header_footer_layer(self):
+        """Render header, footer, and inner frame."""
+        self.render_header()
+        self.render_footer()
+        self.render_inner_frame()
 
-        # Render swimlanes (after gridlines, before pipes/curtains/tasks)
-        self.render_swimlanes(x, row_y, width, row_frame_height, num_rows)
+    def _render_scales_layer(self, layout: dict):
+        """Render time scales and row frame borders."""
+        self._render_scale_backgrounds(layout["x"], layout["y"], layout["width"], layout["scale_heights"],
+                                       layout["start_date"], layout["end_date"], layout["time_scale"])
+        self._render_row_frame_borders(layout["x"], layout["row_y"], layout["width"],
+                                       layout["row_frame_height"], layout["scale_configs"])
+
+    def _render_gridlines_layer(self, layout: dict):
+        """Render horizontal gridlines, row numbers, and vertical gridlines."""
+        x, row_y, width = layout["x"], layout["row_y"], layout["width"]
+        row_frame_height, num_rows = layout["row_frame_height"], layout["num_rows"]
+        self._render_horizontal_gridlines(x, row_y, width, row_frame_height, num_rows, layout["time_scale"])
+        self._render_row_numbers(x, row_y, row_frame_height, num_rows, layout["time_scale"])
+        self._render_vertical_gridlines(x, row_y, width, row_frame_height,
+                                        layout["start_date"], layout["end_date"], layout["time_scale"])
+
+    def _digest(self, value) -> str:
+        """Return a stable hash of a JSON-like value, used as a render layer cache key."""
+        return hashlib.sha1(canonical_json(value)).hexdigest()
+
+    def _render_settings(self) -> dict:
+        """Collect the config and frame values that affect every render layer."""
+        return {
+            "chart": dataclasses.asdict(self.config.general.chart),
+            "chart_date_config": dataclasses.asdict(self.config.general.chart_date_config),
+            "show_ids_on_chart": getattr(self.config.general, "show_ids_on_chart", False),
+            "frame_config": self.data["frame_config"]
+        }
+
+    def _render_layer(self, name: str, key: str, render_fn, state_attrs: tuple = (), phase: str = None):
+        """Render a layer, or splice it in from the layer cache when its inputs are unchanged.
         
-        # Render pipes and curtains (after swimlanes, before tasks)
-        self.render_pipes(x, row_y, width, row_frame_height, start_date, end_date)
-        self.render_curtains(x, row_y, width, row_frame_height, start_date, end_date)
+        A layer's output is everything it adds to the drawing, to the ID badge overlay and to
+        the geometry map, plus any service attributes in state_attrs that later layers depend on.
         
-        self.render_tasks(x, row_y, width, row_frame_height, start_date, end_date, num_rows)
+        Args:
+            name: Layer name (one cache slot per layer)
+            key: Hash of every input that affects the layer
+            render_fn: Callable that renders the layer into self.dwg
+            state_attrs: Names of attributes set by render_fn that must be restored on a cache hit
+            phase: Profiler phase the layer is timed under (defaults to name)
+        """
+        with self.profiler.phase(phase or name) as phase_stats:
+            if not self.config.general.chart.render_layer_cache:
+                self._layer_cache.pop(name, None)  # Release markup cached while the cache was on
+                render_fn()
+            elif self._render_cached_layer(name, key, render_fn, state_attrs):
+                phase_stats["cache_hits"] += 1
+
+    def _render_cached_layer(self, name: str, key: str, render_fn, state_attrs: tuple) -> bool:
+        """Render a layer through the layer cache; return True on a cache hit.
         
-        # Return row frame position and height for use by other rendering functions
-        return row_y, row_frame_height
+        With the streaming backend the layer is still written as it is drawn; the markup of
+        each flush is collected as well, so a cached layer costs about its size in bytes.
+        Layers that would take the cached markup over chart.render_layer_cache_max_mb are
+        not cached.
+        """
+        streaming = isinstance(self.dwg, StreamingDrawing)
+        cached = self._layer_cache.get(name)
+        hit = bool(cached and cached["key"] == key)
+        if hit:
+            if streaming:
+                self.dwg.extend(cached["elements"], cached["references"], cached["element_count"])
+                self.dwg.flush()
+            else:
+                self.dwg.elements.extend(cached["elements"])
+            self.id_badge_overlay.elements.extend(cached["overlay"])
+            self._hit_regions.extend(cached["hit_regions"])
+            for attr, value in cached["state"].items():
+                setattr(self, attr, value)
+            return True
+        references = set()  # <defs> ids the layer's markup refers to
+        if streaming:
+            self._layer_cache.pop(name, None)  # Its room counts towards the limit for the new markup
+            cached_size = sum(entry["size"] for entry in self._layer_cache.values())
+            self.dwg.start_capture(int(self.config.general.chart.render_layer_cache_max_mb * 1024 * 1024) - cached_size)
+            document_references, self.dwg.references = self.dwg.references, references
+            count_start = self.dwg.element_count
+        elements_start = len(self.dwg.elements)
+        overlay_start = len(self.id_badge_overlay.elements)
+        regions_start = len(self._hit_regions)
+        render_fn()
+        if streaming:
+            elements = self.dwg.end_capture()
+            self.dwg.references = document_references | references
+            if elements is None:
+                return False
+            size = sum(len(markup) for markup in elements)
+        else:
+            elements, size = self.dwg.elements[elements_start:], 0
+        self._layer_cache[name] = {
+            "key": key,
+            "elements": elements,
+            "element_count": self.dwg.element_count - count_start if streaming else len(elements),
+            "size": size,
+            "references": references,
+            "overlay": self.id_badge_overlay.elements[overlay_start:],
+            "hit_regions": self._hit_regions[regions_start:],
+            "state": {attr: getattr(self, attr) for attr in state_attrs}
+        }
+        return False
 
-    def next_period(self, date, interval):
-        if interval == "days":
-            return date + timedelta(days=1)
-        elif interval == "weeks":
-            days_to_monday = (7 - date.weekday()) % 7 or 7
-            return date + timedelta(days=days_to_monday)
-        elif interval == "months":
-            year, month = date.year, date.month + 1
-            if month > 12:
-                month = 1
-                year += 1
-            return datetime(year, month, 1)
-        elif interval == "years":
-            return datetime(date.year + 1, 1, 1)
-        return date
+    def clear_layer_cache(self):
+        """Discard all cached render layers and documents so the next render regenerates everything."""
+        self._layer_cache = {}
+        self._svg_definitions = SvgDefinitions()  # Only cached layers refer to old definitions
+        self.render_cache.clear()
 
+    def _scale_label_keys(self, interval: str, period_starts: np.ndarray) -> list:
+        """Return the calendar field each period's scale label is made from."""
+        if interval == "years":
+            return chart_geometry.years(period_starts).tolist()
+        if interval == "months":
+            return chart_geometry.months(period_starts).tolist()
+        if interval == "weeks":
+            return chart_geometry.iso_weeks(period_starts).tolist()
+        return chart_geometry.weekdays(period_starts).tolist()
 
     def render_scale_interval(self, x, y, width, height, start_date, end_date, interval, time_scale):
-        current_date = start_date
+        table = chart_geometry.calendar_boundaries(start_date.toordinal(), end_date.toordinal())
+        period_starts, period_ends = table.periods(interval)
+        x_ends = (x + (period_ends - table.start) * time_scale).tolist()
+        label_keys = self._scale_label_keys(interval, period_starts)
+        draw_ticks = not self._lod_skips_interval(interval, time_scale)
         prev_x = x
-        while current_date <= end_date:
-            next_date = self.next_period(current_date, interval)
-            x_pos = x + (next_date - start_date).days * time_scale
+        self._begin_line_batch()
+        for x_pos, key in zip(x_ends, label_keys):
             interval_width = x_pos - prev_x if x_pos <= x + width else (x + width) - prev_x
             # Draw increment border only if it doesn't align with scale border edges
-            if x < x_pos < x + width:
-                self.dwg.add(self.dwg.line((x_pos, y), (x_pos, y + height),
-                                           stroke="grey", stroke_width=0.5))
+            if draw_ticks and x < x_pos < x + width:
+                self._draw_line((x_pos, y), (x_pos, y + height), "grey", 0.5)
             if prev_x < x + width and x_pos > x:
                 label_x = (max(x, prev_x) + min(x + width, x_pos)) / 2
                 label_y = y + height * self.config.general.scale_vertical_alignment_factor
                 label = ""
                 if interval == "years":
                     if interval_width >= self.config.general.full_label_width:
-                        label = current_date.strftime("%Y")
+                        label = f"{key}"
                     elif interval_width >= self.config.general.short_label_width:
-                        label = current_date.strftime("%y")
+                        label = f"{key % 100:02d}"
                 elif interval == "months":
+                    # calendar names follow the current locale, like strftime("%b")
                     if interval_width >= self.config.general.full_label_width:
-                        label = current_date.strftime("%b")
+                        label = calendar.month_abbr[key]
                     elif interval_width >= self.config.general.short_label_width:
-                        label = current_date.strftime("%b")[0]
+                        label = calendar.month_abbr[key][0]
                 elif interval == "weeks":
-                    week_num = current_date.isocalendar()[1]
                     if interval_width >= self.config.general.short_label_width:
-                        label = f"{week_num:02d}"
+                        label = f"{key:02d}"
                 elif interval == "days":
                     if interval_width >= self.config.general.full_label_width:
-                        label = current_date.strftime("%a")
+                        label = calendar.day_abbr[key]
                     elif interval_width >= self.config.general.short_label_width:
-                        label = current_date.strftime("%a")[0]
+                        label = calendar.day_abbr[key][0]
                 if label:
                     self.dwg.add(self.dwg.text(label, insert=(label_x, label_y), text_anchor="middle",
                                                font_size=str(self.config.general.scale_font_size), font_family=self.config.general.font_family, dominant_baseline="middle"))
             prev_x = x_pos
-            current_date = next_date
+        self._end_line_batch()  # Ticks go on after the labels; they sit on interval edges
 
     def _wrap_text_to_lines(self, text: str, max_width: float, font_size: int = 10) -> list:
         """Wrap text into lines that fit within max_width, handling both explicit line breaks and word wrapping.
@@ -2135,65 +2614,7 @@ class GanttChartService(QObject):
         """
         if font_size is None:
             font_size = self.config.general.note_font_size
-        # Create font metrics for note font
-        note_font = QFont(self.config.general.font_family, font_size)
-        note_font_metrics = QFontMetrics(note_font)
-        
-        lines = []
-        # First, split by explicit line breaks (newlines)
-        paragraphs = text.split('\n')
-        
-        for paragraph in paragraphs:
-            if not paragraph.strip():
-                # Empty line - preserve it
-                lines.append("")
-                continue
-            
-            # Word wrap this paragraph
-            words = paragraph.split()
-            current_line = ""
-            
-            for word in words:
-                # Test if adding this word would exceed max_width
-                test_line = current_line + (" " if current_line else "") + word
-                test_width = note_font_metrics.horizontalAdvance(test_line)
-                
-                if test_width <= max_width:
-                    # Word fits - add it to current line
-                    current_line = test_line
-                else:
-                    # Word doesn't fit
-                    if current_line:
-                        # Save current line and start new one
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Single word is too long - truncate it
-                        # Find how many characters fit
-                        char_count = 0
-                        for i in range(1, len(word) + 1):
-                            if note_font_metrics.horizontalAdvance(word[:i]) <= max_width:
-                                char_count = i
-                            else:
-                                break
-                        if char_count > 0:
-                            lines.append(word[:char_count])
-                            # Handle remaining characters in next iteration
-                            remaining = word[char_count:]
-                            if remaining:
-                                # Recursively handle remaining part
-                                remaining_lines = self._wrap_text_to_lines(remaining, max_width, font_size)
-                                lines.extend(remaining_lines)
-                        else:
-                            # Even first character doesn't fit - add empty line and skip
-                            lines.append("")
-                        current_line = ""
-            
-            # Add remaining line if any
-            if current_line:
-                lines.append(current_line)
-        
-        return lines
+        return self.text_metrics.wrap(text, max_width, self.config.general.font_family, font_size)
 
     def render_notes(self):
         """Render notes (rectangles with text) above all other elements.
@@ -2205,10 +2626,9 @@ class GanttChartService(QObject):
         if not notes:
             return
         
-        # Create font for notes
-        note_font = QFont(self.config.general.font_family, self.config.general.note_font_size)
-        note_font_metrics = QFontMetrics(note_font)
-        line_height = note_font_metrics.height()
+        # Font metrics for notes
+        line_height = self.text_metrics.line_height(self.config.general.font_family,
+                                                    self.config.general.note_font_size)
         
         for note_data in notes:
             # Convert dict to Note object if needed
@@ -2217,6 +2637,8 @@ class GanttChartService(QObject):
             if not note or not note.text:
                 continue
             
+            label = note.text if len(note.text) <= 200 else note.text[:199] + "…"
+            self._add_hit_region("note", note.note_id, note.x, note.y, note.width, note.height, label)
             # Render rectangle with border and background
             self.dwg.add(self.dwg.rect(
                 insert=(note.x, note.y),
@@ -2278,16 +2700,63 @@ class GanttChartService(QObject):
                 ))
 
     def render(self):
-        os.makedirs(self.output_folder, exist_ok=True)
         # Create overlay group for ID badges (rendered last to appear on top)
         self.id_badge_overlay = self.dwg.g()
-        self.render_outer_frame()  # Background only
-        self.render_header()
-        self.render_footer()
-        self.render_inner_frame()
-        self.render_single_timeline()
-        self.render_notes()  # Render notes after all other elements
-        # Add ID badge overlay last (before border) so badges float above all other artifacts
-        self.dwg.add(self.id_badge_overlay)
-        self.render_outer_frame_border()  # Border rendered last
-        self.dwg.save()
\ No newline at end of file
+        with self.profiler.phase("layout"):
+            layout = self._calculate_timeline_layout()
+        settings_key, data_keys = self._settings_key, self._data_keys
+        
+        with self.profiler.phase("header_footer"):
+            self.render_outer_frame()  # Background only, outside the content group
+        content_start = self._begin_content_group()
+        self._render_layer("header_footer", settings_key, self._render_header_footer_layer)
+        if layout:
+            x, row_y, width = layout["x"], layout["row_y"], layout["width"]
+            row_frame_height, num_rows = layout["row_frame_height"], layout["num_rows"]
+            start_date, end_date = layout["start_date"], layout["end_date"]
+            self._render_layer("scales", settings_key, lambda: self._render_scales_layer(layout))
+            # Swimlane background tints (behind gridlines and task bars)
+            self._render_layer("swimlane_backgrounds", settings_key + data_keys["swimlanes"],
+                               lambda: self.render_swimlane_backgrounds(x, row_y, width, row_frame_height, num_rows),
+                               phase="swimlanes")
+            self._render_layer("gridlines", settings_key, lambda: self._render_gridlines_layer(layout))
+            # Swimlanes (after gridlines, before pipes/curtains/tasks)
+            self._render_layer("swimlanes", settings_key + data_keys["swimlanes"],
+                               lambda: self.render_swimlanes(x, row_y, width, row_frame_height, num_rows))
+            self._render_layer("pipes", settings_key + data_keys["pipes"],
+                               lambda: self.render_pipes(x, row_y, width, row_frame_height, start_date, end_date))
+            self._render_layer("curtains", settings_key + data_keys["curtains"],
+                               lambda: self.render_curtains(x, row_y, width, row_frame_height, start_date, end_date))
+            # Tasks also produce the ID badges and the geometry index used by links
+            self._render_layer("tasks", settings_key + data_keys["tasks"],
+                               lambda: self.render_tasks(x, row_y, width, row_frame_height,
+                                                         start_date, end_date, num_rows),
+                               state_attrs=("_task_geometry",))
+            # Links after tasks, using row frame position and height
+            self._render_layer("links", settings_key + data_keys["tasks"] + data_keys["links"],
+                               lambda: self.render_links(x, row_y, width, row_frame_height, start_date, end_date))
+        self._render_layer("notes", settings_key + data_keys["notes"], self.render_notes)  # Notes after all other elements
+        with self.profiler.phase("overlay"):
+            # Add ID badge overlay last (before border) so badges float above all other artifacts
+            self.dwg.add(self.id_badge_overlay)
+            self.render_outer_frame_border()  # Border rendered last
+        self._end_content_group(content_start)  # Outside the phases: regrouping changes svgwrite's element count
+
+    def _begin_content_group(self) -> int:
+        """Start the <g id="chart-content"> that holds everything except the background.
+        
+        Returns:
+            Index of the group's first element (svgwrite backend)
+        """
+        if isinstance(self.dwg, StreamingDrawing):
+            self.dwg.begin_group(id=CHART_CONTENT_ID)
+        return len(self.dwg.elements)
+
+    def _end_content_group(self, content_start: int):
+        if isinstance(self.dwg, StreamingDrawing):
+            self.dwg.end_group()
+        else:
+            content = self.dwg.g(id=CHART_CONTENT_ID)
+            content.elements = self.dwg.elements[content_start:]
+            del self.dwg.elements[content_start:]
+            self.dwg.add(content)
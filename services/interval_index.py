@@ -0,0 +1,57 @@
+# File: interval_index.py
+"""Static index over closed integer intervals for date-range queries.
+
+Intervals are day ordinals [start, end]. They are grouped by span length in powers of two,
+and each group is kept sorted by start. For a query [lo, hi] a group's candidates are the
+intervals starting in [lo - longest span in the group, hi], found with two binary searches
+(np.searchsorted), and only those are checked against lo. Grouping by span keeps one long
+interval from widening the search window for all the short ones.
+"""
+import numpy as np
+
+
+class IntervalIndex:
+    """Finds the intervals that overlap a range without scanning every interval.
+
+    Positions returned by overlapping() refer to the arrays the index was built from and
+    come back in ascending order, so callers keep their original drawing order.
+    """
+
+    def __init__(self, starts, ends, valid=None):
+        """
+        Args:
+            starts, ends: Interval bounds as integers (inclusive); ends before starts are skipped
+            valid: Optional mask of intervals to include
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        keep = ends >= starts
+        if valid is not None:
+            keep &= np.asarray(valid, dtype=bool)
+        self.size = len(starts)
+        positions = np.flatnonzero(keep)
+        spans = ends[positions] - starts[positions]
+        # frexp exponent: spans 0 -> 1, 1-2 -> 2, 3-6 -> 3, ... (spans + 1 in [2**(e-1), 2**e))
+        levels = np.frexp((spans + 1).astype(np.float64))[1]
+        self._groups = []  # (sorted starts, ends, positions, longest span)
+        for level in np.unique(levels).tolist():
+            in_level = levels == level
+            members = positions[in_level]
+            order = np.argsort(starts[members], kind="stable")
+            members = members[order]
+            self._groups.append((starts[members], ends[members], members, int(spans[in_level].max())))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def overlapping(self, lo: int, hi: int) -> np.ndarray:
+        """Return the positions of intervals that overlap [lo, hi], in ascending order."""
+        parts = []
+        for group_starts, group_ends, members, longest in self._groups:
+            first = np.searchsorted(group_starts, lo - longest, side="left")
+            last = np.searchsorted(group_starts, hi, side="right")
+            if first < last:
+                parts.append(members[first:last][group_ends[first:last] >= lo])
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(parts))
@@ -0,0 +1,213 @@
+# File: raster_export.py
+"""Rasterize chart SVGs to images without any window (used by the display window and batch CLI)."""
+from PyQt5.QtCore import QByteArray, QRectF, QSize, Qt
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtSvg import QSvgRenderer
+from typing import Union
+import numpy as np
+import struct
+import zlib
+from services.gantt_chart_service import CHART_CONTENT_ID
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+DEFAULT_TILE_HEIGHT = 512  # Rows rasterized per tile by export_png_tiled
+SCREEN_DPI = 96  # SVG user units are CSS pixels
+
+
+def load_svg_renderer(svg: Union[QSvgRenderer, bytes, str]) -> QSvgRenderer:
+    """Return a renderer for an SVG given as a loaded QSvgRenderer, document bytes or file path.
+
+    Raises:
+        ValueError: If the SVG could not be parsed
+    """
+    if isinstance(svg, QSvgRenderer):
+        renderer = svg
+    elif isinstance(svg, (bytes, bytearray)):
+        renderer = QSvgRenderer(QByteArray(bytes(svg)))
+    else:
+        renderer = QSvgRenderer(svg)
+    if not renderer.isValid():
+        raise ValueError("Invalid SVG document")
+    return renderer
+
+
+def render_chart(renderer: QSvgRenderer, painter: QPainter, bounds: QRectF, transparent: bool = True):
+    """Paint a chart SVG so the whole document fills bounds.
+
+    With transparent set only the chart-content group is painted, leaving out the white
+    background; it is placed where it sits in the full document. SVGs without the group
+    (written by older versions) are painted whole.
+    """
+    content = renderer.boundsOnElement(CHART_CONTENT_ID) if transparent and renderer.elementExists(CHART_CONTENT_ID) else None
+    if content is None or content.isEmpty():
+        renderer.render(painter, bounds)
+        return
+    view = renderer.viewBoxF()
+    scale_x = bounds.width() / view.width()
+    scale_y = bounds.height() / view.height()
+    renderer.render(painter, CHART_CONTENT_ID,
+                    QRectF(bounds.x() + (content.x() - view.x()) * scale_x,
+                           bounds.y() + (content.y() - view.y()) * scale_y,
+                           content.width() * scale_x, content.height() * scale_y))
+
+
+def render_svg_image(svg: Union[QSvgRenderer, bytes, str], transparent: bool = True, size: QSize = None) -> QImage:
+    """Render an SVG document to an ARGB32 image.
+
+    Args:
+        svg: Loaded QSvgRenderer, SVG document bytes, or file path
+        transparent: Leave out the chart's white background so the image has a transparent background
+        size: Image size (default: the SVG's own size)
+
+    Returns:
+        The rendered QImage
+
+    Raises:
+        ValueError: If the SVG could not be parsed
+    """
+    renderer = load_svg_renderer(svg)
+    image = QImage(size or renderer.defaultSize(), QImage.Format_ARGB32)
+    image.fill(Qt.transparent if transparent else Qt.white)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    render_chart(renderer, painter, QRectF(0, 0, image.width(), image.height()), transparent)
+    painter.end()
+    return image
+
+
+class PngStreamWriter:
+    """Write an 8-bit RGB or RGBA PNG a band of rows at a time.
+
+    Rows are filtered and compressed as they arrive, so only the compressor state and the
+    current band are held in memory however tall the image is.
+    """
+
+    def __init__(self, path: str, width: int, height: int, alpha: bool = True, dpi: float = None,
+                 compression: int = 6, chunk_size: int = 1 << 16):
+        self.width = width
+        self.height = height
+        self.channels = 4 if alpha else 3
+        self.rows_written = 0
+        self._chunk_size = chunk_size
+        self._pending = []  # Compressed bytes not yet written as an IDAT chunk
+        self._pending_size = 0
+        self._compressor = zlib.compressobj(compression)
+        self._file = open(path, "wb")
+        self._file.write(PNG_SIGNATURE)
+        color_type = 6 if alpha else 2
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0))
+        if dpi:
+            pixels_per_meter = round(dpi / 0.0254)
+            self._write_chunk(b"pHYs", struct.pack(">IIB", pixels_per_meter, pixels_per_meter, 1))
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
+
+    def _add_compressed(self, data: bytes):
+        if data:
+            self._pending.append(data)
+            self._pending_size += len(data)
+        if self._pending_size >= self._chunk_size:
+            self._flush_idat()
+
+    def _flush_idat(self):
+        if self._pending:
+            self._write_chunk(b"IDAT", b"".join(self._pending))
+            self._pending = []
+            self._pending_size = 0
+
+    def write_rows(self, rows: np.ndarray):
+        """Append rows given as a uint8 array of shape (row count, width * channels)."""
+        if rows.shape[1] != self.width * self.channels:
+            raise ValueError(f"Expected rows of {self.width * self.channels} bytes, got {rows.shape[1]}")
+        if self.rows_written + rows.shape[0] > self.height:
+            raise ValueError("More rows than the image height")
+        # Sub filter (type 1): each byte minus the same channel of the previous pixel
+        filtered = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+        filtered[:, 0] = 1
+        filtered[:, 1:self.channels + 1] = rows[:, :self.channels]
+        np.subtract(rows[:, self.channels:], rows[:, :-self.channels], out=filtered[:, self.channels + 1:])
+        self._add_compressed(self._compressor.compress(filtered.tobytes()))
+        self.rows_written += rows.shape[0]
+
+    def close(self):
+        """Finish the image; raises ValueError if fewer rows than the height were written."""
+        if self._file is None:
+            return
+        try:
+            if self.rows_written != self.height:
+                raise ValueError(f"Wrote {self.rows_written} of {self.height} rows")
+            self._add_compressed(self._compressor.flush())
+            self._flush_idat()
+            self._write_chunk(b"IEND", b"")
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._file = None
+
+
+def _image_rows(image: QImage, alpha: bool) -> np.ndarray:
+    """Return an image's pixels as PNG byte rows (RGBA, or RGB without alpha)."""
+    image = image.convertToFormat(QImage.Format_RGBA8888 if alpha else QImage.Format_RGB888)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    rows = np.frombuffer(bits, dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+    # Copy: the view points into the temporary image
+    return rows[:, :image.width() * (4 if alpha else 3)].copy()
+
+
+def export_png_tiled(svg: Union[QSvgRenderer, bytes, str], path: str, scale: float = 1.0, transparent: bool = True,
+                     tile_height: int = DEFAULT_TILE_HEIGHT, compression: int = 6) -> QSize:
+    """Rasterize an SVG document to a PNG file one tile at a time.
+
+    Each tile is a full-width band of tile_height rows, rendered with QSvgRenderer.render(painter,
+    bounds) offset to the band and streamed into the PNG, so peak memory is one band rather than
+    the whole image. Suitable for wall charts far larger than a single QImage can hold.
+
+    Args:
+        svg: Loaded QSvgRenderer (as the display window holds), SVG document bytes, or file path
+        path: PNG file to write
+        scale: Output pixels per SVG pixel; the PNG records 96 * scale DPI
+        transparent: Leave out the chart's white background and write an RGBA PNG (RGB otherwise)
+        tile_height: Rows rendered per tile
+        compression: zlib level 0-9
+
+    Returns:
+        Size of the written image
+
+    Raises:
+        ValueError: If the SVG could not be parsed or scale is not positive
+    """
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+    renderer = load_svg_renderer(svg)
+    default_size = renderer.defaultSize()
+    width = max(1, round(default_size.width() * scale))
+    height = max(1, round(default_size.height() * scale))
+    tile_height = max(1, min(tile_height, height))
+    with PngStreamWriter(path, width, height, alpha=transparent, dpi=SCREEN_DPI * scale,
+                         compression=compression) as writer:
+        tile = QImage(width, tile_height, QImage.Format_ARGB32_Premultiplied)
+        for top in range(0, height, tile_height):
+            rows = min(tile_height, height - top)
+            tile.fill(Qt.transparent if transparent else Qt.white)
+            painter = QPainter(tile)
+            painter.setRenderHint(QPainter.Antialiasing)
+            # Whole document mapped to the output size, shifted so this band lands at the top
+            render_chart(renderer, painter, QRectF(0, -top, width, height), transparent)
+            painter.end()
+            band = _image_rows(tile, transparent)
+            writer.write_rows(band[:rows])
+    return QSize(width, height)
@@ -0,0 +1,206 @@
+# File: render_cache.py
+"""Content-addressed cache of rendered SVG documents.
+
+Renders are keyed by a hash of their canonical JSON inputs (project payload plus the settings
+that affect output), so rendering the same inputs again - toggling a setting back, reloading
+a workbook - returns the stored SVG instead of drawing it again.
+"""
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+
+# Logging is configured centrally in utils/logging_config.py
+
+
+def _canonical_default(value):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    if isinstance(value, Path):
+        return str(value)
+    return str(value)
+
+
+def canonical_json(value) -> bytes:
+    """Serialize a JSON-like value deterministically: sorted keys, no whitespace, UTF-8.
+
+    Dataclasses, dates, sets, enums and paths are converted to stable JSON equivalents, so
+    equal inputs always produce identical bytes regardless of dict insertion order.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+                      default=_canonical_default).encode("utf-8")
+
+
+def content_key(value) -> str:
+    """Return the SHA-256 hex digest of value's canonical JSON."""
+    return hashlib.sha256(canonical_json(value)).hexdigest()
+
+
+class RenderCache:
+    """LRU cache of SVG bytes bounded by total size, optionally backed by a folder on disk.
+
+    Memory holds the most recently used documents up to max_bytes. With disk_folder set, every
+    stored document is also written there as <key>.svg (pruned oldest-first beyond
+    max_disk_bytes), so results survive restarts; disk hits are promoted back into memory.
+    A document can carry side-car bytes (such as its geometry map), stored next to it as
+    <key>.json and counted towards the same limits. Safe to use from several threads.
+    """
+
+    def __init__(self, max_bytes: int, disk_folder: str = None, max_disk_bytes: int = None):
+        self.max_bytes = max_bytes
+        self.disk_folder = disk_folder
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()  # key -> (svg bytes, side-car bytes or None), least recently used first
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0, "stores": 0, "evictions": 0}
+
+    def get(self, key: str) -> bytes:
+        """Return the SVG stored under key, or None (counted as a miss)."""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> tuple:
+        """Return (svg bytes, side-car bytes or None) stored under key, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                self._stats["memory_hits"] += 1
+                return entry
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+            self._store_memory(key, entry)
+        return entry
+
+    def put(self, key: str, svg_bytes: bytes, sidecar: bytes = None):
+        """Store a rendered SVG under key, with optional side-car bytes returned by get_entry()."""
+        entry = (svg_bytes, sidecar)
+        with self._lock:
+            self._stats["stores"] += 1
+            self._store_memory(key, entry)
+        self._write_disk(key, entry)
+
+    @staticmethod
+    def _entry_size(entry: tuple) -> int:
+        svg_bytes, sidecar = entry
+        return len(svg_bytes) + (len(sidecar) if sidecar else 0)
+
+    def _store_memory(self, key: str, entry: tuple):
+        size = self._entry_size(entry)
+        if size > self.max_bytes:
+            return  # Would evict everything else; disk (if any) still has it
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= self._entry_size(previous)
+        self._entries[key] = entry
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= self._entry_size(evicted)
+            self._stats["evictions"] += 1
+
+    def _disk_path(self, key: str, extension: str = ".svg") -> str:
+        return os.path.join(self.disk_folder, key + extension)
+
+    def _read_disk(self, key: str) -> tuple:
+        if not self.disk_folder:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                svg_bytes = f.read()
+            os.utime(path)  # Mark as recently used for pruning
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logging.warning(f"Failed to read render cache file {path}: {e}")
+            return None
+        try:
+            with open(self._disk_path(key, ".json"), "rb") as f:
+                sidecar = f.read()
+        except OSError:
+            sidecar = None
+        return svg_bytes, sidecar
+
+    def _write_disk(self, key: str, entry: tuple):
+        if not self.disk_folder:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(self.disk_folder, exist_ok=True)
+            svg_bytes, sidecar = entry
+            # Side-car first: a document on disk is only read back with the side-car it was stored with
+            for file_path, content in ((self._disk_path(key, ".json"), sidecar), (path, svg_bytes)):
+                if content is None:
+                    if os.path.exists(file_path):
+                        os.remove(file_path)  # Stale side-car of an earlier entry
+                    continue
+                temp_path = f"{file_path}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(content)
+                os.replace(temp_path, file_path)
+            if self.max_disk_bytes is not None:
+                self._prune_disk()
+        except OSError as e:
+            logging.warning(f"Failed to write render cache file {path}: {e}")
+
+    def _prune_disk(self):
+        """Delete the least recently used cache files until the folder fits max_disk_bytes."""
+        files = {}  # key -> [mtime of the SVG, total size, paths]
+        for entry in os.scandir(self.disk_folder):
+            key, extension = os.path.splitext(entry.name)
+            if entry.is_file() and extension in (".svg", ".json"):
+                stat = entry.stat()
+                item = files.setdefault(key, [None, 0, []])
+                if extension == ".svg":
+                    item[0] = stat.st_mtime
+                item[1] += stat.st_size
+                item[2].append(entry.path)
+        total = sum(size for _, size, _ in files.values())
+        # Side-cars without a document go first
+        for mtime, size, paths in sorted(files.values(), key=lambda item: (item[0] is not None, item[0] or 0)):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                for path in paths:
+                    os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus the current number of entries and bytes held in memory."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._size
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop the in-memory entries (files on disk are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
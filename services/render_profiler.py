@@ -0,0 +1,147 @@
+# File: render_profiler.py
+"""Per-phase instrumentation for chart renders.
+
+A render is split into named phases (header_footer, scales, gridlines, tasks, ...). For each
+phase the profiler records wall time, the number of elements added to the drawing and, when
+memory tracking is on, the peak memory allocated while the phase ran (tracemalloc). A phase
+entered more than once in a render, such as swimlane backgrounds and swimlane labels,
+accumulates into one entry. A phase entered inside another (file writes timed by TimedWriter
+while the streaming backend draws) is taken out of the enclosing phase, so phases add up.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Optional
+import json
+import logging
+import os
+import time
+import tracemalloc
+
+# Logging is configured centrally in utils/logging_config.py
+
+
+class RenderProfiler:
+    """Collects phase statistics for one render at a time.
+
+    Args:
+        count_elements: Returns the number of elements drawn so far in the current render
+    """
+
+    def __init__(self, count_elements: Callable[[], int]):
+        self.count_elements = count_elements
+        self.track_memory = False
+        self._phases = {}
+        self._start = None
+        self._started_tracing = False
+        self._open = []  # [seconds, elements] of phases nested in each open phase, innermost last
+
+    def start(self, track_memory: bool = False):
+        """Begin profiling a render, discarding any unfinished one."""
+        self.stop_memory_tracking()
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._phases = {}
+        self._open = []
+        self._start = time.perf_counter()
+
+    @property
+    def running(self) -> bool:
+        return self._start is not None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as phase name; yields the phase's stats dict."""
+        stats = self._phases.get(name)
+        if stats is None:
+            stats = self._phases[name] = {"seconds": 0.0, "elements": 0, "calls": 0, "cache_hits": 0}
+            if self.track_memory:
+                stats["peak_memory_bytes"] = 0
+        if not self.running:
+            yield stats
+            return
+        # Memory is tracked for outermost phases only; resetting the peak would lose the enclosing one's
+        track_memory = self.track_memory and not self._open
+        nested = [0.0, 0]
+        self._open.append(nested)
+        elements_before = self.count_elements()
+        if track_memory:
+            if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        phase_start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            seconds = time.perf_counter() - phase_start
+            elements = self.count_elements() - elements_before
+            self._open.pop()
+            if self._open:
+                self._open[-1][0] += seconds
+                self._open[-1][1] += elements
+            stats["seconds"] += seconds - nested[0]
+            stats["elements"] += elements - nested[1]
+            stats["calls"] += 1
+            if track_memory:
+                peak = tracemalloc.get_traced_memory()[1] - memory_before
+                stats["peak_memory_bytes"] = max(stats["peak_memory_bytes"], peak)
+
+    def finish(self, **info) -> Optional[dict]:
+        """End the render and return its stats, or None if no render was being profiled.
+
+        Args:
+            **info: Extra top-level fields to include (backend, task count, ...)
+        """
+        if not self.running:
+            return None
+        total_seconds = time.perf_counter() - self._start
+        stats = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "total_seconds": total_seconds,
+            "elements": sum(phase["elements"] for phase in self._phases.values()),
+        }
+        stats.update(info)
+        if self.track_memory:
+            stats["peak_memory_bytes"] = max((phase["peak_memory_bytes"] for phase in self._phases.values()),
+                                             default=0)
+        stats["phases"] = self._phases
+        self.stop_memory_tracking()
+        self._phases = {}
+        self._start = None
+        return stats
+
+    def stop_memory_tracking(self):
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+class TimedWriter:
+    """Text stream wrapper that times each write() as a profiler phase.
+
+    For I/O that happens while a render is drawing, such as the streaming backend writing
+    elements straight to the SVG file.
+    """
+
+    def __init__(self, stream, profiler: RenderProfiler, phase: str = "save"):
+        self.stream = stream
+        self.profiler = profiler
+        self.phase = phase
+
+    def write(self, text: str) -> int:
+        with self.profiler.phase(self.phase):
+            return self.stream.write(text)
+
+
+def append_render_stats(path: str, stats: dict):
+    """Append one render's stats as a JSON line to path."""
+    try:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(stats) + "\n")
+    except OSError as e:
+        logging.error(f"Failed to append render stats to {path}: {e}")
@@ -0,0 +1,126 @@
+# File: render_worker.py
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+import copy
+import logging
+
+# Logging is configured centrally in utils/logging_config.py
+
+
+class RenderWorker(QObject):
+    """Runs GanttChartService.generate_svg on the render thread and reports the result."""
+    render_finished = pyqtSignal(int, object, str, object)  # generation, svg bytes (or None), svg path, geometry map
+
+    def __init__(self, service):
+        super().__init__()
+        self.service = service
+        self._svg_bytes = None
+        self._svg_path = ""
+        self._geometry_map = None
+        # Both objects live on the render thread, so these are direct connections
+        self.service.svg_bytes_generated.connect(self._on_svg_bytes_generated)
+        self.service.svg_generated.connect(self._on_svg_generated)
+        self.service.geometry_map_generated.connect(self._on_geometry_map_generated)
+
+    @pyqtSlot(int, object, object)
+    def render(self, generation: int, data: dict, config):
+        self._svg_bytes = None
+        self._svg_path = ""
+        self._geometry_map = None
+        self.service.config = config  # Snapshot taken by request_render; rebuilds what its settings changed
+        try:
+            self.service.generate_svg(data)
+        except Exception as e:
+            logging.error(f"Render {generation} failed: {e}", exc_info=True)
+        self.render_finished.emit(generation, self._svg_bytes, self._svg_path, self._geometry_map)
+
+    @pyqtSlot(bytes)
+    def _on_svg_bytes_generated(self, svg_bytes: bytes):
+        self._svg_bytes = svg_bytes
+
+    @pyqtSlot(str)
+    def _on_svg_generated(self, svg_path: str):
+        self._svg_path = svg_path
+
+    @pyqtSlot(object)
+    def _on_geometry_map_generated(self, geometry_map):
+        self._geometry_map = geometry_map
+
+
+class RenderController(QObject):
+    """Renders charts on a worker QThread with "latest request wins" coalescing.
+
+    Each request gets a generation number. While a render is running, newer requests replace
+    any request still waiting, so a burst of edits triggers at most one more render. Results
+    whose generation is older than the latest request are dropped instead of being displayed.
+
+    Exposes the same svg_generated / svg_bytes_generated / geometry_map_generated signals as
+    GanttChartService, emitted on the GUI thread (the geometry map first).
+    """
+    svg_generated = pyqtSignal(str)
+    svg_bytes_generated = pyqtSignal(bytes)
+    geometry_map_generated = pyqtSignal(object)
+    _render_requested = pyqtSignal(int, object, object)  # generation, data, config snapshot
+
+    def __init__(self, service):
+        super().__init__()
+        self._app_config = service.config  # Live config, edited on the GUI thread
+        self._generation = 0
+        self._pending = None  # (generation, data, config) waiting for the worker, latest request only
+        self._busy = False
+
+        self._thread = QThread()
+        self._thread.setObjectName("render-thread")
+        service.moveToThread(self._thread)
+        self._worker = RenderWorker(service)
+        self._worker.moveToThread(self._thread)
+        self._render_requested.connect(self._worker.render)
+        self._worker.render_finished.connect(self._on_render_finished)
+        self._thread.start()
+
+    @pyqtSlot(dict)
+    def request_render(self, data: dict):
+        """Queue a render of data, replacing any request that has not started yet."""
+        self._generation += 1
+        if data and "frame_config" in data:
+            # to_json() returns the live FrameConfig __dict__; snapshot it for the render thread
+            data = dict(data)
+            data["frame_config"] = dict(data["frame_config"])
+        self._pending = (self._generation, data, self._snapshot_config())
+        if not self._busy:
+            self._dispatch()
+
+    def _snapshot_config(self):
+        """Copy of the render settings the GUI edits in place, so the render thread never reads them mid-edit."""
+        general = copy.copy(self._app_config.general)
+        general.chart = copy.deepcopy(general.chart)
+        general.chart_date_config = copy.deepcopy(general.chart_date_config)
+        config = copy.copy(self._app_config)
+        config.general = general
+        return config
+
+    def _dispatch(self):
+        generation, data, config = self._pending
+        self._pending = None
+        self._busy = True
+        self._render_requested.emit(generation, data, config)
+
+    @pyqtSlot(int, object, str, object)
+    def _on_render_finished(self, generation: int, svg_bytes, svg_path: str, geometry_map):
+        self._busy = False
+        if self._pending:
+            self._dispatch()
+        if generation != self._generation:
+            logging.debug(f"Dropping stale render {generation} (latest is {self._generation})")
+            return
+        self.geometry_map_generated.emit(geometry_map)
+        if svg_bytes:
+            self.svg_bytes_generated.emit(svg_bytes)
+        else:
+            self.svg_generated.emit(svg_path)
+
+    @pyqtSlot()
+    def shutdown(self):
+        """Stop the render thread, waiting for the current render to finish."""
+        self._pending = None
+        self._thread.quit()
+        self._thread.wait()
@@ -0,0 +1,123 @@
+# File: spatial_index.py
+"""Static multi-level uniform-grid index over axis-aligned boxes for point queries.
+
+Boxes are listed under every grid cell they touch, as (cell, box) pairs sorted by cell, so
+the boxes near a point are found with two binary searches (np.searchsorted) per row of cells
+and only those few are checked exactly. The finest cells are as wide and as tall as a typical
+box. A box spanning more than MAX_CELLS_PER_AXIS cells across goes to a grid whose cells are
+LEVEL_SCALE times wider, and likewise for height, independently: a link running down many rows
+is listed in narrow columns of tall cells, so a query only meets the lines near it. Every
+box is listed at most MAX_CELLS_PER_AXIS squared times, and a query visits a few cells in
+each of the (few) grids in use.
+"""
+import numpy as np
+
+MAX_CELLS_PER_AXIS = 8
+LEVEL_SCALE = 8  # Cell size ratio between consecutive grid levels along an axis
+
+
+class GridIndex:
+    """Finds the boxes that contain (or come within a tolerance of) a point.
+
+    Positions returned by at() refer to the arrays the index was built from.
+    """
+
+    def __init__(self, xs, ys, widths, heights):
+        """
+        Args:
+            xs, ys, widths, heights: Box origins and sizes; zero sizes (lines) are allowed
+        """
+        self.x0 = np.asarray(xs, dtype=np.float64)
+        self.y0 = np.asarray(ys, dtype=np.float64)
+        self.x1 = self.x0 + np.maximum(np.asarray(widths, dtype=np.float64), 0.0)
+        self.y1 = self.y0 + np.maximum(np.asarray(heights, dtype=np.float64), 0.0)
+        self.size = len(self.x0)
+        self._grids = []  # (cell width, cell height, columns, sorted cell ids, box positions)
+        if not self.size:
+            self._origin = (0.0, 0.0)
+            return
+
+        self._origin = (float(self.x0.min()), float(self.y0.min()))
+        cell_width, column_levels = self._axis_levels(self.x0, self.x1, self._origin[0])
+        cell_height, row_levels = self._axis_levels(self.y0, self.y1, self._origin[1])
+        grid_keys = column_levels * 64 + row_levels
+        for grid_key in np.unique(grid_keys).tolist():
+            boxes = np.flatnonzero(grid_keys == grid_key)
+            self._grids.append(self._build_grid(boxes, cell_width * LEVEL_SCALE ** (grid_key // 64),
+                                                cell_height * LEVEL_SCALE ** (grid_key % 64)))
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _cells_of(values, origin: float, cell_size):
+        return np.floor((values - origin) / cell_size).astype(np.int64)
+
+    def _axis_levels(self, starts: np.ndarray, ends: np.ndarray, origin: float) -> tuple:
+        """Pick the finest cell size along an axis and the level each box needs along it.
+
+        Returns:
+            (finest cell size, level per box); a box at level L spans at most MAX_CELLS_PER_AXIS
+            cells of size finest * LEVEL_SCALE ** L
+        """
+        extents = ends - starts
+        extents = extents[extents > 0]  # Lines have no extent across
+        cell_size = float(np.median(extents)) if len(extents) else 1.0
+        levels = np.zeros(len(starts), dtype=np.int64)
+        over = np.arange(len(starts))
+        while len(over):
+            sizes = cell_size * float(LEVEL_SCALE) ** levels[over]
+            spans = self._cells_of(ends[over], origin, sizes) - self._cells_of(starts[over], origin, sizes) + 1
+            over = over[spans > MAX_CELLS_PER_AXIS]
+            levels[over] += 1
+        return cell_size, levels
+
+    def _build_grid(self, boxes: np.ndarray, cell_width: float, cell_height: float) -> tuple:
+        first_columns = self._cells_of(self.x0[boxes], self._origin[0], cell_width)
+        last_columns = self._cells_of(self.x1[boxes], self._origin[0], cell_width)
+        first_rows = self._cells_of(self.y0[boxes], self._origin[1], cell_height)
+        last_rows = self._cells_of(self.y1[boxes], self._origin[1], cell_height)
+        column_counts = last_columns - first_columns + 1
+        counts = column_counts * (last_rows - first_rows + 1)
+        columns = int(last_columns.max()) + 1
+
+        # Expand each box into its cells: pair k of a box is its k-th cell, row-major
+        pair_boxes = np.repeat(np.arange(len(boxes)), counts)
+        offsets = np.arange(len(pair_boxes)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_columns = first_columns[pair_boxes] + offsets % column_counts[pair_boxes]
+        cell_rows = first_rows[pair_boxes] + offsets // column_counts[pair_boxes]
+        cell_ids = cell_rows * columns + cell_columns
+        order = np.argsort(cell_ids, kind="stable")
+        return cell_width, cell_height, columns, cell_ids[order], boxes[pair_boxes[order]]
+
+    def at(self, x: float, y: float, tolerance: float = 0.0) -> np.ndarray:
+        """Return the positions of boxes within tolerance of (x, y), in descending order.
+
+        Boxes drawn later have higher positions, so the first position is the topmost box.
+        """
+        parts = []
+        for cell_width, cell_height, columns, cell_ids, members in self._grids:
+            first_column = max(int((x - tolerance - self._origin[0]) // cell_width), 0)
+            last_column = min(int((x + tolerance - self._origin[0]) // cell_width), columns - 1)
+            first_row = max(int((y - tolerance - self._origin[1]) // cell_height), 0)
+            last_row = int((y + tolerance - self._origin[1]) // cell_height)
+            if first_column > last_column or last_row < first_row:
+                continue
+            if last_row - first_row >= MAX_CELLS_PER_AXIS:
+                # Tolerance covers many rows: one slice over all of them, the exact check sorts it out
+                ranges = [(first_row * columns + first_column, last_row * columns + last_column)]
+            else:
+                ranges = [(row * columns + first_column, row * columns + last_column)
+                          for row in range(first_row, last_row + 1)]
+            for first_cell, last_cell in ranges:
+                lo = cell_ids.searchsorted(first_cell, side="left")
+                hi = cell_ids.searchsorted(last_cell, side="right")
+                if lo < hi:
+                    parts.append(members[lo:hi])
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.concatenate(parts)
+        near = ((self.x0[candidates] <= x + tolerance) & (self.x1[candidates] >= x - tolerance) &
+                (self.y0[candidates] <= y + tolerance) & (self.y1[candidates] >= y - tolerance))
+        # A box is listed under every cell it touches, so a hit can turn up more than once
+        return np.unique(candidates[near])[::-1]
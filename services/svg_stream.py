@@ -0,0 +1,313 @@
+# File: svg_stream.py
+"""Streaming SVG writer with the subset of the svgwrite.Drawing API used by GanttChartService.
+
+Elements are serialized to strings as soon as they are added and written to the output
+stream in batches, instead of being kept as an element tree until the end of the render.
+The markup matches svgwrite's output byte for byte: attributes sorted by name, underscores
+in keyword names turned into hyphens, None and empty values dropped, and ElementTree
+escaping.
+
+In compact mode (an SvgDefinitions is passed in) consecutive top-level elements that share
+their presentation attributes are wrapped in a <g> carrying those attributes once, and
+shapes registered with define() go into <defs> so they can be referenced with <use>. The
+body is then held until close(), because <defs> has to come before the elements using it.
+"""
+from typing import Optional, Set, TextIO
+
+SVG_NAMESPACES = {
+    "xmlns": "http://www.w3.org/2000/svg",
+    "xmlns:ev": "http://www.w3.org/2001/xml-events",
+    "xmlns:xlink": "http://www.w3.org/1999/xlink",
+}
+
+# Inherited presentation attributes that compact mode hoists onto a shared <g>
+# (dominant-baseline is not inherited in SVG 1.1, so it stays on the element)
+INHERITED_ATTRIBUTES = ("fill", "fill-opacity", "font-family", "font-size", "stroke",
+                        "stroke-dasharray", "stroke-linecap", "stroke-width", "text-anchor")
+
+
+def _escape_attrib(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if "\"" in text:
+        text = text.replace("\"", "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+def _escape_text(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _attribute_strings(attribs: dict) -> dict:
+    """Convert attribute values to strings, dropping None and empty values as svgwrite does."""
+    values = {}
+    for key, value in attribs.items():
+        if value is None:
+            continue
+        value = str(value)
+        if value:
+            values[key] = value
+    return values
+
+
+def _start_tag(name: str, values: dict) -> str:
+    return "<" + " ".join([name] + [f'{key}="{_escape_attrib(value)}"' for key, value in sorted(values.items())])
+
+
+def _attribs(extra: dict, **attribs) -> dict:
+    """Merge positional attributes with keyword extras, mapping stroke_width -> stroke-width."""
+    for key, value in extra.items():
+        attribs[key.rstrip("_").replace("_", "-")] = value
+    return attribs
+
+
+class SvgDefinitions:
+    """Shapes written to <defs> in compact mode.
+
+    Kept by the caller across renders, so markup cached from an earlier render still refers
+    to definitions that exist; retain() drops the ones nothing refers to any more.
+    """
+
+    def __init__(self):
+        self.elements = {}  # element id -> markup
+
+    def tostring(self, element_ids: Set[str] = None) -> str:
+        """Serialize the definitions, or only those in element_ids, sorted by id.
+
+        Sorted rather than in the order they were defined, which depends on earlier renders, so
+        identical charts give identical documents.
+        """
+        elements = (markup for element_id, markup in sorted(self.elements.items())
+                    if element_ids is None or element_id in element_ids)
+        return f'<defs>{"".join(elements)}</defs>'
+
+    def retain(self, element_ids: Set[str]):
+        """Drop every definition not in element_ids."""
+        self.elements = {element_id: markup for element_id, markup in self.elements.items()
+                         if element_id in element_ids}
+
+
+class StreamElement:
+    """A leaf element. Attributes are fixed at creation and serialized on demand."""
+    __slots__ = ("name", "values", "text")
+
+    def __init__(self, name: str, attribs: dict, text: Optional[str] = None):
+        self.name = name
+        self.values = _attribute_strings(attribs)
+        self.text = "" if text is None else _escape_text(str(text))
+
+    def tostring(self, omit: tuple = ()) -> str:
+        values = self.values
+        if omit:
+            values = {key: value for key, value in values.items() if key not in omit}
+        start = _start_tag(self.name, values)
+        if self.text:
+            return f"{start}>{self.text}</{self.name}>"
+        return f"{start} />"
+
+    def inherited_style(self) -> tuple:
+        """The element's inheritable presentation attributes as (name, value) pairs."""
+        return tuple((key, self.values[key]) for key in INHERITED_ATTRIBUTES if key in self.values)
+
+
+class StreamGroup:
+    """A <g> element; children are serialized as they are added."""
+
+    def __init__(self, attribs: dict):
+        self.values = _attribute_strings(attribs)
+        self.elements = []  # Serialized children
+
+    def add(self, element):
+        self.elements.append(element.tostring())
+        return element
+
+    def tostring(self) -> str:
+        start = _start_tag("g", self.values)
+        if not self.elements:
+            return f"{start} />"
+        return f"{start}>{''.join(self.elements)}</g>"
+
+    def inherited_style(self) -> tuple:
+        return ()
+
+
+class StreamingDrawing:
+    """Drop-in replacement for svgwrite.Drawing that writes elements to a text stream.
+
+    elements holds serialized top-level elements that have not been written yet. They are
+    written once flush_threshold is reached, and between start_capture() and end_capture()
+    also collected as a few large strings (the render layer cache keeps a layer's output
+    that way). close() writes the remainder and the closing tag.
+    Passing definitions turns on compact mode; only the definitions in references (the ids
+    passed to use() or extend()) are written. element_count counts top-level elements added,
+    including flushed ones.
+    """
+
+    def __init__(self, stream: TextIO, filename: str = None, size: tuple = ("100%", "100%"),
+                 flush_threshold: int = 1000, definitions: SvgDefinitions = None):
+        self.stream = stream
+        self.filename = filename
+        self.flush_threshold = flush_threshold
+        self.definitions = definitions
+        self._capture = None  # Markup flushed since start_capture(), or None
+        self._capture_left = 0  # Characters start_capture() still allows
+        self.elements = []
+        self.element_count = 0
+        self.references = set()  # Ids of <defs> elements referenced by <use>
+        self._run = []          # Compact mode: consecutive elements sharing _run_style
+        self._run_style = ()
+        self._body = []         # Compact mode: flushed markup held back until close()
+        width, height = size
+        root = dict(SVG_NAMESPACES, baseProfile="full", version="1.1", width=width, height=height)
+        self._header = ('<?xml version="1.0" encoding="utf-8" ?>\n'
+                        + _start_tag("svg", _attribute_strings(root)) + ">")
+        if definitions is None:
+            stream.write(self._header + "<defs />")
+
+    @property
+    def compact(self) -> bool:
+        return self.definitions is not None
+
+    def add(self, element):
+        self.element_count += 1
+        if self.compact:
+            style = element.inherited_style()
+            if style != self._run_style:
+                self.end_run()
+                self._run_style = style
+            self._run.append(element)
+        else:
+            self.elements.append(element.tostring())
+            if len(self.elements) >= self.flush_threshold:
+                self.flush()
+        return element
+
+    def extend(self, markup: list, references: Set[str] = (), element_count: int = None):
+        """Add already serialized top-level elements (such as a cached layer's output).
+
+        Args:
+            references: Ids of <defs> elements the markup refers to
+            element_count: Elements the markup holds, if strings hold more than one
+        """
+        self.end_run()
+        self.elements.extend(markup)
+        self.references.update(references)
+        self.element_count += len(markup) if element_count is None else element_count
+
+    def begin_group(self, **extra):
+        """Open a <g> wrapping every element added until end_group() (not counted as an element)."""
+        self.end_run()
+        self.elements.append(_start_tag("g", _attribs(extra)) + ">")
+
+    def end_group(self):
+        """Close the <g> opened by begin_group()."""
+        self.end_run()
+        self.elements.append("</g>")
+
+    def end_run(self):
+        """Serialize the pending compact-mode run into elements; two or more share one <g>."""
+        run, style = self._run, self._run_style
+        if not run:
+            return
+        if len(run) > 1 and style:
+            keys = tuple(key for key, _ in style)
+            inner = "".join(element.tostring(omit=keys) for element in run)
+            self.elements.append(f"{_start_tag('g', dict(style))}>{inner}</g>")
+        else:
+            self.elements.extend(element.tostring() for element in run)
+        self._run = []
+        self._run_style = ()
+
+    def flush(self):
+        """Write pending elements to the stream."""
+        self.end_run()
+        if self.elements:
+            markup = "".join(self.elements)
+            if self._capture is not None:
+                self._capture_left -= len(markup)
+                if self._capture_left < 0:
+                    self._capture = None  # Over the limit: drop what was collected
+                else:
+                    self._capture.append(markup)
+            if self.compact:
+                self._body.append(markup)
+            else:
+                self.stream.write(markup)
+            self.elements = []
+
+    def start_capture(self, limit: int):
+        """Collect the markup written from now on, up to limit characters; see end_capture()."""
+        self.flush()  # Pending elements are not part of the capture
+        self._capture = []
+        self._capture_left = limit
+
+    def end_capture(self) -> Optional[list]:
+        """Stop collecting; return the markup written since start_capture(), or None if it exceeded the limit."""
+        self.flush()
+        markup, self._capture = self._capture, None
+        return markup
+
+    def close(self):
+        """Write pending elements and finish the document."""
+        self.flush()
+        if self.compact:
+            self.stream.write(self._header + self.definitions.tostring(self.references))
+            self.stream.write("".join(self._body))
+            self._body = []
+        self.stream.write("</svg>")
+
+    def defines(self, element_id: str) -> bool:
+        """Return True if element_id is already in <defs> (compact mode only)."""
+        return self.compact and element_id in self.definitions.elements
+
+    def define(self, element_id: str, element):
+        """Add element (created with id=element_id) to <defs> (compact mode only) and return it."""
+        self.definitions.elements.setdefault(element_id, element.tostring())
+        return element
+
+    def g(self, **extra) -> StreamGroup:
+        return StreamGroup(_attribs(extra))
+
+    def line(self, start=(0, 0), end=(0, 0), **extra) -> StreamElement:
+        return StreamElement("line", _attribs(extra, x1=start[0], y1=start[1], x2=end[0], y2=end[1]))
+
+    def rect(self, insert=(0, 0), size=(1, 1), rx=None, ry=None, **extra) -> StreamElement:
+        return StreamElement("rect", _attribs(extra, x=insert[0], y=insert[1], width=size[0], height=size[1],
+                                              rx=rx, ry=ry))
+
+    def circle(self, center=(0, 0), r=1, **extra) -> StreamElement:
+        return StreamElement("circle", _attribs(extra, cx=center[0], cy=center[1], r=r))
+
+    def polygon(self, points=(), **extra) -> StreamElement:
+        points = " ".join("%s,%s" % (x, y) for x, y in points)
+        return StreamElement("polygon", _attribs(extra, points=points))
+
+    def path(self, d=None, **extra) -> StreamElement:
+        return StreamElement("path", _attribs(extra, d=d))
+
+    def text(self, text, insert=None, **extra) -> StreamElement:
+        attribs = _attribs(extra)
+        if insert is not None:
+            attribs["x"], attribs["y"] = insert[0], insert[1]
+        return StreamElement("text", attribs, text)
+
+    def use(self, href: str, insert=(0, 0), **extra) -> StreamElement:
+        """Reference a <defs> element by "#id" at insert."""
+        self.references.add(href.lstrip("#"))
+        return StreamElement("use", _attribs(extra, x=insert[0], y=insert[1], **{"xlink:href": href}))
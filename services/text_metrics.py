@@ -0,0 +1,359 @@
+# File: text_metrics.py
+"""Text measurement for chart rendering.
+
+Widths come from a metrics provider: Qt's QFontMetrics (the reference, which needs a
+QGuiApplication) or a pure-Python table of per-font glyph advances measured once with Qt and
+stored on disk, so charts can be rendered in worker processes and scripts without Qt.
+"""
+from itertools import accumulate
+from typing import Iterable
+import json
+import logging
+import os
+
+# Logging is configured centrally in utils/logging_config.py
+
+ELLIPSIS = "…"
+METRICS_PROVIDERS = ("auto", "qt", "table")
+FONT_METRICS_TABLE_VERSION = 1
+# Printable ASCII and Latin-1, plus the punctuation labels commonly contain
+KERNING_CHARACTERS = "".join(chr(code) for code in range(32, 127))
+TABLE_CHARACTERS = (KERNING_CHARACTERS + "".join(chr(code) for code in range(160, 256))
+                    + ELLIPSIS + "–—‘’“”•€")
+
+
+class QtFontMetrics:
+    """Reference metrics from QFontMetrics; requires a QGuiApplication."""
+
+    def __init__(self, family: str, size: int):
+        from PyQt5.QtGui import QFont, QFontMetrics
+        self.font = QFont(family, size)
+        self._metrics = QFontMetrics(self.font)
+        self.horizontal_advance = self._metrics.horizontalAdvance
+
+    def height(self) -> int:
+        return self._metrics.height()
+
+
+class TableFontMetrics:
+    """Metrics summed from a table of fractional glyph advances and kerning pairs; no Qt needed.
+
+    Widths are rounded to whole pixels like Qt's, and can still differ from them by a pixel
+    where shaping goes beyond pair kerning. Characters missing from the table use default_advance.
+    """
+
+    def __init__(self, advances: dict, default_advance: float, line_height: float,
+                 kerning: dict = None, scale: float = 1.0):
+        self._advances = {char: advance * scale for char, advance in advances.items()}
+        self._kerning = {pair: adjustment * scale for pair, adjustment in (kerning or {}).items()}
+        self._default = default_advance * scale
+        self._height = line_height * scale
+
+    def horizontal_advance(self, text: str) -> int:
+        advances, default = self._advances, self._default
+        width = sum(advances.get(char, default) for char in text)
+        kerning = self._kerning
+        if kerning and len(text) > 1:
+            width += sum(kerning.get(text[i:i + 2], 0.0) for i in range(len(text) - 1))
+        return round(width)
+
+    def height(self) -> int:
+        return round(self._height)
+
+
+def qt_available() -> bool:
+    """True if a QGuiApplication exists in this process, so Qt metrics can be used."""
+    try:
+        from PyQt5.QtGui import QGuiApplication
+    except ImportError:
+        return False
+    return QGuiApplication.instance() is not None
+
+
+def build_font_metrics_table(families: Iterable[str], sizes: Iterable[int],
+                             characters: str = TABLE_CHARACTERS) -> dict:
+    """Measure glyph advances with Qt for each (family, size); requires a QGuiApplication.
+
+    Advances are fractional (QFontMetricsF), so summing them reproduces Qt's rounded string
+    widths far more closely than summing whole-pixel glyph widths would. Kerning is stored
+    for the pairs of printable ASCII characters that Qt adjusts.
+
+    Returns:
+        Table dictionary: {"version", "fonts": {family: {size: {"height", "advances", "kerning"}}}}
+    """
+    from PyQt5.QtGui import QFont, QFontMetricsF
+    fonts = {}
+    for family in families:
+        for size in sizes:
+            metrics = QFontMetricsF(QFont(family, size))
+            advances = {char: metrics.horizontalAdvance(char) for char in characters}
+            kerning = {}
+            for first in KERNING_CHARACTERS:
+                for second in KERNING_CHARACTERS:
+                    adjustment = metrics.horizontalAdvance(first + second) - advances[first] - advances[second]
+                    if abs(adjustment) > 1e-3:
+                        kerning[first + second] = round(adjustment, 4)
+            fonts.setdefault(family, {})[str(size)] = {
+                "height": QtFontMetrics(family, size).height(),
+                "advances": {char: round(advance, 4) for char, advance in advances.items()},
+                "kerning": kerning,
+            }
+    return {"version": FONT_METRICS_TABLE_VERSION, "fonts": fonts}
+
+
+def load_font_metrics_table(path: str) -> dict:
+    """Read a table written by save_font_metrics_table(); returns {} if missing or unreadable."""
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            table = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Failed to load font metrics table {path}: {e}")
+        return {}
+    if table.get("version") != FONT_METRICS_TABLE_VERSION:
+        logging.warning(f"Ignoring font metrics table {path}: unsupported version {table.get('version')}")
+        return {}
+    return table
+
+
+def save_font_metrics_table(path: str, families: Iterable[str], sizes: Iterable[int]) -> dict:
+    """Measure fonts with Qt and merge them into the table at path; requires a QGuiApplication.
+
+    Returns:
+        The merged table
+    """
+    table = load_font_metrics_table(path) or {"version": FONT_METRICS_TABLE_VERSION, "fonts": {}}
+    for family, measured in build_font_metrics_table(families, sizes)["fonts"].items():
+        table["fonts"].setdefault(family, {}).update(measured)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_path, path)  # Worker processes never see a half-written table
+    return table
+
+
+def chart_font_sizes(chart_config) -> list:
+    """Font sizes a ChartConfig renders text with (ID badges use at least 8)."""
+    return sorted({chart_config.task_font_size, chart_config.scale_font_size,
+                   chart_config.header_footer_font_size, chart_config.row_number_font_size,
+                   chart_config.note_font_size, chart_config.swimlane_font_size,
+                   max(chart_config.id_badge_font_size, 8)})
+
+
+def ensure_font_metrics_table(path: str, *chart_configs) -> bool:
+    """Add the fonts of one or more charts to the table at path if missing; requires a QGuiApplication.
+
+    Returns:
+        True if the table was written
+    """
+    wanted = {}  # family -> font sizes in use
+    for chart_config in chart_configs:
+        wanted.setdefault(chart_config.font_family, set()).update(chart_font_sizes(chart_config))
+    fonts = load_font_metrics_table(path).get("fonts", {})
+    missing = {family: sorted(size for size in sizes if str(size) not in fonts.get(family, {}))
+               for family, sizes in wanted.items()}
+    missing = {family: sizes for family, sizes in missing.items() if sizes}
+    if not missing:
+        return False
+    try:
+        for family, sizes in missing.items():
+            save_font_metrics_table(path, [family], sizes)
+    except OSError as e:
+        logging.warning(f"Failed to write font metrics table {path}: {e}")
+        return False
+    logging.info(f"Wrote font metrics for {missing} to {path}")
+    return True
+
+
+class _FontMeasurer:
+    """Cached measurements for a single (family, size) font."""
+
+    def __init__(self, metrics, max_entries: int):
+        self.metrics = metrics
+        self.max_entries = max_entries
+        self._widths = {}        # text -> horizontalAdvance
+        self._prefix_sums = {}   # text -> running sum of glyph advances
+        self._truncated = {}     # (text, max_width) -> truncated text
+        self._glyphs = {}        # character -> horizontalAdvance
+
+    def _remember(self, cache: dict, key, value):
+        # Charts reuse a bounded vocabulary; start over rather than grow without limit
+        if len(cache) >= self.max_entries:
+            cache.clear()
+        cache[key] = value
+        return value
+
+    def width(self, text: str) -> int:
+        width = self._widths.get(text)
+        if width is None:
+            width = self._remember(self._widths, text, self.metrics.horizontal_advance(text))
+        return width
+
+    def prefix_sums(self, text: str) -> list:
+        """Running glyph advance totals: prefix_sums(text)[k] approximates width(text[:k])."""
+        sums = self._prefix_sums.get(text)
+        if sums is None:
+            glyphs = self._glyphs
+            for char in set(text) - glyphs.keys():
+                glyphs[char] = self.metrics.horizontal_advance(char)
+            sums = self._remember(self._prefix_sums, text,
+                                  list(accumulate((glyphs[char] for char in text), initial=0)))
+        return sums
+
+    def longest_fitting_prefix(self, text: str, max_width: float, suffix: str = "") -> int:
+        """Largest k such that width(text[:k] + suffix) <= max_width, or 0 if none fits.
+
+        Glyph prefix sums give a starting guess; exact (cached) measurements then step it to
+        the answer, so kerning never changes the result but usually only two lookups are needed.
+        """
+        sums = self.prefix_sums(text)
+        budget = max_width - self.width(suffix) if suffix else max_width
+        # Guess: last k whose summed glyph width fits
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if sums[mid] <= budget:
+                lo = mid
+            else:
+                hi = mid - 1
+        k = lo
+        if k > 0 and self.width(text[:k] + suffix) > max_width:
+            while k > 0 and self.width(text[:k] + suffix) > max_width:
+                k -= 1
+        else:
+            while k < len(text) and self.width(text[:k + 1] + suffix) <= max_width:
+                k += 1
+        return k
+
+    def truncate(self, text: str, max_width: float) -> str:
+        key = (text, max_width)
+        result = self._truncated.get(key)
+        if result is None:
+            if self.width(text) <= max_width:
+                result = text
+            else:
+                k = self.longest_fitting_prefix(text, max_width, ELLIPSIS)
+                result = text[:k] + ELLIPSIS if k > 0 else ""
+            self._remember(self._truncated, key, result)
+        return result
+
+
+class TextMetricsService:
+    """Memoized text measurement for chart rendering.
+
+    Keeps one font metrics object per (family, size) and caches advance widths for strings and
+    glyphs, so labels repeated thousands of times are measured and truncated once, and note
+    word-wrap reuses fonts and measurements across notes and renders.
+
+    Providers:
+        "qt": QFontMetrics; needs a QGuiApplication
+        "table": glyph advances from the table file at table_path; fonts missing from the table
+            are estimated as width_factor * size per character
+        "auto": "qt" when a QGuiApplication exists in this process, otherwise "table"
+
+    QFontMetrics is not thread-safe; use an instance from one thread only.
+    """
+
+    def __init__(self, max_entries_per_font: int = 20000, provider: str = "auto",
+                 table_path: str = None, width_factor: float = 0.55):
+        if provider not in METRICS_PROVIDERS:
+            raise ValueError(f"Unknown text metrics provider: {provider}")
+        if provider == "auto":
+            provider = "qt" if qt_available() else "table"
+        self.provider = provider
+        self.max_entries_per_font = max_entries_per_font
+        self.table_path = table_path
+        self.width_factor = width_factor
+        self._table = None  # Loaded on first use
+        self._fonts = {}
+
+    def _table_metrics(self, family: str, size: int) -> TableFontMetrics:
+        if self._table is None:
+            self._table = load_font_metrics_table(self.table_path).get("fonts", {})
+        sizes = self._table.get(family)
+        if not sizes:
+            logging.warning(f"No metrics table entry for font {family!r}; estimating text widths")
+            return TableFontMetrics({}, self.width_factor * size, size * 1.2)
+        # Advances scale with the font size; use the nearest measured size
+        nearest = min(sizes, key=lambda measured: abs(int(measured) - size))
+        entry = sizes[nearest]
+        scale = size / int(nearest) if int(nearest) else 1.0
+        advances = entry["advances"]
+        default = sum(advances.values()) / len(advances) if advances else self.width_factor * int(nearest)
+        return TableFontMetrics(advances, default, entry["height"], entry.get("kerning"), scale)
+
+    def _measurer(self, family: str, size: int) -> _FontMeasurer:
+        key = (family, size)
+        measurer = self._fonts.get(key)
+        if measurer is None:
+            if self.provider == "qt":
+                metrics = QtFontMetrics(family, size)
+            else:
+                metrics = self._table_metrics(family, size)
+            measurer = self._fonts[key] = _FontMeasurer(metrics, self.max_entries_per_font)
+        return measurer
+
+    def line_height(self, family: str, size: int):
+        """Return the line spacing of a font in pixels."""
+        return self._measurer(family, size).metrics.height()
+
+    def width(self, text: str, family: str, size: int) -> int:
+        """Return the horizontal advance of text in pixels."""
+        return self._measurer(family, size).width(text)
+
+    def truncate(self, text: str, max_width: float, family: str, size: int) -> str:
+        """Truncate text to fit within max_width, adding an ellipsis if needed."""
+        return self._measurer(family, size).truncate(text, max_width)
+
+    def wrap(self, text: str, max_width: float, family: str, size: int) -> list:
+        """Wrap text into lines that fit within max_width.
+
+        Explicit line breaks are kept (blank paragraphs become empty lines). Words wrap at
+        spaces; a word too long for a line is split across lines at character boundaries.
+
+        Returns:
+            List of text lines that fit within max_width
+        """
+        measurer = self._measurer(family, size)
+        lines = []
+        for paragraph in text.split('\n'):
+            if not paragraph.strip():
+                # Empty line - preserve it
+                lines.append("")
+                continue
+            current_line = ""
+            for word in paragraph.split():
+                test_line = current_line + (" " if current_line else "") + word
+                if measurer.width(test_line) <= max_width:
+                    current_line = test_line
+                elif current_line:
+                    # Save current line and start a new one with this word
+                    lines.append(current_line)
+                    current_line = word
+                else:
+                    # Single word is too long - split it into the pieces that fit
+                    lines.extend(self._split_word(measurer, word, max_width))
+                    current_line = ""
+            if current_line:
+                lines.append(current_line)
+        return lines
+
+    def _split_word(self, measurer: _FontMeasurer, word: str, max_width: float) -> list:
+        pieces = []
+        while word:
+            count = measurer.longest_fitting_prefix(word, max_width)
+            if count == 0:
+                # Even the first character doesn't fit - emit an empty line and give up on the word
+                pieces.append("")
+                break
+            pieces.append(word[:count])
+            word = word[count:]
+        return pieces
+
+    def clear(self):
+        """Drop all cached fonts and measurements (and the loaded table, so it is re-read)."""
+        logging.debug(f"Clearing text metrics cache for {len(self._fonts)} font(s)")
+        self._fonts.clear()
+        self._table = None
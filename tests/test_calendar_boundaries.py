@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for chart_geometry.calendar_boundaries: boundaries and periods are compared with a walk
+from the chart start date that steps to the next period with next_period() (the stepping the
+scales and gridlines used before the table existed).
+"""
+
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path (go up one level from tests folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from services import chart_geometry
+from services.chart_geometry import CALENDAR_INTERVALS, CalendarBoundaries, calendar_boundaries
+
+
+def next_period(day: date, interval: str) -> date:
+    """Start of the period after the one containing day."""
+    if interval == "days":
+        return day + timedelta(days=1)
+    elif interval == "weeks":
+        days_to_monday = (7 - day.weekday()) % 7 or 7
+        return day + timedelta(days=days_to_monday)
+    elif interval == "months":
+        year, month = day.year, day.month + 1
+        if month > 12:
+            month = 1
+            year += 1
+        return date(year, month, 1)
+    return date(day.year + 1, 1, 1)
+
+
+def _stepped_boundaries(start: date, end: date, interval: str) -> list:
+    """Gridline positions: period starts after start, up to and including end."""
+    boundaries = []
+    current = next_period(start, interval)
+    while current <= end:
+        boundaries.append(current.toordinal())
+        current = next_period(current, interval)
+    return boundaries
+
+
+def _stepped_periods(start: date, end: date, interval: str) -> tuple:
+    """Scale periods: (start, next period start) from the chart start until past end."""
+    starts, ends = [], []
+    current = start
+    while current <= end:
+        following = next_period(current, interval)
+        starts.append(current.toordinal())
+        ends.append(following.toordinal())
+        current = following
+    return starts, ends
+
+
+def _assert_matches_stepping(start: date, end: date):
+    table = CalendarBoundaries(start.toordinal(), end.toordinal())
+    for interval in CALENDAR_INTERVALS:
+        label = f"{interval} {start}..{end}"
+        assert table.boundaries(interval).tolist() == _stepped_boundaries(start, end, interval), label
+        period_starts, period_ends = table.periods(interval)
+        assert (period_starts.tolist(), period_ends.tolist()) == _stepped_periods(start, end, interval), label
+
+
+def test_rollovers():
+    """Test ranges across month and year ends, leap days and ISO week 53."""
+    print("Testing: Month and year rollovers...")
+    ranges = [
+        (date(2024, 12, 15), date(2025, 1, 15)),   # Year end
+        (date(2024, 1, 31), date(2024, 3, 1)),     # Leap February
+        (date(2023, 1, 31), date(2023, 3, 1)),     # Non-leap February
+        (date(2020, 12, 20), date(2021, 1, 10)),   # 2020 has ISO week 53
+        (date(2019, 11, 30), date(2022, 2, 1)),    # Several years
+        (date(2024, 6, 30), date(2024, 7, 1)),     # Month end to month start
+        (date(1999, 12, 31), date(2000, 1, 1)),
+    ]
+    for start, end in ranges:
+        _assert_matches_stepping(start, end)
+
+    print("  [PASSED]")
+    return True
+
+
+def test_chart_edges():
+    """Test ranges starting or ending exactly on a period start, and one day either side of it."""
+    print("Testing: Ranges starting and ending on period boundaries (chart edges)...")
+    anchors = [date(2025, 1, 1), date(2025, 3, 1), date(2025, 3, 3), date(2024, 2, 29)]  # 2025-03-03 is a Monday
+    for anchor in anchors:
+        for offset in (-1, 0, 1):
+            edge = anchor + timedelta(days=offset)
+            for length in (1, 6, 7, 8, 30, 31, 365, 366):
+                _assert_matches_stepping(edge, edge + timedelta(days=length))
+                _assert_matches_stepping(edge - timedelta(days=length), edge)
+
+    print("  [PASSED]")
+    return True
+
+
+def test_single_day_and_reversed_ranges():
+    """Test a chart that starts and ends on the same day, and one that ends before it starts."""
+    print("Testing: Single-day and reversed ranges...")
+    for day in (date(2025, 1, 1), date(2025, 2, 28), date(2025, 3, 3), date(2025, 12, 31)):
+        _assert_matches_stepping(day, day)
+        _assert_matches_stepping(day, day - timedelta(days=3))
+        table = CalendarBoundaries(day.toordinal(), day.toordinal() - 3)
+        for interval in CALENDAR_INTERVALS:
+            assert table.boundaries(interval).tolist() == []
+            assert [part.tolist() for part in table.periods(interval)] == [[], []]
+
+    print("  [PASSED]")
+    return True
+
+
+def test_random_ranges():
+    """Test random chart ranges of a day to a few years."""
+    print("Testing: Random ranges match stepping...")
+    rnd = random.Random(1)
+    for _ in range(150):
+        start = date(2000, 1, 1) + timedelta(days=rnd.randint(0, 12000))
+        _assert_matches_stepping(start, start + timedelta(days=rnd.choice([0, 1, 5, 27, 59, 200, 800, 1500])))
+
+    print("  [PASSED]")
+    return True
+
+
+def test_period_labels():
+    """Test the vectorized year, month, ISO week and weekday helpers against date methods."""
+    print("Testing: Period label helpers match date methods...")
+    days = [date(2019, 12, 20) + timedelta(days=i) for i in range(800)]
+    ordinals = np.array([day.toordinal() for day in days], dtype=np.int64)
+    assert chart_geometry.years(ordinals).tolist() == [day.year for day in days]
+    assert chart_geometry.months(ordinals).tolist() == [day.month for day in days]
+    assert chart_geometry.iso_weeks(ordinals).tolist() == [day.isocalendar()[1] for day in days]
+    assert chart_geometry.weekdays(ordinals).tolist() == [day.weekday() for day in days]
+
+    print("  [PASSED]")
+    return True
+
+
+def test_shared_table():
+    """Test that calendar_boundaries() returns one shared table per date range."""
+    print("Testing: calendar_boundaries() shares tables...")
+    start, end = date(2025, 1, 1).toordinal(), date(2025, 6, 30).toordinal()
+    assert calendar_boundaries(start, end) is calendar_boundaries(start, end)
+    assert calendar_boundaries(start, end) is not calendar_boundaries(start, end + 1)
+
+    print("  [PASSED]")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing Calendar Boundaries")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Rollovers", test_rollovers),
+        ("Chart edges", test_chart_edges),
+        ("Single-day and reversed ranges", test_single_day_and_reversed_ranges),
+        ("Random ranges", test_random_ranges),
+        ("Period labels", test_period_labels),
+        ("Shared table", test_shared_table),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"  [FAILED]")
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAILED]: {e}")
+        except Exception as e:
+            failed += 1
+            print(f"  [ERROR]: {e}")
+            import traceback
+            traceback.print_exc()
+        print()
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    if failed == 0:
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[FAILURE] Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
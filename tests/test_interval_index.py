@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for IntervalIndex: overlapping() is compared with a brute-force scan of every interval.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path (go up one level from tests folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from services.interval_index import IntervalIndex
+
+
+def _brute_force(starts, ends, valid, lo: int, hi: int) -> list:
+    """Positions of the valid intervals overlapping [lo, hi], scanning them all."""
+    return [i for i, (start, end) in enumerate(zip(starts, ends))
+            if (valid is None or valid[i]) and end >= start and start <= hi and end >= lo]
+
+
+def _assert_matches_brute_force(starts, ends, valid, queries):
+    index = IntervalIndex(starts, ends, valid)
+    assert len(index) == len(starts)
+    for lo, hi in queries:
+        positions = index.overlapping(lo, hi)
+        assert positions.dtype == np.int64
+        assert positions.tolist() == _brute_force(starts, ends, valid, lo, hi), f"overlapping({lo}, {hi})"
+
+
+def _edge_queries(starts, ends) -> list:
+    """Queries starting or ending exactly on interval bounds, and just either side of them."""
+    queries = []
+    for start, end in zip(starts, ends):
+        for bound in (start, end):
+            for offset in (-1, 0, 1):
+                queries.append((bound + offset, bound + offset))  # Single-day range
+                queries.append((bound + offset, bound + offset + 10))
+                queries.append((bound + offset - 10, bound + offset))
+    return queries
+
+
+def test_random_intervals():
+    """Test random intervals of mixed spans against the brute-force scan."""
+    print("Testing: Random intervals match a brute-force scan...")
+    rnd = random.Random(1)
+    for _ in range(20):
+        count = rnd.randint(0, 300)
+        starts = [rnd.randint(730000, 731000) for _ in range(count)]
+        # Mostly short tasks, with some zero-length and a few very long ones
+        ends = [start + rnd.choice([0, 0, rnd.randint(1, 10), rnd.randint(1, 60), rnd.randint(100, 2000)])
+                for start in starts]
+        queries = [(lo, lo + rnd.choice([0, 1, 7, 30, 365, 5000])) for lo in
+                   (rnd.randint(729000, 733000) for _ in range(50))]
+        _assert_matches_brute_force(starts, ends, None, queries)
+
+    print("  [PASSED]")
+    return True
+
+
+def test_chart_edges():
+    """Test queries whose bounds fall exactly on, or one day either side of, interval bounds."""
+    print("Testing: Queries on interval bounds (chart edges)...")
+    rnd = random.Random(2)
+    starts = [rnd.randint(100, 400) for _ in range(60)]
+    ends = [start + rnd.choice([0, 1, 5, 30, 200]) for start in starts]
+    _assert_matches_brute_force(starts, ends, None, _edge_queries(starts, ends))
+
+    print("  [PASSED]")
+    return True
+
+
+def test_zero_length_intervals():
+    """Test intervals that start and end on the same day (milestones and one-day tasks)."""
+    print("Testing: Zero-length intervals...")
+    starts = [10, 10, 11, 15, 20, 20, 20]
+    ends = list(starts)
+    index = IntervalIndex(starts, ends)
+    assert index.overlapping(10, 10).tolist() == [0, 1]
+    assert index.overlapping(11, 14).tolist() == [2]
+    assert index.overlapping(12, 14).tolist() == []
+    assert index.overlapping(15, 20).tolist() == [3, 4, 5, 6]
+    assert index.overlapping(21, 30).tolist() == []
+    _assert_matches_brute_force(starts, ends, None, _edge_queries(starts, ends))
+
+    print("  [PASSED]")
+    return True
+
+
+def test_invalid_and_masked_intervals():
+    """Test that intervals ending before they start, or masked out by valid, are never returned."""
+    print("Testing: Reversed and masked-out intervals are skipped...")
+    rnd = random.Random(3)
+    starts = [rnd.randint(0, 100) for _ in range(100)]
+    ends = [start + rnd.randint(-5, 20) for start in starts]
+    valid = [rnd.random() < 0.8 for _ in starts]
+    queries = [(lo, lo + rnd.randint(-2, 30)) for lo in (rnd.randint(-10, 130) for _ in range(200))]
+    _assert_matches_brute_force(starts, ends, valid, queries + _edge_queries(starts, ends))
+    _assert_matches_brute_force(starts, ends, None, queries)
+
+    print("  [PASSED]")
+    return True
+
+
+def test_empty_index():
+    """Test an index with no intervals, and one whose intervals are all invalid."""
+    print("Testing: Empty index...")
+    assert IntervalIndex([], []).overlapping(0, 100).tolist() == []
+    index = IntervalIndex([5, 6], [4, 5])
+    assert len(index) == 2
+    assert index.overlapping(0, 100).tolist() == []
+
+    print("  [PASSED]")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing IntervalIndex")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Random intervals", test_random_intervals),
+        ("Chart edges", test_chart_edges),
+        ("Zero-length intervals", test_zero_length_intervals),
+        ("Reversed and masked intervals", test_invalid_and_masked_intervals),
+        ("Empty index", test_empty_index),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"  [FAILED]")
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAILED]: {e}")
+        except Exception as e:
+            failed += 1
+            print(f"  [ERROR]: {e}")
+            import traceback
+            traceback.print_exc()
+        print()
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    if failed == 0:
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[FAILURE] Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
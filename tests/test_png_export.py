@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for PngStreamWriter and export_png_tiled: PNGs are written, read back with
+QImage and compared with the source pixels or with render_svg_image().
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path (go up one level from tests folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtGui import QGuiApplication, QImage
+
+_app = QGuiApplication.instance() or QGuiApplication(["test_png_export"])
+
+from benchmarks.synthetic_project import generate_project
+from config.app_config import AppConfig
+from services.gantt_chart_service import GanttChartService
+from services.raster_export import PngStreamWriter, SCREEN_DPI, _image_rows, export_png_tiled, render_svg_image
+
+TILE_HEIGHT = 128  # Chart height (600) is not a multiple of it, so the last band is partial
+
+
+def _chart_svg() -> bytes:
+    app_config = AppConfig()
+    app_config.general.chart.render_cache = False
+    project = generate_project(200, seed=1, app_config=app_config)
+    with tempfile.TemporaryDirectory() as output_folder:
+        return GanttChartService(app_config, output_folder, "chart.svg").render_svg_bytes(project.to_json())
+
+
+def _read_png(path: str, alpha: bool) -> np.ndarray:
+    image = QImage(path)
+    assert not image.isNull(), f"QImage could not read {path}"
+    assert image.hasAlphaChannel() == alpha
+    return _image_rows(image, alpha)
+
+
+def test_stream_writer_roundtrip():
+    """Test that rows written in uneven bands read back exactly, for RGB and RGBA."""
+    print("Testing: PngStreamWriter round trip...")
+    rnd = np.random.default_rng(1)
+    with tempfile.TemporaryDirectory() as folder:
+        for alpha in (False, True):
+            width, height, channels = 37, 53, 4 if alpha else 3
+            pixels = rnd.integers(0, 256, size=(height, width * channels), dtype=np.uint8)
+            pixels[:10] = pixels[0]  # Some repetition, as in real charts
+            if alpha:
+                pixels[:, 3::4] = 255  # Opaque: QImage keeps straight and premultiplied alike
+            path = os.path.join(folder, f"stream_{alpha}.png")
+            # Small chunks so the image data spans several IDAT chunks
+            with PngStreamWriter(path, width, height, alpha=alpha, dpi=144, chunk_size=256) as writer:
+                for top, bottom in ((0, 1), (1, 20), (20, 20), (20, 53)):
+                    writer.write_rows(pixels[top:bottom])
+            assert np.array_equal(_read_png(path, alpha), pixels)
+            image = QImage(path)
+            assert (image.width(), image.height()) == (width, height)
+            assert image.dotsPerMeterX() == round(144 / 0.0254)
+
+    print("  [PASSED]")
+    return True
+
+
+def test_stream_writer_row_checks():
+    """Test that writing too many rows, rows of the wrong width or too few rows raises ValueError."""
+    print("Testing: PngStreamWriter rejects wrong row counts and widths...")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "bad.png")
+        writer = PngStreamWriter(path, 4, 2, alpha=False)
+        for rows in (np.zeros((1, 4 * 4), dtype=np.uint8), np.zeros((3, 4 * 3), dtype=np.uint8)):
+            try:
+                writer.write_rows(rows)
+                assert False, "write_rows should have raised ValueError"
+            except ValueError:
+                pass
+        writer.write_rows(np.zeros((1, 4 * 3), dtype=np.uint8))
+        try:
+            writer.close()
+            assert False, "close should have raised ValueError"
+        except ValueError:
+            pass
+
+    print("  [PASSED]")
+    return True
+
+
+def test_tiled_export_matches_single_image():
+    """Test export_png_tiled against render_svg_image, opaque and transparent.
+
+    Rendered as one band the PNG is identical. Rendered in bands, antialiasing along the cut
+    may differ slightly, so only the rows next to a band boundary may differ at all.
+    """
+    print("Testing: Tiled PNG export matches a single-image render...")
+    svg = _chart_svg()
+    with tempfile.TemporaryDirectory() as folder:
+        for transparent in (False, True):
+            expected = _image_rows(render_svg_image(svg, transparent=transparent), transparent)
+            height = expected.shape[0]
+            assert height % TILE_HEIGHT != 0
+
+            path = os.path.join(folder, f"single_{transparent}.png")
+            export_png_tiled(svg, path, transparent=transparent, tile_height=height)
+            assert np.array_equal(_read_png(path, transparent), expected)
+
+            path = os.path.join(folder, f"tiled_{transparent}.png")
+            size = export_png_tiled(svg, path, transparent=transparent, tile_height=TILE_HEIGHT)
+            assert (size.width(), size.height()) == (expected.shape[1] // (4 if transparent else 3), height)
+            actual = _read_png(path, transparent)
+            assert actual.shape == expected.shape
+            difference = np.abs(actual.astype(np.int16) - expected.astype(np.int16)).max(axis=1)
+            seam_rows = {top + offset for top in range(TILE_HEIGHT, height, TILE_HEIGHT) for offset in (-1, 0, 1)}
+            differing = set(np.flatnonzero(difference).tolist())
+            assert differing <= seam_rows, f"Rows away from band boundaries differ: {sorted(differing - seam_rows)}"
+            assert difference.max() <= 32
+            if transparent:
+                assert actual[:, 3::4].min() == 0  # Background left transparent
+
+    print("  [PASSED]")
+    return True
+
+
+def test_tiled_export_scale():
+    """Test that scale sets the PNG size and DPI, and that a non-positive scale raises ValueError."""
+    print("Testing: Tiled PNG export scale...")
+    svg = _chart_svg()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "scaled.png")
+        size = export_png_tiled(svg, path, scale=1.5, transparent=False, tile_height=TILE_HEIGHT)
+        image = QImage(path)
+        assert (image.width(), image.height()) == (size.width(), size.height()) == (1200, 900)
+        assert image.dotsPerMeterX() == round(SCREEN_DPI * 1.5 / 0.0254)
+        try:
+            export_png_tiled(svg, path, scale=0)
+            assert False, "export_png_tiled should have raised ValueError"
+        except ValueError:
+            pass
+
+    print("  [PASSED]")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing PNG Export")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Stream writer round trip", test_stream_writer_roundtrip),
+        ("Stream writer row checks", test_stream_writer_row_checks),
+        ("Tiled export matches single image", test_tiled_export_matches_single_image),
+        ("Tiled export scale", test_tiled_export_scale),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"  [FAILED]")
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAILED]: {e}")
+        except Exception as e:
+            failed += 1
+            print(f"  [ERROR]: {e}")
+            import traceback
+            traceback.print_exc()
+        print()
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    if failed == 0:
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[FAILURE] Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
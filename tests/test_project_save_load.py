@@ -25,6 +25,7 @@ class MockQColor:
         pass
 
 # Create proper PyQt5 package structure with all required submodules
+_real_modules = dict(sys.modules)
 sys.modules['PyQt5'] = type(sys)('PyQt5')
 sys.modules['PyQt5.QtCore'] = type(sys)('PyQt5.QtCore')
 sys.modules['PyQt5.QtCore'].QDate = MockQDate
@@ -34,6 +35,12 @@ sys.modules['PyQt5.QtGui'].QColor = MockQColor
 from models.project import ProjectData
 from models.frame import FrameConfig
 
+# Undo the mocks, and forget the modules imported against them, so test modules run after
+# this one import PyQt5 and the project modules normally
+for _name in [name for name in sys.modules if name not in _real_modules]:
+    del sys.modules[_name]
+sys.modules.update(_real_modules)
+
 
 def test_frame_config_all_fields_saved():
     """Test that all FrameConfig fields are saved to JSON."""
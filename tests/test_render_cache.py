@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed render cache: canonical_json/content_key stability, the
+memory LRU bound, promotion of disk hits into memory and pruning of the disk folder.
+"""
+
+import dataclasses
+import os
+import random
+import sys
+import tempfile
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+
+# Add project root to path (go up one level from tests folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from services.render_cache import RenderCache, canonical_json, content_key
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class _Settings:
+    width: int = 800
+    when: date = date(2025, 1, 1)
+
+
+def _shuffled(value, rnd: random.Random):
+    """Copy of a JSON-like value with every dict rebuilt in a random key order."""
+    if isinstance(value, dict):
+        items = list(value.items())
+        rnd.shuffle(items)
+        return {key: _shuffled(item, rnd) for key, item in items}
+    if isinstance(value, list):
+        return [_shuffled(item, rnd) for item in value]
+    return value
+
+
+def test_canonical_json_key_order():
+    """Test that dict insertion order never changes canonical_json() or content_key()."""
+    print("Testing: Dict order permutations give the same content key...")
+    rnd = random.Random(1)
+    payload = {
+        "frame_config": {"outer_width": 800, "outer_height": 600, "margins": [10, 20, 10, 20], "num_rows": 12},
+        "tasks": [{"task_id": i, "task_name": f"Task {i}", "row_number": i % 5, "start_date": "2025-01-0%d" % (i % 9 + 1),
+                   "extra": {"b": 1, "a": [1, {"z": None, "y": True}]}} for i in range(20)],
+        "chart": {"font_family": "Arial", "lod_enabled": False, "ümlaut": "é"},
+    }
+    expected_json, expected_key = canonical_json(payload), content_key(payload)
+    for _ in range(25):
+        shuffled = _shuffled(payload, rnd)
+        assert canonical_json(shuffled) == expected_json
+        assert content_key(shuffled) == expected_key
+
+    changed = _shuffled(payload, rnd)
+    changed["tasks"][7]["extra"]["a"][1]["y"] = False
+    assert content_key(changed) != expected_key
+    reordered = dict(payload, tasks=list(reversed(payload["tasks"])))  # List order is content
+    assert content_key(reordered) != expected_key
+
+    print("  [PASSED]")
+    return True
+
+
+def test_canonical_json_conversions():
+    """Test that dataclasses, dates, sets, enums, bytes and paths serialize to stable JSON."""
+    print("Testing: canonical_json() converts non-JSON values stably...")
+    value = {"settings": _Settings(), "at": datetime(2025, 1, 2, 3, 4, 5), "tags": {"b", "a", "c"},
+             "color": _Color.RED, "raw": b"\x01\xff", "path": Path("svg") / "chart.svg"}
+    assert canonical_json(value) == canonical_json(dict(reversed(list(value.items()))))
+    assert canonical_json({"tags": {"c", "a", "b"}}) == canonical_json({"tags": {"a", "b", "c"}})
+    assert canonical_json(value) == canonical_json({
+        "settings": {"width": 800, "when": "2025-01-01"}, "at": "2025-01-02T03:04:05",
+        "tags": ["a", "b", "c"], "color": "red", "raw": "01ff", "path": str(Path("svg") / "chart.svg")})
+
+    print("  [PASSED]")
+    return True
+
+
+def test_memory_eviction():
+    """Test that random stores keep the memory size within max_bytes, evicting least recently used first."""
+    print("Testing: Eviction keeps the cache within max_bytes...")
+    rnd = random.Random(2)
+    cache = RenderCache(max_bytes=5000)
+    for step in range(500):
+        key = f"k{rnd.randint(0, 40)}"
+        if rnd.random() < 0.3:
+            cache.get_entry(key)
+        else:
+            sidecar = b"m" * rnd.randint(0, 300) if rnd.random() < 0.5 else None
+            cache.put(key, b"s" * rnd.randint(1, 2000), sidecar)
+        entries = cache._entries.values()
+        assert cache._size <= cache.max_bytes, f"step {step}: {cache._size} bytes held"
+        assert cache._size == sum(len(svg) + len(sidecar or b"") for svg, sidecar in entries)
+        assert cache.stats()["bytes"] == cache._size
+
+    # Least recently used goes first: reading "a" makes "b" the oldest
+    cache = RenderCache(max_bytes=300)
+    for key in ("a", "b", "c"):
+        cache.put(key, key.encode() * 100)
+    cache.get("a")
+    cache.put("d", b"d" * 100)
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.stats()["evictions"] == 1
+
+    # A document larger than the whole cache is not kept in memory and evicts nothing
+    cache.put("huge", b"h" * 301)
+    assert cache.get("huge") is None and cache.stats()["entries"] == 3
+
+    print("  [PASSED]")
+    return True
+
+
+def test_disk_hits_promoted():
+    """Test that documents found on disk (with their side-car) are promoted to memory."""
+    print("Testing: Disk hits are promoted to memory...")
+    with tempfile.TemporaryDirectory() as folder:
+        RenderCache(max_bytes=10000, disk_folder=folder).put("doc", b"<svg/>", b'{"regions":[]}')
+        RenderCache(max_bytes=10000, disk_folder=folder).put("bare", b"<svg></svg>")
+
+        cache = RenderCache(max_bytes=10000, disk_folder=folder)  # Empty memory, as after a restart
+        assert cache.get_entry("doc") == (b"<svg/>", b'{"regions":[]}')
+        stats = cache.stats()
+        assert (stats["disk_hits"], stats["memory_hits"], stats["entries"]) == (1, 0, 1)
+        os.remove(os.path.join(folder, "doc.svg"))
+        assert cache.get_entry("doc") == (b"<svg/>", b'{"regions":[]}')  # Now served from memory
+        assert cache.stats()["memory_hits"] == 1
+
+        assert cache.get_entry("bare") == (b"<svg></svg>", None)
+        assert cache.get_entry("missing") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["disk_hits"]) == (3, 1, 2)
+
+        # Storing without a side-car removes the stale side-car of an earlier entry
+        cache.put("doc", b"<svg>new</svg>")
+        assert not os.path.exists(os.path.join(folder, "doc.json"))
+
+    print("  [PASSED]")
+    return True
+
+
+def test_disk_prune_orphans_first():
+    """Test that pruning removes side-cars without a document first, then the oldest documents."""
+    print("Testing: Orphan side-cars are pruned first...")
+    with tempfile.TemporaryDirectory() as folder:
+        cache = RenderCache(max_bytes=10000, disk_folder=folder)
+        for age, key in enumerate(("newer", "older")):
+            cache.put(key, b"s" * 100, b"j" * 20)
+            mtime = 1_000_000 - age * 1000
+            os.utime(os.path.join(folder, key + ".svg"), (mtime, mtime))
+        for key in ("orphan1", "orphan2"):
+            with open(os.path.join(folder, key + ".json"), "wb") as f:
+                f.write(b"o" * 50)
+            os.utime(os.path.join(folder, key + ".json"), (2_000_000, 2_000_000))  # Newer than every document
+
+        # 240 bytes of documents + 100 of orphans + 120 new: the orphans alone make room
+        cache.max_disk_bytes = 360
+        cache.put("latest", b"s" * 100, b"j" * 20)
+        assert sorted(os.listdir(folder)) == ["latest.json", "latest.svg", "newer.json", "newer.svg",
+                                              "older.json", "older.svg"]
+
+        # Next the least recently used document goes, with its side-car
+        cache.put("another", b"s" * 100, b"j" * 20)
+        assert sorted(os.listdir(folder)) == ["another.json", "another.svg", "latest.json", "latest.svg",
+                                              "newer.json", "newer.svg"]
+        assert sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder)) <= 360
+
+    print("  [PASSED]")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing Render Cache")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("canonical_json key order", test_canonical_json_key_order),
+        ("canonical_json conversions", test_canonical_json_conversions),
+        ("Memory eviction", test_memory_eviction),
+        ("Disk hits promoted", test_disk_hits_promoted),
+        ("Disk pruning", test_disk_prune_orphans_first),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"  [FAILED]")
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAILED]: {e}")
+        except Exception as e:
+            failed += 1
+            print(f"  [ERROR]: {e}")
+            import traceback
+            traceback.print_exc()
+        print()
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    if failed == 0:
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[FAILURE] Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Tests for TaskStore: every index lookup is compared with a brute-force scan of the task list
+after list operations, update(), refresh(), swimlane changes and duplicate task IDs.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path (go up one level from tests folder)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models import Task, TaskStore, Swimlane
+from models.project import ProjectData
+
+MAX_TASK_ID = 40
+MAX_ROW = 20
+
+
+def _make_task(rnd: random.Random, name: str) -> Task:
+    return Task(task_id=rnd.randint(1, MAX_TASK_ID), task_name=name,
+                start_date=rnd.choice(["", "2024-01-%02d" % rnd.randint(1, 28)]),
+                finish_date=rnd.choice(["", "2024-02-%02d" % rnd.randint(1, 28)]),
+                row_number=rnd.randint(1, MAX_ROW))
+
+
+def _swimlane_of_row(row_number: int, row_counts: list):
+    first_row = 1
+    for order, row_count in enumerate(row_counts, 1):
+        if first_row <= row_number <= first_row + row_count - 1:
+            return order
+        first_row += row_count
+    return None
+
+
+def _unique(tasks) -> list:
+    """Tasks in list order, each object once."""
+    return list({id(task): task for task in tasks}.values())
+
+
+def _ids(tasks) -> list:
+    return [id(task) for task in tasks]
+
+
+def _assert_matches_brute_force(store: TaskStore, row_counts: list):
+    """Check every lookup of store against a scan of its tasks in list order."""
+    tasks = list(store)
+    unique = _unique(tasks)
+    for task_id in range(0, MAX_TASK_ID + 2):
+        expected = [task for task in unique if task.task_id == task_id]
+        assert store.get(task_id) is (expected[0] if expected else None), f"get({task_id})"
+        assert _ids(store.with_id(task_id)) == _ids(expected), f"with_id({task_id})"
+    for row_number in range(0, MAX_ROW + 2):
+        expected = [task for task in unique if task.row_number == row_number]
+        assert _ids(store.in_row(row_number)) == _ids(expected), f"in_row({row_number})"
+    assert store.rows() == sorted({task.row_number for task in tasks})
+    for order in [None] + list(range(1, len(row_counts) + 2)):
+        expected = [task for task in unique if _swimlane_of_row(task.row_number, row_counts) == order]
+        assert _ids(store.in_swimlane(order)) == _ids(expected), f"in_swimlane({order})"
+    by_date = store.by_date()
+    assert sorted(_ids(by_date)) == sorted(_ids(unique))
+    date_keys = [(task.start_date or "~", task.finish_date or "~") for task in by_date]
+    assert date_keys == sorted(date_keys)
+    expected = [task for task in unique if task.start_date and "2024-01-05" <= task.start_date <= "2024-01-15"]
+    assert sorted(_ids(store.starting_between("2024-01-05", "2024-01-15"))) == sorted(_ids(expected))
+    task_ids = store.task_ids(exclude=7)
+    assert set(task_ids) == {task.task_id for task in tasks} - {7}
+    assert len(task_ids) == len(set(task_ids))
+    assert 7 not in task_ids
+
+
+def test_list_operations():
+    """Test that indexes follow append, insert, del, item and slice assignment, remove, pop and sort."""
+    print("Testing: Indexes follow list operations...")
+    rnd = random.Random(1)
+    row_counts = [3, 4, 5]
+    store = TaskStore()
+    store.set_swimlanes(row_counts)
+    for i in range(30):
+        store.append(_make_task(rnd, f"t{i}"))
+    _assert_matches_brute_force(store, row_counts)
+
+    store.insert(0, _make_task(rnd, "inserted first"))
+    store.insert(len(store) // 2, _make_task(rnd, "inserted middle"))
+    _assert_matches_brute_force(store, row_counts)
+    del store[0]
+    del store[3:6]
+    _assert_matches_brute_force(store, row_counts)
+    store[2] = _make_task(rnd, "replaced")
+    store[4:7] = [_make_task(rnd, "slice a"), _make_task(rnd, "slice b")]
+    _assert_matches_brute_force(store, row_counts)
+    store.remove(store[5])
+    store.pop()
+    _assert_matches_brute_force(store, row_counts)
+    store.sort(key=lambda task: (task.finish_date, task.task_name))
+    _assert_matches_brute_force(store, row_counts)
+    assert store == sorted(list(store), key=lambda task: (task.finish_date, task.task_name))
+    store.clear()
+    assert len(store) == 0 and store.get(1) is None and not store.rows()
+
+    print("  [PASSED]")
+    return True
+
+
+def test_update_and_refresh():
+    """Test that update() and refresh() re-index added, removed and edited tasks."""
+    print("Testing: update() and refresh() re-index changed tasks...")
+    rnd = random.Random(2)
+    row_counts = [5, 5]
+    store = TaskStore([_make_task(rnd, f"t{i}") for i in range(20)])
+    store.set_swimlanes(row_counts)
+
+    # Keep some tasks, drop others, add new ones and edit a few in place before update()
+    tasks = [task for task in store if rnd.random() < 0.7] + [_make_task(rnd, f"new{i}") for i in range(5)]
+    rnd.shuffle(tasks)
+    for task in tasks[:4]:
+        task.row_number = rnd.randint(1, MAX_ROW)
+        task.start_date = "2024-01-10"
+        task.task_id = rnd.randint(1, MAX_TASK_ID)
+    store.update(tasks)
+    assert list(store) == tasks
+    _assert_matches_brute_force(store, row_counts)
+
+    # Edits made in place are picked up by refresh()
+    for task in list(store)[::3]:
+        task.row_number = rnd.randint(1, MAX_ROW)
+        task.task_id = rnd.randint(1, MAX_TASK_ID)
+        task.finish_date = ""
+    store.refresh()
+    _assert_matches_brute_force(store, row_counts)
+
+    print("  [PASSED]")
+    return True
+
+
+def _copy(task: Task) -> Task:
+    return Task(task_id=task.task_id, task_name=task.task_name, start_date=task.start_date,
+                finish_date=task.finish_date, row_number=task.row_number)
+
+
+def test_update_with_copies():
+    """Test update() with every task replaced by a new object, as the tasks tab syncs the table."""
+    print("Testing: update() with copies of every task...")
+    rnd = random.Random(5)
+    row_counts = [4, 6]
+    store = TaskStore([_make_task(rnd, f"t{i}") for i in range(80)])
+    store.set_swimlanes(row_counts)
+    for step in range(30):
+        copies = [_copy(task) for task in store]
+        if step % 3 == 1:
+            rnd.shuffle(copies)  # Copies away from their old position are matched by content
+        for task in rnd.sample(copies, rnd.choice([0, 1, 3, 50])):  # 50 edits rebuild the date index
+            task.row_number = rnd.randint(1, MAX_ROW)
+            task.start_date = rnd.choice(["", "2024-01-%02d" % rnd.randint(1, 28)])
+        if step % 5 == 2:
+            copies += [_copy(task) for task in copies[:5]]  # Several new tasks with the same content
+            del copies[10:15]
+        store.update(copies)
+        assert list(store) == copies
+        _assert_matches_brute_force(store, row_counts)  # Lookups return the new objects
+
+    print("  [PASSED]")
+    return True
+
+
+def test_swimlane_regrouping():
+    """Test that swimlane lookups follow set_swimlanes() and swimlanes edited in place on a project."""
+    print("Testing: Swimlane lookups follow swimlane changes...")
+    rnd = random.Random(3)
+    store = TaskStore([_make_task(rnd, f"t{i}") for i in range(40)])
+    for row_counts in ([], [2], [3, 4, 5], [10, 10], [1, 1, 1, 1], [25]):
+        store.set_swimlanes(row_counts)
+        _assert_matches_brute_force(store, row_counts)
+
+    project = ProjectData()
+    project.tasks = [_make_task(rnd, f"p{i}") for i in range(20)]
+    project.swimlanes = [Swimlane(swimlane_id=1, row_count=5)]
+    _assert_matches_brute_force(project.tasks, [5])
+    project.swimlanes.append(Swimlane(swimlane_id=2, row_count=5))  # Edited in place, not reassigned
+    _assert_matches_brute_force(project.tasks, [5, 5])
+    project.swimlanes[0].row_count = 8
+    _assert_matches_brute_force(project.tasks, [8, 5])
+
+    print("  [PASSED]")
+    return True
+
+
+def test_duplicate_ids():
+    """Test lookups while several tasks share an ID, and with the same task object listed twice."""
+    print("Testing: Duplicate task IDs and repeated task objects...")
+    first = Task(task_id=1, task_name="first", start_date="2024-01-01", finish_date="2024-01-05", row_number=1)
+    second = Task(task_id=1, task_name="second", start_date="2024-01-02", finish_date="2024-01-06", row_number=2)
+    other = Task(task_id=2, task_name="other", start_date="2024-01-03", finish_date="2024-01-07", row_number=1)
+    store = TaskStore([second, other, first])
+    assert store.get(1) is second
+    assert store.with_id(1) == [second, first]
+    store.insert(0, first)  # first is now listed twice
+    assert store.get(1) is first
+    assert store.with_id(1) == [first, second]
+    assert store.in_row(1) == [first, other]
+    assert len(store.by_date()) == 3
+    del store[0]  # One occurrence remains, so first is still indexed
+    assert store.with_id(1) == [second, first]
+    del store[store.index(second)]
+    assert store.get(1) is first
+    first.task_id = 3  # ID edited in place
+    store.refresh()
+    assert store.get(1) is None and store.get(3) is first
+    assert set(store.task_ids()) == {2, 3}
+    _assert_matches_brute_force(store, [])
+
+    print("  [PASSED]")
+    return True
+
+
+def test_random_operations():
+    """Test a long random sequence of operations against the brute-force scan after every step."""
+    print("Testing: Random operations match a brute-force scan...")
+    rnd = random.Random(4)
+    row_counts = [3, 4, 5]
+    store = TaskStore()
+    store.set_swimlanes(row_counts)
+    pool = [_make_task(rnd, f"pool{i}") for i in range(60)]  # Reused, so objects repeat
+    for step in range(1500):
+        op = rnd.random()
+        if op < 0.25:
+            store.append(rnd.choice(pool) if rnd.random() < 0.1 else _make_task(rnd, f"s{step}"))
+        elif op < 0.35:
+            store.insert(rnd.randint(0, len(store)), _make_task(rnd, f"s{step}"))
+        elif op < 0.45 and len(store):
+            del store[rnd.randrange(len(store))]
+        elif op < 0.5 and len(store):
+            store[rnd.randrange(len(store))] = _make_task(rnd, f"s{step}")
+        elif op < 0.55 and len(store) > 3:
+            i = rnd.randrange(len(store) - 2)
+            store[i:i + 2] = [_make_task(rnd, f"s{step}")]
+        elif op < 0.65:
+            tasks = [task for task in store if rnd.random() < 0.9] + [_make_task(rnd, f"s{step}")]
+            for task in rnd.sample(tasks, min(3, len(tasks))):
+                task.row_number = rnd.randint(1, MAX_ROW)
+                task.start_date = rnd.choice(["", "2024-01-10"])
+            store.update(tasks)
+        elif op < 0.7:
+            row_counts = [rnd.randint(1, 6) for _ in range(rnd.randint(0, 4))]
+            store.set_swimlanes(row_counts)
+        elif op < 0.75 and len(store):
+            store.remove(store[rnd.randrange(len(store))])
+        elif op < 0.78:
+            store.sort(key=lambda task: task.finish_date)
+        elif op < 0.8 and len(store):
+            store.pop()
+        elif op < 0.82 and len(store) > 20:
+            store.clear()
+        _assert_matches_brute_force(store, row_counts)
+
+    print("  [PASSED]")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing TaskStore Indexes")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("List operations", test_list_operations),
+        ("update() and refresh()", test_update_and_refresh),
+        ("update() with copies", test_update_with_copies),
+        ("Swimlane regrouping", test_swimlane_regrouping),
+        ("Duplicate IDs", test_duplicate_ids),
+        ("Random operations", test_random_operations),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"  [FAILED]")
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAILED]: {e}")
+        except Exception as e:
+            failed += 1
+            print(f"  [ERROR]: {e}")
+            import traceback
+            traceback.print_exc()
+        print()
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    if failed == 0:
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[FAILURE] Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -280,6 +280,15 @@ class MainWindow(QMainWindow):
         if hasattr(self.tasks_tab, '_refresh_all_swimlane_columns'):
             self.tasks_tab._refresh_all_swimlane_columns()
     
+    def select_task(self, task_id: int):
+        """Show the Tasks tab with task_id selected (e.g. after it was clicked on the chart)."""
+        if self.tasks_tab.select_task(task_id):
+            self.tab_widget.setCurrentWidget(self.tasks_tab)
+            self.raise_()
+            self.activateWindow()
+        else:
+            self.status_bar.showMessage(f"Task {task_id} is not in the tasks table")
+    
     def _sync_all_tabs(self):
         """Sync all tabs to ensure project_data is up to date."""
         try:
@@ -0,0 +1,211 @@
+# File: minimap.py
+"""Overview of the whole chart with the part shown in the display window outlined.
+
+The thumbnail is rendered once per document, at low resolution and without antialiasing,
+the first time the minimap is shown after the document changes. A pass over a huge chart
+takes seconds however small the image, so it runs on a background thread when the SVG
+source is known. Scrolling only moves the outline: each frame repaints the area around the
+old and new outline from a cached pixmap scaled to the widget, so the cost does not grow
+with the chart.
+"""
+from PyQt5.QtCore import QByteArray, QObject, QPointF, QRect, QRectF, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter, QPalette, QPen, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+import logging
+from services.raster_export import load_svg_renderer
+
+THUMBNAIL_MAX_EDGE = 640  # Longest side of the rendered thumbnail in pixels
+VIEWPORT_COLOR = QColor(0, 120, 215)
+
+
+def thumbnail_size(size: QSize) -> QSize:
+    """Size of the thumbnail of an SVG of the given size: at most THUMBNAIL_MAX_EDGE on its longest side."""
+    scale = min(THUMBNAIL_MAX_EDGE / max(size.width(), size.height()), 1.0)
+    return QSize(max(1, round(size.width() * scale)), max(1, round(size.height() * scale)))
+
+
+def render_thumbnail(renderer: QSvgRenderer, size: QSize) -> QImage:
+    """Render the whole SVG into an opaque image of size, without antialiasing."""
+    image = QImage(size, QImage.Format_RGB32)
+    image.fill(Qt.white)
+    painter = QPainter(image)
+    renderer.render(painter, QRectF(0, 0, size.width(), size.height()))
+    painter.end()
+    return image
+
+
+class _ThumbnailJobSignals(QObject):
+    finished = pyqtSignal(object)  # _ThumbnailJob
+
+
+class _ThumbnailJob(QRunnable):
+    """Renders a thumbnail on a pool thread from its own renderer (QSvgRenderer is not thread-safe)."""
+
+    def __init__(self, source, document: int, size: QSize, signals: _ThumbnailJobSignals):
+        super().__init__()
+        self.setAutoDelete(False)  # The minimap keeps the job until it reports back
+        self.source = source
+        self.document = document
+        self.size = size
+        self.signals = signals
+        self.image = None
+
+    def run(self):
+        try:
+            self.image = render_thumbnail(load_svg_renderer(self.source), self.size)
+        except Exception as e:
+            logging.error(f"Overview thumbnail render failed: {e}")
+        self.signals.finished.emit(self)
+
+
+class Minimap(QWidget):
+    """Thumbnail of an SVG with a draggable rectangle marking the visible part.
+
+    Positions are exchanged as fractions of the document (0-1 on each axis), so the minimap
+    does not depend on the zoom or scroll range of the view it follows.
+    """
+    pan_requested = pyqtSignal(QPointF)  # Requested top-left of the visible part, as fractions
+
+    def __init__(self, renderer: QSvgRenderer, parent=None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.setBackgroundRole(QPalette.Window)
+        self.setAutoFillBackground(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(80, 40)
+        self._document = 0  # Bumped for each new SVG so a late thumbnail of an older one is dropped
+        self._source = None  # SVG bytes or file path, parsed again by the background job
+        self._thumbnail = None  # Rendered once per document, None until first shown
+        self._job = None  # Background job rendering the thumbnail of the current document
+        self._scaled = None  # Thumbnail scaled to fit the widget, redone on resize
+        self._viewport = QRectF(0, 0, 1, 1)  # Visible part of the document, as fractions
+        self._drag_offset = None  # Pointer position within the outline while dragging
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._job_signals = _ThumbnailJobSignals(self)
+        self._job_signals.finished.connect(self._on_job_finished)
+
+    def document_changed(self, source=None):
+        """Forget the thumbnail of the previous SVG; call after the renderer loads a new document.
+
+        Args:
+            source: The SVG the renderer loaded (bytes, QByteArray or file path), for background rendering.
+                Without it the thumbnail is rendered directly.
+        """
+        self._document += 1
+        self._source = bytes(source) if isinstance(source, QByteArray) else source
+        if self._job is not None and self._pool.tryTake(self._job):
+            self._job = None  # Not started yet: never runs
+        self._thumbnail = None
+        self._scaled = None
+        self.update()
+
+    def set_viewport(self, viewport: QRectF):
+        """Outline the visible part of the document, given as fractions."""
+        if viewport == self._viewport:
+            return
+        old = self._outline_rect()
+        self._viewport = QRectF(viewport)
+        if self._scaled is None:
+            self.update()
+        else:
+            # Only the strips around the old and new outline change
+            self.update(old.united(self._outline_rect()).adjusted(-2, -2, 2, 2))
+
+    def sizeHint(self) -> QSize:
+        return QSize(240, 120)
+
+    def _request_thumbnail(self):
+        """Render the thumbnail directly, or start the background job for it when the source is known."""
+        size = self.renderer.defaultSize()
+        if not self.renderer.isValid() or size.isEmpty():
+            return
+        if self._source is None:
+            self._thumbnail = QPixmap.fromImage(render_thumbnail(self.renderer, thumbnail_size(size)))
+        elif self._job is None or self._job.document != self._document:
+            self._job = _ThumbnailJob(self._source, self._document, thumbnail_size(size), self._job_signals)
+            self._pool.start(self._job)
+
+    def _on_job_finished(self, job: _ThumbnailJob):
+        if job is self._job:
+            self._job = None
+        if job.document != self._document or job.image is None:
+            return  # Superseded by a newer SVG
+        self._thumbnail = QPixmap.fromImage(job.image)
+        self._scaled = None
+        self.update()
+
+    def shutdown(self):
+        """Cancel a queued thumbnail render and wait for a running one."""
+        if self._job is not None:
+            self._pool.tryTake(self._job)
+        self._pool.waitForDone()
+
+    def _scaled_thumbnail(self) -> QPixmap:
+        if self._thumbnail is None:
+            self._request_thumbnail()
+            if self._thumbnail is None:
+                return None
+        if self._scaled is None:
+            self._scaled = self._thumbnail.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return self._scaled
+
+    def _image_rect(self) -> QRect:
+        """Widget area covered by the scaled thumbnail (centered)."""
+        if self._scaled is None:
+            return QRect()
+        return QRect((self.width() - self._scaled.width()) // 2, (self.height() - self._scaled.height()) // 2,
+                     self._scaled.width(), self._scaled.height())
+
+    def _outline_rect(self) -> QRect:
+        image = self._image_rect()
+        if image.isEmpty():
+            return QRect()
+        return QRectF(image.x() + self._viewport.x() * image.width(), image.y() + self._viewport.y() * image.height(),
+                      self._viewport.width() * image.width(), self._viewport.height() * image.height()).toRect()
+
+    def resizeEvent(self, event):
+        self._scaled = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        pixmap = self._scaled_thumbnail()
+        if pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(self._image_rect().topLeft(), pixmap)
+        outline = self._outline_rect().adjusted(0, 0, -1, -1)
+        fill = QColor(VIEWPORT_COLOR)
+        fill.setAlpha(40)
+        painter.fillRect(outline, fill)
+        painter.setPen(QPen(VIEWPORT_COLOR, 2))
+        painter.drawRect(outline)
+        painter.end()
+
+    def _to_fraction(self, pos) -> QPointF:
+        image = self._image_rect()
+        return QPointF((pos.x() - image.x()) / image.width(), (pos.y() - image.y()) / image.height())
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton or self._image_rect().isEmpty():
+            return super().mousePressEvent(event)
+        point = self._to_fraction(event.pos())
+        if self._viewport.contains(point):
+            self._drag_offset = point - self._viewport.topLeft()
+        else:
+            # Jump so the outline is centered on the click, then keep dragging from there
+            self._drag_offset = QPointF(self._viewport.width() / 2, self._viewport.height() / 2)
+            self.pan_requested.emit(point - self._drag_offset)
+        self.setCursor(Qt.ClosedHandCursor)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_offset is None or self._image_rect().isEmpty():
+            return super().mouseMoveEvent(event)
+        self.pan_requested.emit(self._to_fraction(event.pos()) - self._drag_offset)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self._drag_offset is not None:
+            self._drag_offset = None
+            self.unsetCursor()
+        super().mouseReleaseEvent(event)
@@ -0,0 +1,345 @@
+# File: svg_canvas.py
+"""Tiled SVG view for the chart display window.
+
+The chart is painted from fixed-size tiles cached per zoom level, so scrolling only renders
+tiles that come into view and zooming back to a recent level reuses its tiles. Tiles of
+slow charts are shown as a quick low-resolution preview first while the full-quality
+tiles render on a background thread.
+"""
+from collections import OrderedDict
+from PyQt5.QtCore import (QByteArray, QObject, QPoint, QPointF, QRect, QRectF, QRunnable, QSize, Qt, QThreadPool,
+                          pyqtSignal)
+from PyQt5.QtGui import QImage, QPainter, QPalette, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtWidgets import QWidget
+import logging
+import time
+from services.raster_export import load_svg_renderer
+
+TILE_SIZE = 256  # Tile edge in screen pixels
+PREVIEW_SCALE = 0.25  # Resolution of the quick preview pass (rasterizing dominates on large charts)
+SYNC_RENDER_SECONDS = 0.05  # Full passes faster than this render directly, without a preview
+
+
+class TileCache:
+    """LRU of rendered tile pixmaps bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._tiles = OrderedDict()  # (document, zoom, column, row) -> QPixmap, least recently used first
+        self._size = 0
+
+    def get(self, key) -> QPixmap:
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap: QPixmap):
+        previous = self._tiles.pop(key, None)
+        if previous is not None:
+            self._size -= self._bytes(previous)
+        self._tiles[key] = pixmap
+        self._size += self._bytes(pixmap)
+        while self._size > self.max_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self._size -= self._bytes(evicted)
+
+    @staticmethod
+    def _bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * 4
+
+    def clear(self):
+        self._tiles.clear()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+
+class _RenderJobSignals(QObject):
+    finished = pyqtSignal(object)  # _TileRenderJob
+
+
+class _TileRenderJob(QRunnable):
+    """Full-quality render of a block of tiles into a QImage on a pool thread.
+
+    QSvgRenderer objects must not be shared between threads, so each job parses the SVG
+    source into its own renderer.
+    """
+
+    def __init__(self, source, key: tuple, block: QRect, content_size: QSize, positions: list,
+                 signals: _RenderJobSignals):
+        super().__init__()
+        self.setAutoDelete(False)  # The canvas keeps jobs until they report back
+        self.source = source
+        self.key = key  # (document, zoom)
+        self.block = block
+        self.content_size = content_size
+        self.positions = positions
+        self.signals = signals
+        self.cancelled = False
+        self.image = None
+        self.seconds = 0.0
+
+    def run(self):
+        if self.cancelled:
+            self.signals.finished.emit(self)
+            return
+        start = time.perf_counter()
+        try:
+            renderer = load_svg_renderer(self.source)
+            image = QImage(self.block.size(), QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.Antialiasing)
+            renderer.render(painter, QRectF(-self.block.x(), -self.block.y(),
+                                            self.content_size.width(), self.content_size.height()))
+            painter.end()
+            self.image = image
+        except Exception as e:
+            logging.error(f"Background tile render failed: {e}")
+        self.seconds = time.perf_counter() - start
+        self.signals.finished.emit(self)
+
+
+class SvgCanvas(QWidget):
+    """Paints an SVG at a zoom level from cached tiles.
+
+    The content is centered when it is smaller than the widget (as in a scroll area that
+    resizes its widget). On each paint only the missing tiles in the exposed area are
+    rendered, in a single pass over the SVG, and cut into tiles for reuse.
+
+    When the last full-quality pass took longer than SYNC_RENDER_SECONDS, missing tiles are
+    first painted from a fast low-resolution, non-antialiased pass, and the full-quality block
+    is rendered by a background job and swapped in when it finishes. Loading another SVG
+    cancels all unfinished jobs; changing the zoom cancels the queued ones, and tiles from
+    running ones are kept for that zoom level.
+
+    Mouse moves and left clicks over the SVG are reported in SVG user units.
+    """
+    mouse_moved = pyqtSignal(QPointF, QPoint)  # SVG position, global position
+    mouse_left = pyqtSignal()  # Pointer left the SVG or the widget
+    clicked = pyqtSignal(QPointF)  # SVG position of a left click
+
+    def __init__(self, renderer: QSvgRenderer, cache_mb: int = 96, parent=None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.setBackgroundRole(QPalette.Base)
+        self.setAutoFillBackground(True)
+        self.setMouseTracking(True)
+        self._zoom = 1.0
+        self._document = 0  # Bumped for each new SVG so its tiles never mix with older ones
+        self._source = None  # SVG bytes or file path, parsed again by background jobs
+        self._tiles = TileCache(cache_mb * 1024 * 1024)
+        self._previews = {}  # tile key -> low-resolution pixmap until the full tile arrives
+        self._jobs = {}  # tile key -> background job rendering it
+        self._active_jobs = set()  # Started jobs, referenced until they report back
+        self._full_render_seconds = 0.0  # Duration of the last full-quality pass
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._job_signals = _RenderJobSignals(self)
+        self._job_signals.finished.connect(self._on_job_finished)
+
+    def document_changed(self, source=None):
+        """Drop tiles of the previous SVG; call after the renderer loads a new document.
+
+        Args:
+            source: The SVG the renderer loaded (bytes, QByteArray or file path), for background rendering.
+                Without it every tile is rendered directly.
+        """
+        self._document += 1
+        self._source = bytes(source) if isinstance(source, QByteArray) else source
+        self._cancel_jobs(running=True)
+        self._tiles.clear()
+        self._update_size()
+        self.update()
+
+    def set_zoom(self, zoom: float):
+        """Show the SVG at zoom (1.0 = native size)."""
+        if zoom != self._zoom:
+            self._zoom = zoom
+            self._cancel_jobs(running=False)  # Their tiles are no longer visible
+            self._update_size()
+            self.update()
+
+    def _cancel_jobs(self, running: bool):
+        """Cancel queued jobs, and mark running ones so their results are discarded if running is set."""
+        for job in list(self._active_jobs):
+            if self._pool.tryTake(job):  # Not started yet: never runs
+                job.cancelled = True
+                self._active_jobs.discard(job)
+            elif running:
+                job.cancelled = True
+        self._jobs = {key: job for key, job in self._jobs.items() if not job.cancelled}
+        self._previews.clear()
+
+    @property
+    def zoom(self) -> float:
+        return self._zoom
+
+    def content_size(self) -> QSize:
+        """Size of the SVG at the current zoom, in screen pixels."""
+        size = self.renderer.defaultSize()
+        return QSize(int(size.width() * self._zoom), int(size.height() * self._zoom))
+
+    def content_origin(self) -> QPoint:
+        """Widget position of the SVG's top-left corner."""
+        size = self.content_size()
+        return QPoint(max(0, (self.width() - size.width()) // 2), max(0, (self.height() - size.height()) // 2))
+
+    def map_to_document(self, pos: QPoint):
+        """Convert a widget position to SVG user units, or None when it is outside the SVG."""
+        content_size = self.content_size()
+        if not self.renderer.isValid() or content_size.isEmpty():
+            return None
+        local = pos - self.content_origin()
+        if not QRect(QPoint(0, 0), content_size).contains(local):
+            return None
+        view = self.renderer.viewBoxF()
+        return QPointF(view.x() + local.x() * view.width() / content_size.width(),
+                       view.y() + local.y() * view.height() / content_size.height())
+
+    def mouseMoveEvent(self, event):
+        point = self.map_to_document(event.pos())
+        if point is None:
+            self.mouse_left.emit()
+        else:
+            self.mouse_moved.emit(point, event.globalPos())
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.mouse_left.emit()
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            point = self.map_to_document(event.pos())
+            if point is not None:
+                self.clicked.emit(point)
+        super().mousePressEvent(event)
+
+    def _update_size(self):
+        # The scroll area grows the widget to at least the viewport and scrolls beyond this
+        self.setMinimumSize(self.content_size())
+
+    def sizeHint(self) -> QSize:
+        return self.content_size()
+
+    def paintEvent(self, event):
+        content_size = self.content_size()
+        if not self.renderer.isValid() or content_size.isEmpty():
+            return
+        origin = self.content_origin()
+        exposed = event.rect().intersected(QRect(origin, content_size)).translated(-origin)
+        if exposed.isEmpty():
+            return
+        columns = range(exposed.left() // TILE_SIZE, exposed.right() // TILE_SIZE + 1)
+        rows = range(exposed.top() // TILE_SIZE, exposed.bottom() // TILE_SIZE + 1)
+        tiles = {(column, row): self._tiles.get(self._tile_key(column, row)) for row in rows for column in columns}
+        missing = [position for position, pixmap in tiles.items()
+                   if pixmap is None and self._tile_key(*position) not in self._previews]
+        if missing:
+            if self._source is None or self._full_render_seconds < SYNC_RENDER_SECONDS:
+                tiles.update(self._render_tiles(missing, content_size))
+            else:
+                self._render_previews(missing, content_size)
+                unscheduled = [position for position in missing if self._tile_key(*position) not in self._jobs]
+                if unscheduled:
+                    self._start_job(unscheduled, content_size)
+
+        painter = QPainter(self)
+        for (column, row), pixmap in tiles.items():
+            x, y = origin.x() + column * TILE_SIZE, origin.y() + row * TILE_SIZE
+            if pixmap is not None:
+                painter.drawPixmap(x, y, pixmap)
+                continue
+            preview = self._previews.get(self._tile_key(column, row))
+            if preview is not None:
+                tile = QRect(column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE).intersected(
+                    QRect(QPoint(0, 0), content_size))
+                painter.drawPixmap(QRect(x, y, tile.width(), tile.height()), preview)
+        painter.end()
+
+    def _tile_key(self, column: int, row: int, zoom: float = None) -> tuple:
+        return (self._document, self._zoom if zoom is None else zoom, column, row)
+
+    @staticmethod
+    def _block(positions: list, content_size: QSize) -> QRect:
+        """Smallest rectangle of whole tiles covering positions, clipped to the content."""
+        first_column = min(column for column, _ in positions)
+        last_column = max(column for column, _ in positions)
+        first_row = min(row for _, row in positions)
+        last_row = max(row for _, row in positions)
+        return QRect(first_column * TILE_SIZE, first_row * TILE_SIZE,
+                     (last_column - first_column + 1) * TILE_SIZE,
+                     (last_row - first_row + 1) * TILE_SIZE).intersected(QRect(QPoint(0, 0), content_size))
+
+    def _render_tiles(self, positions: list, content_size: QSize) -> dict:
+        """Render the block of tiles covering positions in one pass and cache each tile."""
+        block = self._block(positions, content_size)
+        start = time.perf_counter()
+        image = QPixmap(block.size())
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # Whole document mapped to the zoomed size, shifted so the block lands at the origin
+        self.renderer.render(painter, QRectF(-block.x(), -block.y(), content_size.width(), content_size.height()))
+        painter.end()
+        self._full_render_seconds = time.perf_counter() - start
+        return self._cache_block(image, block, positions)
+
+    def _cache_block(self, image: QPixmap, block: QRect, positions: list, zoom: float = None) -> dict:
+        """Cut a rendered block into tiles, cache them and return them by position."""
+        rendered = {}
+        for column, row in positions:
+            tile = QRect(column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE).intersected(block)
+            pixmap = image.copy(tile.translated(-block.topLeft()))
+            self._tiles.put(self._tile_key(column, row, zoom), pixmap)
+            rendered[(column, row)] = pixmap
+        return rendered
+
+    def _render_previews(self, positions: list, content_size: QSize):
+        """Render the block at PREVIEW_SCALE without antialiasing and keep a preview per tile."""
+        block = self._block(positions, content_size)
+        preview = QPixmap(max(1, round(block.width() * PREVIEW_SCALE)), max(1, round(block.height() * PREVIEW_SCALE)))
+        preview.fill(Qt.transparent)
+        painter = QPainter(preview)
+        painter.scale(PREVIEW_SCALE, PREVIEW_SCALE)
+        self.renderer.render(painter, QRectF(-block.x(), -block.y(), content_size.width(), content_size.height()))
+        painter.end()
+        for column, row in positions:
+            tile = QRect(column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE).intersected(block)
+            tile.translate(-block.topLeft())
+            source = QRect(round(tile.x() * PREVIEW_SCALE), round(tile.y() * PREVIEW_SCALE),
+                           max(1, round(tile.width() * PREVIEW_SCALE)), max(1, round(tile.height() * PREVIEW_SCALE)))
+            self._previews[self._tile_key(column, row)] = preview.copy(source)
+
+    def _start_job(self, positions: list, content_size: QSize):
+        job = _TileRenderJob(self._source, (self._document, self._zoom), self._block(positions, content_size),
+                             content_size, positions, self._job_signals)
+        for column, row in positions:
+            self._jobs[self._tile_key(column, row)] = job
+        self._active_jobs.add(job)
+        self._pool.start(job)
+
+    def _on_job_finished(self, job: _TileRenderJob):
+        self._active_jobs.discard(job)
+        document, zoom = job.key
+        if job.cancelled or job.image is None or document != self._document:
+            return  # Superseded by a newer SVG
+        self._full_render_seconds = job.seconds
+        for column, row in job.positions:
+            key = self._tile_key(column, row, zoom)
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+                self._previews.pop(key, None)
+        # Tiles of an earlier zoom level are kept for zooming back
+        self._cache_block(QPixmap.fromImage(job.image), job.block, job.positions, zoom)
+        if zoom == self._zoom:
+            self.update(job.block.translated(self.content_origin()))
+
+    def shutdown(self):
+        """Cancel queued background renders and wait for running ones."""
+        self._cancel_jobs(running=True)
+        self._pool.waitForDone()
@@ -1,19 +1,27 @@
 from PyQt5.QtWidgets import (
-    QMainWindow, QVBoxLayout, QScrollArea, QPushButton, QHBoxLayout, QLabel, QApplication, QStatusBar, QWidget, QFileDialog, QMessageBox, QFrame
+    QMainWindow, QVBoxLayout, QScrollArea, QPushButton, QHBoxLayout, QApplication, QStatusBar, QWidget, QFileDialog, QMessageBox, QFrame,
+    QToolTip, QDockWidget, QInputDialog
 )
 from PyQt5.QtSvg import QSvgRenderer
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QPalette, QImage
+from PyQt5.QtGui import QIcon, QPixmap, QPainter
 from pathlib import Path
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QByteArray, QTimer, QPoint, QPointF, QRectF, pyqtSignal
 import os
-import tempfile
-import re
 import logging
 from config.app_config import AppConfig
+from services.raster_export import SCREEN_DPI, export_png_tiled
+from services.spatial_index import GridIndex
+from ui.minimap import Minimap
+from ui.svg_canvas import SvgCanvas
 from ui.window_utils import move_window_according_to_preferences
 
+RESIZE_DEBOUNCE_MS = 120
+HIT_TOLERANCE_PX = 3  # Screen pixels around thin lines (links, pipes) that still count as over them
+
 # --- Main SVG Display Window ---
 class SvgDisplay(QMainWindow):
+    task_selected = pyqtSignal(int)  # task_id of a task clicked on the chart
+
     def __init__(self, app_config, initial_path=None, reference_window=None):
         super().__init__()
         
@@ -29,39 +37,66 @@ class SvgDisplay(QMainWindow):
         height = app_config.general.svg_display_height
         self.resize(width, height)
         
-        # Store SVG path for saving
+        # Path of the displayed SVG when loaded from disk (None for in-memory SVGs)
         self._svg_path = None
+        self._svg_loaded = False
+        self._png_export_scale = 1.0  # Last scale chosen for PNG export (PNG pixels per chart pixel)
 
         self.svg_renderer = QSvgRenderer()
-        self.svg_label = QLabel()
-        self.svg_label.setAlignment(Qt.AlignCenter)
-        self.svg_label.setBackgroundRole(QPalette.Base)
-        self.svg_label.setSizePolicy(self.svg_label.sizePolicy().horizontalPolicy(), self.svg_label.sizePolicy().verticalPolicy())
+        # Paints the chart from cached tiles; only newly visible tiles are rendered on scroll
+        self.svg_canvas = SvgCanvas(self.svg_renderer)
+        self.svg_canvas.mouse_moved.connect(self._on_chart_hover)
+        self.svg_canvas.mouse_left.connect(self._clear_hover)
+        self.svg_canvas.clicked.connect(self._on_chart_clicked)
+
+        # Geometry map of the displayed chart and a spatial index over its regions for hit tests
+        self._hit_regions = []
+        self._hit_index = None
+        self._hovered_region = None
 
         self.scroll_area = QScrollArea()
-        self.scroll_area.setWidget(self.svg_label)
+        self.scroll_area.setWidget(self.svg_canvas)
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setFrameShape(QFrame.NoFrame)  # Remove default frame for consistent rendering
 
+        # Overview of the whole chart; its outline follows the scroll bars and dragging it pans the chart
+        self.minimap = Minimap(self.svg_renderer)
+        self.minimap.pan_requested.connect(self._pan_to)
+        self.minimap_dock = QDockWidget("Overview", self)
+        self.minimap_dock.setObjectName("overview_dock")
+        self.minimap_dock.setWidget(self.minimap)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.minimap_dock)
+        for scroll_bar in (self.scroll_area.horizontalScrollBar(), self.scroll_area.verticalScrollBar()):
+            scroll_bar.valueChanged.connect(self._update_minimap_viewport)
+            scroll_bar.rangeChanged.connect(self._update_minimap_viewport)
+
         # Create zoom control buttons with styling
         self.zoom_in_btn = QPushButton("Zoom In")
         self.zoom_out_btn = QPushButton("Zoom Out")
         self.fit_btn = QPushButton("Fit to Window")
+        self.overview_btn = QPushButton("Overview")
+        self.overview_btn.setCheckable(True)
+        self.overview_btn.setChecked(True)
         
         # Add keyboard shortcuts
         self.zoom_in_btn.setShortcut("Ctrl++")
         self.zoom_out_btn.setShortcut("Ctrl+-")
         self.fit_btn.setShortcut("Ctrl+0")
+        self.overview_btn.setShortcut("Ctrl+M")
         
         # Add tooltips
         self.zoom_in_btn.setToolTip("Zoom in (Ctrl++)")
         self.zoom_out_btn.setToolTip("Zoom out (Ctrl+-)")
         self.fit_btn.setToolTip("Fit to window (Ctrl+0)")
+        self.overview_btn.setToolTip("Show or hide the chart overview (Ctrl+M)")
         
         # Connect signals
         self.zoom_in_btn.clicked.connect(self.zoom_in)
         self.zoom_out_btn.clicked.connect(self.zoom_out)
         self.fit_btn.clicked.connect(self.fit_to_window)
+        self.overview_btn.toggled.connect(self.minimap_dock.setVisible)
+        # Keep the button in step when the dock is closed from its title bar
+        self.minimap_dock.toggleViewAction().toggled.connect(self.overview_btn.setChecked)
         
         # Style buttons to match Update Image button in main window
         button_style = """
@@ -72,6 +107,7 @@ class SvgDisplay(QMainWindow):
         self.zoom_in_btn.setStyleSheet(button_style)
         self.zoom_out_btn.setStyleSheet(button_style)
         self.fit_btn.setStyleSheet(button_style)
+        self.overview_btn.setStyleSheet(button_style)
         
         # Store button style for reuse
         self._button_style = button_style
@@ -99,6 +135,7 @@ class SvgDisplay(QMainWindow):
         btn_layout.addWidget(self.zoom_in_btn)
         btn_layout.addWidget(self.zoom_out_btn)
         btn_layout.addWidget(self.fit_btn)
+        btn_layout.addWidget(self.overview_btn)
         btn_layout.addWidget(divider)
         btn_layout.addWidget(self.save_png_btn)
         btn_layout.addWidget(self.save_jpeg_btn)
@@ -126,6 +163,12 @@ class SvgDisplay(QMainWindow):
         self._fit_to_window = True
         self._svg_size = QSize(1, 1)
 
+        # Refit once a burst of resize events has settled instead of on every event
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._refit_after_resize)
+
         if initial_path and os.path.exists(initial_path):
             self.load_svg(initial_path)
         else:
@@ -144,51 +187,143 @@ class SvgDisplay(QMainWindow):
     def load_svg(self, svg_path):
         absolute_path = os.path.abspath(svg_path)
         if os.path.exists(absolute_path):
-            # Preserve current zoom state if SVG was already loaded
-            preserve_zoom = self._svg_path is not None and self._svg_size.width() > 0
-            saved_zoom = self._zoom
-            saved_fit_to_window = self._fit_to_window
-            
-            self._svg_path = absolute_path  # Store path for saving
-            self.svg_renderer.load(absolute_path)
-            self._svg_size = self.svg_renderer.defaultSize()
-            
-            # Restore zoom state if we had a previous SVG loaded
-            if preserve_zoom:
-                self._zoom = saved_zoom
-                self._fit_to_window = saved_fit_to_window
-            else:
-                # First load - use default zoom
-                self._zoom = 1.0
-                self._fit_to_window = True
-            
-            # Show window first to ensure viewport size is accurate
-            if not self.isVisible():
-                self.show()
-                QApplication.processEvents()  # Ensure layout is fully calculated
-            
-            # Ensure layout is processed before calculating zoom for consistent rendering
-            if self._fit_to_window and not preserve_zoom:
-                # Process events again to ensure layout is fully calculated after showing
-                QApplication.processEvents()
-                # Recalculate zoom with stable viewport size
-                area_size = self.scroll_area.viewport().size()
-                if self._svg_size.width() > 0 and self._svg_size.height() > 0:
-                    fit_scale = min(
-                        area_size.width() / self._svg_size.width(),
-                        area_size.height() / self._svg_size.height(),
-                        1.0
-                    )
-                    self._zoom = fit_scale
-            
-            self.update_image()
-            self._update_button_states()
-            self._update_zoom_label()
+            self._svg_path = absolute_path
+            self._load_renderer(absolute_path)
         else:
             print(f"SVG file not found: {absolute_path}")
 
+    def load_svg_bytes(self, svg_bytes):
+        """Load an SVG document from memory (in-memory pipeline from GanttChartService)."""
+        if not svg_bytes:
+            return
+        self._svg_path = None
+        self._load_renderer(QByteArray(bytes(svg_bytes)))
+
+    def set_geometry_map(self, geometry_map):
+        """Index the regions of the chart about to be displayed (see GanttChartService.last_geometry_map)."""
+        self._clear_hover()
+        self._hit_regions = geometry_map["regions"] if geometry_map else []
+        if not self._hit_regions:
+            self._hit_index = None
+            return
+        _, _, xs, ys, widths, heights, _ = zip(*self._hit_regions)
+        self._hit_index = GridIndex(xs, ys, widths, heights)
+
+    def region_at(self, point: QPointF):
+        """Return the topmost geometry map region at an SVG position, or None.
+
+        Boxes (tasks, curtains, notes) containing the point win; lines (links, pipes) are hit
+        within HIT_TOLERANCE_PX elsewhere, since links run through the middle of task bars.
+        """
+        if self._hit_index is None:
+            return None
+        for position in self._hit_index.at(point.x(), point.y()).tolist():
+            region = self._hit_regions[position]
+            if region[4] > 0 and region[5] > 0:
+                return region
+        hits = self._hit_index.at(point.x(), point.y(), HIT_TOLERANCE_PX / self.svg_canvas.zoom)
+        return self._hit_regions[hits[0]] if len(hits) else None
+
+    def _on_chart_hover(self, point: QPointF, global_pos: QPoint):
+        region = self.region_at(point)
+        if region is self._hovered_region:
+            return
+        self._hovered_region = region
+        if region is None:
+            QToolTip.hideText()
+            self.svg_canvas.unsetCursor()
+            return
+        kind, element_id, _, _, _, _, label = region
+        text = f"{kind.capitalize()} {element_id}"
+        QToolTip.showText(global_pos, f"{text}\n{label}" if label else text, self.svg_canvas)
+        if kind == "task":
+            self.svg_canvas.setCursor(Qt.PointingHandCursor)
+        else:
+            self.svg_canvas.unsetCursor()
+
+    def _clear_hover(self):
+        if self._hovered_region is not None:
+            self._hovered_region = None
+            QToolTip.hideText()
+            self.svg_canvas.unsetCursor()
+
+    def _on_chart_clicked(self, point: QPointF):
+        region = self.region_at(point)
+        if region is not None and region[0] == "task":
+            self.task_selected.emit(int(region[1]))
+
+    def _load_renderer(self, source):
+        """Load the SVG renderer from a file path or QByteArray and refresh the view."""
+        # Preserve current zoom state if SVG was already loaded
+        preserve_zoom = self._svg_loaded and self._svg_size.width() > 0
+        saved_zoom = self._zoom
+        saved_fit_to_window = self._fit_to_window
+        
+        self.svg_renderer.load(source)
+        self._svg_loaded = True
+        self._svg_size = self.svg_renderer.defaultSize()
+        self.svg_canvas.document_changed(source)
+        self.minimap.document_changed(source)
+        
+        # Restore zoom state if we had a previous SVG loaded
+        if preserve_zoom:
+            self._zoom = saved_zoom
+            self._fit_to_window = saved_fit_to_window
+        else:
+            # First load - use default zoom
+            self._zoom = 1.0
+            self._fit_to_window = True
+        
+        # Show window first to ensure viewport size is accurate
+        if not self.isVisible():
+            self.show()
+            QApplication.processEvents()  # Ensure layout is fully calculated
+        
+        # Ensure layout is processed before calculating zoom for consistent rendering
+        if self._fit_to_window and not preserve_zoom:
+            # Process events again to ensure layout is fully calculated after showing
+            QApplication.processEvents()
+            # Recalculate zoom with stable viewport size
+            area_size = self.scroll_area.viewport().size()
+            if self._svg_size.width() > 0 and self._svg_size.height() > 0:
+                fit_scale = min(
+                    area_size.width() / self._svg_size.width(),
+                    area_size.height() / self._svg_size.height(),
+                    1.0
+                )
+                self._zoom = fit_scale
+        
+        self.update_image()
+        self._update_button_states()
+        self._update_zoom_label()
+
+    def _update_minimap_viewport(self):
+        """Outline the part of the chart visible in the scroll area on the minimap."""
+        content_size = self.svg_canvas.content_size()
+        if content_size.isEmpty():
+            return
+        origin = self.svg_canvas.content_origin()
+        viewport = self.scroll_area.viewport().size()
+        x = self.scroll_area.horizontalScrollBar().value() - origin.x()
+        y = self.scroll_area.verticalScrollBar().value() - origin.y()
+        width, height = content_size.width(), content_size.height()
+        visible = QRectF(x / width, y / height, viewport.width() / width, viewport.height() / height)
+        self.minimap.set_viewport(visible.intersected(QRectF(0, 0, 1, 1)))
+
+    def _pan_to(self, top_left: QPointF):
+        """Scroll so the chart position top_left (as fractions of the chart) is at the viewport's corner."""
+        content_size = self.svg_canvas.content_size()
+        origin = self.svg_canvas.content_origin()
+        # The scroll bars clamp values outside their range
+        self.scroll_area.horizontalScrollBar().setValue(round(origin.x() + top_left.x() * content_size.width()))
+        self.scroll_area.verticalScrollBar().setValue(round(origin.y() + top_left.y() * content_size.height()))
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        if self._fit_to_window:
+            self._resize_timer.start()
+
+    def _refit_after_resize(self):
         if self._fit_to_window:
             # Update _zoom to match the new fit scale so zooming continues smoothly
             area_size = self.scroll_area.viewport().size()
@@ -203,25 +338,8 @@ class SvgDisplay(QMainWindow):
             self._update_zoom_label()
 
     def update_image(self):
-        if self._fit_to_window:
-            # Use stored zoom value (calculated in load_svg or resizeEvent) for consistency
-            # This avoids recalculating zoom every time, which can cause inconsistencies
-            scale = self._zoom
-        else:
-            scale = self._zoom
-
-        render_size = QSize(
-            int(self._svg_size.width() * scale),
-            int(self._svg_size.height() * scale)
-        )
-        pixmap = QPixmap(render_size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        self.svg_renderer.render(painter)
-        painter.end()
-        self.svg_label.setPixmap(pixmap)
-        self.svg_label.resize(render_size)
+        # Tiles already rendered at this zoom are reused; others render when they are painted
+        self.svg_canvas.set_zoom(self._zoom)
 
     def zoom_in(self):
         self._fit_to_window = False
@@ -277,7 +395,7 @@ class SvgDisplay(QMainWindow):
 
     def center_scroll_area_on_svg(self):
         area = self.scroll_area
-        widget = self.svg_label
+        widget = self.svg_canvas
         h_bar = area.horizontalScrollBar()
         v_bar = area.verticalScrollBar()
         widget_center_x = widget.width() // 2
@@ -289,10 +407,22 @@ class SvgDisplay(QMainWindow):
 
     def save_as_raster(self, format_type="PNG"):
         """Save the SVG as a raster image (PNG or JPEG)."""
-        if not self._svg_path or not self.svg_renderer.isValid():
+        if not self._svg_loaded or not self.svg_renderer.isValid():
             QMessageBox.warning(self, "No Image", "No SVG image loaded to save.")
             return
         
+        if format_type == "PNG":
+            # PNGs are rendered in tiles, so large scales for print don't need one huge image
+            scale, accepted = QInputDialog.getDouble(
+                self,
+                "PNG Export Scale",
+                f"Scale (1 = {self._svg_size.width()} × {self._svg_size.height()} px at {SCREEN_DPI} DPI):",
+                self._png_export_scale, 0.1, 20.0, 2
+            )
+            if not accepted:
+                return
+            self._png_export_scale = scale
+        
         # Determine file extension and filter based on format
         if format_type == "JPEG":
             default_ext = ".jpg"
@@ -319,52 +449,14 @@ class SvgDisplay(QMainWindow):
         try:
             # Render SVG at native size for high quality
             native_size = self._svg_size
+            details = ""
             
             if format_type == "PNG":
-                # For PNG, we need to remove the white background rectangle from SVG
-                # to achieve transparency. Modify SVG temporarily.
-                try:
-                    # Read SVG as text and remove white background rectangle using regex
-                    with open(self._svg_path, 'r', encoding='utf-8') as f:
-                        svg_content = f.read()
-                    
-                    # Remove white background rectangle: <rect fill="white" ... x="0" y="0" ... />
-                    # The background rect has: fill="white", x="0", y="0", and stroke="none"
-                    # Use lookaheads to ensure all required attributes are present in any order
-                    # Pattern matches rect with fill="white", x="0", y="0" (any order)
-                    pattern = r'<rect(?=[^>]*fill="white")(?=[^>]*x="0")(?=[^>]*y="0")[^>]*?/>'
-                    modified_content = re.sub(pattern, '', svg_content, count=1)  # Only replace first match
-                    
-                    # Write modified SVG to temporary file
-                    temp_svg = tempfile.NamedTemporaryFile(mode='w', suffix='.svg', delete=False, encoding='utf-8')
-                    temp_svg.write(modified_content)
-                    temp_svg.close()
-                    
-                    # Create new renderer for modified SVG
-                    temp_renderer = QSvgRenderer(temp_svg.name)
-                    
-                    # Use QImage with ARGB32 format for transparency support
-                    image = QImage(native_size, QImage.Format_ARGB32)
-                    image.fill(Qt.transparent)
-                    painter = QPainter(image)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    temp_renderer.render(painter)
-                    painter.end()
-                    
-                    # Clean up temporary file
-                    os.unlink(temp_svg.name)
-                    
-                    success = image.save(file_path, format_type)
-                except Exception as e:
-                    # Fallback: render original SVG if modification fails
-                    logging.warning(f"Failed to modify SVG for transparency: {e}")
-                    image = QImage(native_size, QImage.Format_ARGB32)
-                    image.fill(Qt.transparent)
-                    painter = QPainter(image)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    self.svg_renderer.render(painter)
-                    painter.end()
-                    success = image.save(file_path, format_type)
+                # For PNG, render from the loaded renderer without the white background for transparency.
+                # Tiles are streamed into the file, so very large charts don't need one huge image
+                size = export_png_tiled(self.svg_renderer, file_path, scale=self._png_export_scale, transparent=True)
+                details = f" ({size.width()} × {size.height()} px, {round(SCREEN_DPI * self._png_export_scale)} DPI)"
+                success = True
             else:  # JPEG
                 # Use QPixmap for JPEG (no transparency needed)
                 pixmap = QPixmap(native_size)
@@ -381,9 +473,9 @@ class SvgDisplay(QMainWindow):
                 QMessageBox.information(
                     self, 
                     "Image Saved", 
-                    f"Image successfully saved as {format_type}:\n{file_path}"
+                    f"Image successfully saved as {format_type}{details}:\n{file_path}"
                 )
-                self.status_bar.showMessage(f"Image saved as {format_type}")
+                self.status_bar.showMessage(f"Image saved as {format_type}{details}")
             else:
                 QMessageBox.critical(self, "Error", f"Failed to save image to {file_path}")
         except Exception as e:
@@ -298,9 +298,6 @@ class LinksTab(BaseTab):
 
     def _update_task_name_immediately(self, row: int, direction: str):
         """Update task name field immediately when task ID is entered."""
-        # Build task name mapping
-        task_name_map = {task.task_id: task.task_name for task in self.project_data.tasks}
-        
         # Get column indices
         if direction == "From":
             id_col = self._get_column_index("From Task ID")
@@ -323,7 +320,7 @@ class LinksTab(BaseTab):
             task_name = ""
         else:
             # Look up task name
-            task_name = task_name_map.get(task_id, "")
+            task_name = self._task_name(task_id)
         
         # Update the name field
         self.links_table.blockSignals(True)
@@ -379,9 +376,6 @@ class LinksTab(BaseTab):
         row_count = len(links)
         self.links_table.setRowCount(row_count)
         self._initializing = True
-        # Create task name mapping
-        task_name_map = {task.task_id: task.task_name for task in self.project_data.tasks}
-        
         # Ensure all link IDs are unique before loading
         self._ensure_unique_link_ids(links)
         
@@ -389,7 +383,7 @@ class LinksTab(BaseTab):
 
             # Use helper method to populate row from Link object
             link = links[row_idx]
-            self._update_table_row_from_link(row_idx, link, task_name_map)
+            self._update_table_row_from_link(row_idx, link)
         
         # Sort by ID in ascending order by default (using key-based column lookup)
         id_col = self._get_column_index("ID")
@@ -426,13 +420,12 @@ class LinksTab(BaseTab):
         
         # Update table rows with computed fields (task names, valid status)
         # Also update IDs in case they were reassigned
-        task_name_map = {task.task_id: task.task_name for task in self.project_data.tasks}
         self.links_table.blockSignals(True)
         try:
             for row_idx, link in enumerate(links):
                 if row_idx < self.links_table.rowCount():
                     # Update computed fields in the table, including ID if it was reassigned
-                    self._update_table_row_from_link(row_idx, link, task_name_map)
+                    self._update_table_row_from_link(row_idx, link)
         finally:
             self.links_table.blockSignals(False)
         
@@ -523,14 +516,19 @@ class LinksTab(BaseTab):
             logging.error(f"Error extracting link from table row {row_idx}: {e}")
             return None
     
-    def _update_table_row_from_link(self, row_idx: int, link: Link, task_name_map: Dict[int, str]) -> None:
+    def _task_name(self, task_id: int) -> str:
+        """Name of the task with task_id from the project's task store, or "" if there is none."""
+        task = self.project_data.tasks.get(task_id)
+        return task.task_name if task else ""
+
+    def _update_table_row_from_link(self, row_idx: int, link: Link) -> None:
         """
         Populate a table row from a Link object.
         Uses column name mapping instead of positional indices.
         """
         # Update task names
-        link.from_task_name = task_name_map.get(link.from_task_id, "")
-        link.to_task_name = task_name_map.get(link.to_task_id, "")
+        link.from_task_name = self._task_name(link.from_task_id)
+        link.to_task_name = self._task_name(link.to_task_id)
         
         # Get column indices by name
         id_col = self._get_column_index("ID")
@@ -614,8 +612,8 @@ class LinksTab(BaseTab):
                     if link.from_task_id <= 0 or link.to_task_id <= 0:
                         link.valid = "No"
                     else:
-                        from_task = next((t for t in self.project_data.tasks if t.task_id == link.from_task_id), None)
-                        to_task = next((t for t in self.project_data.tasks if t.task_id == link.to_task_id), None)
+                        from_task = self.project_data.tasks.get(link.from_task_id)
+                        to_task = self.project_data.tasks.get(link.to_task_id)
                         
                         if from_task and to_task:
                             from_finish_date = from_task.finish_date or from_task.start_date
@@ -649,7 +647,6 @@ class LinksTab(BaseTab):
         """Update only the Valid column and task name columns without reloading the entire table."""
         # Get Link objects directly from project_data
         links = self.project_data.links
-        task_name_map = {task.task_id: task.task_name for task in self.project_data.tasks}
         
         # Block signals to prevent recursive updates
         self.links_table.blockSignals(True)
@@ -660,7 +657,7 @@ class LinksTab(BaseTab):
                 if row_idx < len(links):
                     link = links[row_idx]
                     # Use the helper method to update the row with computed fields
-                    self._update_table_row_from_link(row_idx, link, task_name_map)
+                    self._update_table_row_from_link(row_idx, link)
         finally:
             self.links_table.blockSignals(False)
 
@@ -10,7 +10,7 @@ from ui.table_utils import NumericTableWidgetItem, add_row, remove_row, CheckBox
 from .base_tab import BaseTab
 from models.swimlane import Swimlane
 from models.task import Task
-from utils.conversion import safe_int
+from utils.conversion import safe_int, parse_internal_date
 
 # Logging is configured centrally in utils/logging_config.py
 
@@ -447,14 +447,11 @@ class SwimlanesTab(BaseTab):
 
         # Default dates: chart_start + 1 day for start, + 10 days for finish
         chart_start = getattr(self.project_data.frame_config, 'chart_start_date', '')
-        try:
-            start_dt = datetime.strptime(chart_start, "%Y-%m-%d") + timedelta(days=1)
-        except (ValueError, TypeError):
-            start_dt = datetime.today() + timedelta(days=1)
+        start_dt = (parse_internal_date(chart_start) or datetime.today()) + timedelta(days=1)
         finish_dt = start_dt + timedelta(days=10)
 
         # Next available task ID
-        used_ids = {t.task_id for t in self.project_data.tasks}
+        used_ids = self.project_data.tasks.task_ids()
         next_task_id = 1
         while next_task_id in used_ids:
             next_task_id += 1
@@ -477,14 +474,11 @@ class SwimlanesTab(BaseTab):
 
         Uses the cumulative row_count approach: swimlane N owns the consecutive
         band of chart rows that follows all preceding swimlanes' row_count values.
+        The task store keeps tasks grouped by swimlane, so no tasks are scanned.
         """
-        current_first_row = 1
-        for swimlane in self.project_data.swimlanes:
-            last_row = current_first_row + swimlane.row_count - 1
+        for order, swimlane in enumerate(self.project_data.swimlanes, start=1):
             if swimlane.swimlane_id == swimlane_id:
-                return [t for t in self.project_data.tasks
-                        if current_first_row <= t.row_number <= last_row]
-            current_first_row += swimlane.row_count
+                return self.project_data.tasks.in_swimlane(order)
         return []
 
     def _remove_swimlane(self):
@@ -1,6 +1,7 @@
 from PyQt5.QtWidgets import (QWidget, QTableWidget, QVBoxLayout, QPushButton,
                            QHBoxLayout, QComboBox, QHeaderView, QTableWidgetItem,
-                           QMessageBox, QGroupBox, QSizePolicy, QLabel, QGridLayout, QLineEdit, QSpinBox, QDateEdit, QCheckBox)
+                           QMessageBox, QGroupBox, QSizePolicy, QLabel, QGridLayout, QLineEdit, QSpinBox, QDateEdit, QCheckBox,
+                           QAbstractItemView)
 from PyQt5.QtCore import Qt, pyqtSignal, QDate
 from PyQt5.QtGui import QBrush, QColor, QFont
 from typing import List, Dict, Any, Optional, Set, Tuple
@@ -314,6 +315,21 @@ class TasksTab(BaseTab):
             self._selected_task_id = None
             self._clear_detail_form()
 
+    def select_task(self, task_id: int) -> bool:
+        """Select and scroll to the table row of task_id; return False if no row has that ID."""
+        id_col = self._get_column_index("ID")
+        if id_col is None:
+            return False
+        for row_idx in range(self.tasks_table.rowCount()):
+            if self._is_header_row(row_idx):
+                continue
+            id_item = self.tasks_table.item(row_idx, id_col)
+            if id_item and safe_int(id_item.text()) == task_id:
+                self.tasks_table.selectRow(row_idx)
+                self.tasks_table.scrollToItem(id_item, QAbstractItemView.PositionAtCenter)
+                return True
+        return False
+
     def _populate_detail_form(self, row: int):
         """Populate detail form with data from selected task."""
         self._updating_form = True
@@ -328,7 +344,7 @@ class TasksTab(BaseTab):
                 if id_item:
                     try:
                         task_id = int(id_item.text())
-                        task = next((t for t in self.project_data.tasks if t.task_id == task_id), None)
+                        task = self.project_data.tasks.get(task_id)
                     except (ValueError, TypeError):
                         pass
 
@@ -520,18 +536,15 @@ class TasksTab(BaseTab):
         # _refresh_swimlane_columns_for_row to set tooltips correctly
         self._sort_tasks_by_swimlane_and_row()
     
-    def _get_task_sort_key(self, task: Task) -> Tuple[int, int, str]:
+    def _get_task_sort_key(self, task: Task) -> Tuple[int, str]:
         """
-        Get sort key for task: (swimlane_order, row_number, finish_date).
-        Used for sorting tasks by swimlane order (Lane), then row number, then finish date.
-        Empty finish dates sort to the end (after valid dates).
+        Get sort key for task within its swimlane: (row_number, finish_date).
+        Swimlane groups come from the task store, so tasks sort by swimlane order (Lane),
+        then row number, then finish date. Empty finish dates sort to the end (after valid dates).
         """
-        swimlane_order, _ = self._get_swimlane_info_for_row(task.row_number)
-        # Use 9999 for tasks outside swimlanes (sort to end)
-        swimlane_order = swimlane_order if swimlane_order is not None else 9999
         # Use 'ZZZZ-ZZ-ZZ' for empty finish dates to sort them to the end (after valid dates)
         finish_date = task.finish_date if task.finish_date else "ZZZZ-ZZ-ZZ"
-        return (swimlane_order, task.row_number, finish_date)
+        return (task.row_number, finish_date)
     
     def _sort_tasks_by_swimlane_and_row(self):
         """Sort tasks by swimlane order, row number, finish date.
@@ -557,21 +570,16 @@ class TasksTab(BaseTab):
                         except (ValueError, TypeError):
                             pass
 
-            # Sort tasks from project_data
-            tasks = list(self.project_data.tasks)
-            tasks.sort(key=self._get_task_sort_key)
-
-            # Group tasks by swimlane order
-            swimlane_tasks: Dict[int, List[Task]] = {}
-            orphan_tasks: List[Task] = []
-            for task in tasks:
-                order, _ = self._get_swimlane_info_for_row(task.row_number)
-                if order is not None:
-                    swimlane_tasks.setdefault(order, []).append(task)
-                else:
-                    orphan_tasks.append(task)
-
+            # Group tasks by swimlane order with the task store's swimlane index, then sort
+            # each group (stable, so tasks with equal keys keep their project_data order)
+            tasks = self.project_data.tasks
             swimlanes = self.project_data.swimlanes
+            swimlane_tasks: Dict[int, List[Task]] = {
+                order: sorted(tasks.in_swimlane(order), key=self._get_task_sort_key)
+                for order in range(1, len(swimlanes) + 1)
+            }
+            orphan_tasks: List[Task] = sorted(tasks.in_swimlane(None), key=self._get_task_sort_key)
+
             # One header row per swimlane + one row per task
             total_rows = len(swimlanes) + len(tasks)
 
@@ -714,7 +722,7 @@ class TasksTab(BaseTab):
                     date_format = None if date_format_text == "Use Global" else date_format_text
             else:
                 # Get from existing Task object if available (look up by task_id)
-                existing_task = next((t for t in self.project_data.tasks if t.task_id == task_id), None)
+                existing_task = self.project_data.tasks.get(task_id)
                 if existing_task:
                     label_content = existing_task.label_content if hasattr(existing_task, 'label_content') and existing_task.label_content else "Name only"
                     label_placement = existing_task.label_placement
@@ -874,7 +882,7 @@ class TasksTab(BaseTab):
 
             # Update Valid column (calculate valid status)
             if valid_col is not None:
-                used_ids = {safe_int(t.task_id) for t in self.project_data.tasks if t.task_id != task.task_id}
+                used_ids = self.project_data.tasks.task_ids(exclude=task.task_id)
                 row_errors = self.project_data.validator.validate_task(
                     task, used_ids, self.app_config.general.ui_date_config
                 )
@@ -1260,8 +1268,8 @@ class TasksTab(BaseTab):
                 logging.error("_update_valid_column_only: Could not find ID column")
                 return
 
-            # Create a mapping of task_id to task for quick lookup
-            task_map = {safe_int(task.task_id): task for task in self.project_data.tasks}
+            # Tasks are looked up by task_id in the project's task store
+            tasks = self.project_data.tasks
 
             # Block signals to prevent recursive updates
             was_blocked = self.tasks_table.signalsBlocked()
@@ -1277,9 +1285,7 @@ class TasksTab(BaseTab):
                     pass
 
                 try:
-                    # Build used_ids set from all tasks for validation
-                    used_ids: Set[int] = {safe_int(task.task_id) for task in self.project_data.tasks}
-                    logging.debug(f"_update_valid_column_only: Found {len(used_ids)} tasks in project_data. Task IDs: {sorted(used_ids)}")
+                    logging.debug(f"_update_valid_column_only: Found {len(tasks)} tasks in project_data")
 
                     # For each table row, find the corresponding task by task_id
                     for row_idx in range(self.tasks_table.rowCount()):
@@ -1332,9 +1338,9 @@ class TasksTab(BaseTab):
                             continue
 
                         # Find the task in project_data by task_id
-                        task = task_map.get(task_id)
+                        task = tasks.get(task_id)
                         if not task:
-                            logging.warning(f"_update_valid_column_only: Row {row_idx}: Task with task_id={task_id} not found in project_data.tasks. Available task_ids: {sorted(task_map.keys())}")
+                            logging.warning(f"_update_valid_column_only: Row {row_idx}: Task with task_id={task_id} not found in project_data.tasks. Available task_ids: {sorted(tasks.task_ids())}")
                             # Set Valid to "No" - task not found
                             valid_status = "No"
                             item = self.tasks_table.item(row_idx, valid_col)
@@ -1348,7 +1354,7 @@ class TasksTab(BaseTab):
                             continue
 
                         # Calculate valid status (exclude current task from used_ids for uniqueness check)
-                        task_used_ids = used_ids - {safe_int(task.task_id)}
+                        task_used_ids = tasks.task_ids(exclude=safe_int(task.task_id))
                         row_errors = self.project_data.validator.validate_task(
                             task, task_used_ids, self.app_config.general.ui_date_config
                         )
@@ -1407,7 +1413,7 @@ class TasksTab(BaseTab):
         checked_rows = [row.row() for row in selected_rows]
         
         # Get all used task IDs from project_data
-        used_ids = {task.task_id for task in self.project_data.tasks}
+        used_ids = set(self.project_data.tasks.task_ids())
         
         # Also check IDs currently in the table
         id_col = self._get_column_index("ID")
@@ -1,7 +1,11 @@
 from typing import Union, Optional
 from datetime import datetime
+from functools import lru_cache
 from config.date_config import DateConfig
 
+# Distinct internal date strings kept by the shared parse cache (a chart rarely has more)
+INTERNAL_DATE_CACHE_SIZE = 8192
+
 def safe_int(value: Union[str, int, float, None], default: int = 0) -> int:
     """Safely convert a value to int, returning default if conversion fails."""
     if value is None:
@@ -131,13 +135,12 @@ def internal_to_display_date(internal_date: str, date_config: Optional[DateConfi
     if date_config is None:
         date_config = DateConfig()
     
-    try:
-        # Parse yyyy-mm-dd format (always ISO format for internal storage)
-        date_obj = datetime.strptime(internal_date.strip(), date_config.get_internal_format())
-        # Return in display format from config
-        return date_obj.strftime(date_config.get_python_format())
-    except ValueError:
+    # Parse yyyy-mm-dd format (always ISO format for internal storage)
+    date_obj = parse_internal_date(internal_date)
+    if date_obj is None:
         raise ValueError(f"Invalid date format. Expected yyyy-mm-dd, got: {internal_date}")
+    # Return in display format from config
+    return date_obj.strftime(date_config.get_python_format())
 
 def is_valid_display_date(date_str: str, date_config: Optional[DateConfig] = None) -> bool:
     """
@@ -169,20 +172,14 @@ def is_valid_internal_date(date_str: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not date_str or not date_str.strip():
-        return False
-    
-    try:
-        datetime.strptime(date_str.strip(), "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
+    return parse_internal_date(date_str) is not None
 
 def parse_internal_date(date_str: str) -> Optional[datetime]:
     """
     Safely parse an internal date string (yyyy-mm-dd format), returning None if invalid.
     
-    This is a centralized function to replace all hardcoded datetime.strptime(..., "%Y-%m-%d") calls.
+    This is the single parser for internal dates used by the models, validators, UI and chart
+    rendering. Results are memoized per string; see internal_date_cache_info().
     
     Args:
         date_str: Date string in yyyy-mm-dd format (internal format)
@@ -192,12 +189,32 @@ def parse_internal_date(date_str: str) -> Optional[datetime]:
     """
     if not date_str or not date_str.strip():
         return None
-    
+    return _parse_internal_date_cached(date_str)
+
+@lru_cache(maxsize=INTERNAL_DATE_CACHE_SIZE)
+def _parse_internal_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a non-blank internal date string. datetime is immutable, so results can be shared."""
+    value = date_str.strip()
+    # Fast path for canonical yyyy-mm-dd; anything else (e.g. 2025-1-5) goes through strptime
+    if (len(value) == 10 and value[4] == "-" and value[7] == "-" and value.isascii()
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+        try:
+            return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+        except ValueError:
+            return None
     try:
-        return datetime.strptime(date_str.strip(), "%Y-%m-%d")
+        return datetime.strptime(value, "%Y-%m-%d")
     except (ValueError, TypeError):
         return None
 
+def internal_date_cache_info():
+    """Return hit/miss statistics (hits, misses, maxsize, currsize) for the internal date parse cache."""
+    return _parse_internal_date_cached.cache_info()
+
+def clear_internal_date_cache():
+    """Empty the internal date parse cache and reset its statistics."""
+    _parse_internal_date_cached.cache_clear()
+
 def compare_internal_dates(date1_str: str, date2_str: str) -> Optional[bool]:
     """
     Compare two internal date strings (yyyy-mm-dd format).